@@ -0,0 +1,105 @@
+"""data/의 모든 월별 엑셀을 한 번에 다시 점수화해 이력(data/history/)에 적재
+
+    python backfill.py [--parts cpu,gpu] [--months 2025-04,2025-05] [--csv-dir out] [--workers 4]
+
+파일명에서 부품/월을 읽어 엑셀 하나당 워커 하나로 프로세스 풀에서 점수화하고,
+모든 워커가 끝난 뒤 결과를 한 번에 이력 저장소(와 --csv-dir)에 기록.
+가중치를 바꾼 뒤 1년치를 다시 계산해도 한 달 처리 시간과 비슷하게 끝남 (DB는 건드리지 않음).
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(ROOT)
+from common.workbooks import DATA_DIR, discover_workbooks
+
+# ─── 1. 대상 엑셀 ──────────────────────────────────────────────────
+def backfill_jobs(parts=("cpu", "gpu"), months=None, data_dir=DATA_DIR):
+    """[(부품, 월, 경로)], 같은 부품/월이 여러 개면 파일명 기준 마지막 버전만"""
+    latest = {}
+    for part, month, path in discover_workbooks(data_dir):
+        if part in parts and (months is None or month in months):
+            latest[part, month] = path
+    return [(part, month, path) for (part, month), path in sorted(latest.items())]
+
+# ─── 2. 워커: 엑셀 하나 점수화 ─────────────────────────────────────
+def score_workbook(part, month, path):
+    """엑셀 하나를 점수화해 (부품, 월, 이력 프레임, {CSV 파일명: 테이블}) 반환"""
+    from common.history import history_frame
+    from common.ingest import read_workbook
+
+    if part == "cpu":
+        from common.cpu_priority import CONFIG, HEADER_ROW, cpu_line_table, cpu_total_table, score_cpu
+        df = score_cpu(read_workbook(path, header=HEADER_ROW))
+        tables = {"CPU_성능_순위_가격포함.csv": cpu_total_table(df), "CPU_라인별_성능_순위.csv": cpu_line_table(df)}
+    else:
+        from common.gpu_priority import CONFIG, HEADER_ROW, gpu_line_table, gpu_total_table, score_gpu
+        df = score_gpu(read_workbook(path, header=HEADER_ROW))
+        tables = {"gpu_total_priority_price.csv": gpu_total_table(df), "gpu_line_priority.csv": gpu_line_table(df)}
+    return part, month, history_frame(df, CONFIG), tables
+
+# ─── 3. 일괄 적재 ──────────────────────────────────────────────────
+def write_results(results, csv_dir=None, history_dir=None):
+    """워커 결과를 이력 저장소(와 csv_dir/<월>/)에 한 번에 기록"""
+    from common.history import HISTORY_DIR, HistoryStore
+
+    try:
+        import pyarrow  # noqa: F401
+        store = HistoryStore(history_dir or HISTORY_DIR)
+    except ImportError:
+        print("⚠️ pyarrow가 없어 이력 저장을 건너뜀")
+        store = None
+
+    if store:
+        # 부품/월 파티션마다 run 파일 하나씩이지만, 같은 run 시각으로 한 번에 적재 (실패하면 아무것도 추가되지 않음)
+        store.append_many([(part, month, frame) for part, month, frame, _ in results])
+        print(f"📝 이력 적재 완료: {len(results)}개 (부품/월)")
+
+    if csv_dir:
+        for _, month, _, tables in results:
+            os.makedirs(os.path.join(csv_dir, month), exist_ok=True)
+            for filename, table in tables.items():
+                table.to_csv(os.path.join(csv_dir, month, filename), index=False, encoding="utf-8-sig")
+
+def backfill(parts=("cpu", "gpu"), months=None, csv_dir=None, workers=None, data_dir=DATA_DIR, history_dir=None):
+    """모든 대상 엑셀을 병렬로 점수화한 뒤 일괄 적재, 실패한 (부품, 월) 목록 반환 (대상 엑셀이 없으면 None)"""
+    jobs = backfill_jobs(parts, months, data_dir)
+    if not jobs:
+        print(f"❌ 처리할 엑셀이 없음: {data_dir} (부품: {', '.join(parts)}, 월: {', '.join(months) if months else '전체'})")
+        return None
+
+    results, failed = [], []
+    with ProcessPoolExecutor(max_workers=workers or min(len(jobs), os.cpu_count() or 1)) as pool:
+        futures = {pool.submit(score_workbook, *job): job for job in jobs}
+        for future in as_completed(futures):
+            part, month, path = futures[future]
+            try:
+                results.append(future.result())
+                print(f"✅ {part.upper()} {month}: {os.path.basename(path)}")
+            except Exception as e:
+                failed.append((part, month))
+                print(f"❌ {part.upper()} {month} 실패: {e}")
+
+    write_results(sorted(results, key=lambda r: (r[0], r[1])), csv_dir, history_dir)
+    return failed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="data/의 모든 월별 엑셀을 다시 점수화해 이력에 적재")
+    parser.add_argument("--parts", default="cpu,gpu", help="대상 부품 (쉼표 구분, 기본: cpu,gpu)")
+    parser.add_argument("--months", help="대상 월만 (쉼표 구분, 예: 2025-04,2025-05, 생략 시 전체)")
+    parser.add_argument("--csv-dir", help="월별 결과 CSV를 <폴더>/<월>/에 저장")
+    parser.add_argument("--workers", type=int, help="워커 프로세스 수 (기본: 엑셀 수와 CPU 수 중 작은 값)")
+    args = parser.parse_args(argv)
+
+    parts = [p.strip() for p in args.parts.split(",") if p.strip()]
+    months = [m.strip() for m in args.months.split(",") if m.strip()] if args.months else None
+    start = time.perf_counter()
+    failed = backfill(parts, months, args.csv_dir, args.workers)
+    print(f"⏱️ 전체 소요 시간: {time.perf_counter() - start:.1f}초")
+    return 1 if failed is None or failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,5 @@
+"""점수 계산 / 매칭 / DB 적재 벤치마크 (asv 형식, 합성 데이터 1× / 10× / 100×)
+
+    asv run                      # 커밋별 결과 추적 (asv.conf.json)
+    python -m benchmarks -k ...  # asv 없이 빠르게 실행
+"""
@@ -0,0 +1,129 @@
+"""asv 없이 벤치마크 실행 (빠른 확인 / CI용)
+
+    python -m benchmarks [-k Matching] [--scales 1,10] [--json out.json] [--compare base.json]
+
+asv와 같은 규칙(params / setup / teardown / time_* / track_*)으로 bench_*.py를 찾아 실행하고,
+--compare를 주면 이전 --json 결과보다 --factor배 이상 느려진 항목이 있을 때 종료 코드 1.
+"""
+import argparse
+import importlib
+import itertools
+import json
+import os
+import pkgutil
+import subprocess
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# ─── 1. 벤치마크 찾기 ──────────────────────────────────────────────
+def discover(pattern=None):
+    """[(이름, 클래스, 메서드명)], 이름은 '모듈.클래스.메서드'"""
+    found = []
+    for module_info in pkgutil.iter_modules([os.path.dirname(os.path.abspath(__file__))]):
+        if not module_info.name.startswith("bench_"):
+            continue
+        module = importlib.import_module(f"benchmarks.{module_info.name}")
+        for cls_name, cls in vars(module).items():
+            if not isinstance(cls, type) or cls.__module__ != module.__name__:
+                continue
+            for method in sorted(vars(cls)):
+                name = f"{module_info.name}.{cls_name}.{method}"
+                if method.startswith(("time_", "track_")) and (not pattern or pattern in name):
+                    found.append((name, cls, method))
+    return found
+
+def param_grid(cls, scales=None):
+    """params 조합 목록 (scales를 주면 scale 파라미터는 그 값만)"""
+    params = getattr(cls, "params", [])
+    names = getattr(cls, "param_names", [])
+    if not params:
+        return [()]
+    if not isinstance(params[0], (list, tuple)):
+        params = [params]
+    if scales is not None and "scale" in names:
+        params = [p if n != "scale" else [v for v in p if v in scales] for n, p in zip(names, params)]
+    return list(itertools.product(*params))
+
+# ─── 2. 실행 ───────────────────────────────────────────────────────
+def run_one(cls, method, args, repeat):
+    """time_*는 가장 빠른 1회 소요 시간(초), track_*는 반환값"""
+    bench = cls()
+    if hasattr(bench, "setup"):
+        bench.setup(*args)
+    try:
+        func = getattr(bench, method)
+        if method.startswith("track_"):
+            return func(*args)
+        timer = timeit.Timer(lambda: func(*args))
+        number, _ = timer.autorange()
+        return min(timer.repeat(repeat=repeat, number=number)) / number
+    finally:
+        if hasattr(bench, "teardown"):
+            bench.teardown(*args)
+
+def format_value(name, value):
+    if ".time_" not in name:
+        return str(value)
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("μs", 1e-6)):
+        if value >= scale:
+            return f"{value / scale:.3f}{unit}"
+    return f"{value / 1e-9:.0f}ns"
+
+def current_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+    except OSError:
+        return ""
+
+# ─── 3. 이전 결과와 비교 ───────────────────────────────────────────
+def compare(results, baseline, factor):
+    """factor배 이상 느려진 time_* 항목 [(키, 이전, 현재)]"""
+    return [
+        (key, baseline[key], value) for key, value in results.items()
+        if ".time_" in key and key in baseline and value > baseline[key] * factor
+    ]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="점수 계산 / 매칭 / DB 적재 벤치마크 (asv 없이)")
+    parser.add_argument("-k", dest="pattern", help="이름에 이 문자열이 들어간 벤치마크만 (예: Matching)")
+    parser.add_argument("--scales", help="scale 파라미터 (쉼표 구분, 기본: 1,10,100)")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (가장 빠른 값 사용)")
+    parser.add_argument("--json", help="결과를 JSON으로 저장 (--compare 기준으로 사용)")
+    parser.add_argument("--compare", help="이전 --json 결과와 비교")
+    parser.add_argument("--factor", type=float, default=1.2, help="이 배수 이상 느려지면 회귀로 판단 (기본: 1.2)")
+    args = parser.parse_args(argv)
+
+    scales = [int(s) for s in args.scales.split(",") if s.strip()] if args.scales else None
+    results = {}
+    for name, cls, method in discover(args.pattern):
+        for params in param_grid(cls, scales):
+            key = f"{name}({', '.join(map(str, params))})"
+            try:
+                results[key] = run_one(cls, method, params, args.repeat)
+                print(f"{key:<70} {format_value(key, results[key]):>12}")
+            except NotImplementedError:
+                pass
+            except Exception as e:
+                print(f"❌ {key} 실패: {e}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"commit": current_commit(), "results": results}, f, ensure_ascii=False, indent=2)
+        print(f"📝 결과 저장: {args.json}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline["results"], args.factor)
+        for key, before, after in regressions:
+            print(f"⚠️ {key}: {format_value(key, before)} → {format_value(key, after)} ({after / before:.2f}배)")
+        if regressions:
+            return 1
+        print(f"✅ {baseline.get('commit') or args.compare} 대비 {args.factor}배 이상 느려진 항목 없음")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
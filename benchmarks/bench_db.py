@@ -0,0 +1,47 @@
+"""DB 적재 경로 (SQLite 메모리 DB에서 bulk_update / reload_table, 증분 모드의 스냅샷 비교)"""
+import sqlite3
+
+from benchmarks.synthetic import SCALES, gpu_workbook
+from common.db import bulk_update, frame_rows, reload_table
+from common.gpu_priority import score_gpu
+from common.schema import fill_missing_ranks
+from common.snapshot import diff_rows, row_hashes
+
+TABLE = "gpu_bench"
+COLUMNS = ["라인", "종합_성능점수", "종합_성능_순위", "순수_성능점수", "순수_성능_순위"]
+CREATE_QUERY = f"""
+CREATE TABLE IF NOT EXISTS {TABLE} (
+    `GPU명` VARCHAR(255) PRIMARY KEY,
+    `라인` VARCHAR(50),
+    `종합_성능점수` DOUBLE,
+    `종합_성능_순위` INT,
+    `순수_성능점수` DOUBLE,
+    `순수_성능_순위` INT
+)
+"""
+
+class BulkWrite:
+    params = SCALES
+    param_names = ["scale"]
+
+    def setup(self, scale):
+        self.scored = fill_missing_ranks(score_gpu(gpu_workbook(scale)), ["종합_성능_순위", "순수_성능_순위"])
+        self.rows = frame_rows(self.scored, ["GPU명", *COLUMNS])
+        self.hashes = row_hashes(self.rows)
+        self.connection = sqlite3.connect(":memory:")
+        reload_table(self.connection, TABLE, CREATE_QUERY, ["GPU명", *COLUMNS], self.rows)
+
+    def teardown(self, scale):
+        self.connection.close()
+
+    def time_frame_rows(self, scale):
+        frame_rows(self.scored, ["GPU명", *COLUMNS])
+
+    def time_bulk_update(self, scale):
+        bulk_update(self.connection, TABLE, "GPU명", COLUMNS, self.rows)
+
+    def time_reload_table(self, scale):
+        reload_table(self.connection, TABLE, CREATE_QUERY, ["GPU명", *COLUMNS], self.rows)
+
+    def time_snapshot_diff(self, scale):
+        diff_rows(self.rows, self.hashes)
@@ -0,0 +1,97 @@
+"""모델명 정규화 / 카탈로그 인덱스 / 엑셀 ↔ video-card.json 매칭 (match_variants_detailed)"""
+import shutil
+import tempfile
+
+import pandas as pd
+
+from benchmarks.synthetic import SCALES, cpu_workbook, gpu_workbook, video_card_catalog, write_catalog
+from common.catalog import GpuRecord, build_index, load_catalog_index, load_gpu_catalog
+from common.fuzzy import TrigramIndex
+from common.normalizer import _normalize_gpu, normalize_series
+from db_restore.gpu.gpu import create_variants, is_excludable_model, match_variants_detailed
+
+def _catalog_dir(scale):
+    """카탈로그 JSON을 쓴 임시 폴더 (teardown에서 삭제)"""
+    directory = tempfile.mkdtemp(prefix="bench-catalog-")
+    return directory, write_catalog(video_card_catalog(scale), directory)
+
+# ─── 1. 모델명 정규화 ──────────────────────────────────────────────
+class NameNormalization:
+    params = SCALES
+    param_names = ["scale"]
+
+    def setup(self, scale):
+        self.cpu = pd.Series(cpu_workbook(scale).iloc[:, 0])
+        self.gpu = pd.Series(gpu_workbook(scale).iloc[:, 0])
+
+    def time_normalize_series_cpu(self, scale):
+        normalize_series(self.cpu, "cpu")
+
+    def time_normalize_series_gpu(self, scale):
+        normalize_series(self.gpu, "gpu")
+
+    def time_normalize_series_gpu_key(self, scale):
+        normalize_series(self.gpu, "gpu_key")
+
+    def time_create_variants(self, scale):
+        # 이름 단위 정규화는 lru_cache를 쓰므로 매번 비워서 월별 실행(첫 호출)과 같은 조건으로
+        _normalize_gpu.cache_clear()
+        create_variants(self.gpu.to_frame("GPU명"), "GPU명")
+
+# ─── 2. 카탈로그 인덱스 ────────────────────────────────────────────
+class CatalogIndex:
+    params = SCALES
+    param_names = ["scale"]
+    timeout = 300
+
+    def setup(self, scale):
+        self.directory, self.path = _catalog_dir(scale)
+        self.models = load_gpu_catalog(self.path, is_excludable_model)
+        load_catalog_index(self.path, "gpu", is_excludable_model, cache_dir=self.directory)
+
+    def teardown(self, scale):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def time_parse_catalog(self, scale):
+        load_gpu_catalog(self.path, is_excludable_model)
+
+    def time_build_index(self, scale):
+        build_index(self.models, GpuRecord)
+
+    def time_load_index(self, scale):
+        load_catalog_index(self.path, "gpu", is_excludable_model, cache_dir=self.directory)
+
+    def time_trigram_index(self, scale):
+        TrigramIndex(self.models)
+
+# ─── 3. 매칭 ───────────────────────────────────────────────────────
+class Matching:
+    params = SCALES
+    param_names = ["scale"]
+    timeout = 300
+
+    def setup(self, scale):
+        # 같은 seed의 엑셀과 카탈로그는 같은 모델 목록에서 이름을 뽑음
+        self.directory, path = _catalog_dir(scale)
+        self.catalog = load_catalog_index(path, "gpu", is_excludable_model, cache_dir=self.directory)
+        self.fuzzy_index = TrigramIndex(self.catalog)
+        # API 목록 대신 카탈로그 정규화명 3개 중 1개 (네트워크 없이)
+        self.api_models = {key for i, key in enumerate(self.catalog) if i % 3 == 0}
+        workbook = gpu_workbook(scale)
+        self.variants, _ = create_variants(workbook, workbook.columns[0])
+
+    def teardown(self, scale):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def time_match_variants_detailed(self, scale):
+        match_variants_detailed(self.variants, self.catalog, self.api_models, self.fuzzy_index)
+
+    def time_match_variants_exact_only(self, scale):
+        match_variants_detailed(self.variants, self.catalog, self.api_models)
+
+    def track_fuzzy_matches(self, scale):
+        matched_json, _, _ = match_variants_detailed(self.variants, self.catalog, self.api_models, self.fuzzy_index)
+        return sum(m["match_type"] == "JSON_FUZZY" for m in matched_json)
+
+    def track_unmatched(self, scale):
+        return len(match_variants_detailed(self.variants, self.catalog, self.api_models, self.fuzzy_index)[2])
@@ -0,0 +1,107 @@
+"""점수 계산 경로: 라인 분류 → 정규화 → 점수 → 순위 → 전체 파이프라인 (score_cpu / score_gpu)"""
+
+from benchmarks.synthetic import GPU_ROWS, SCALES, cpu_workbook, feature_matrix, gpu_workbook, line_labels
+from common.cpu_priority import CONFIG as CPU_CONFIG, cpu_line_table, cpu_total_table, score_cpu
+from common.gpu_priority import CONFIG as GPU_CONFIG, gpu_line_table, gpu_total_table, score_gpu
+from common.lines import apply_tiers, assign_lines
+from common.pareto import pareto_depth_by_line
+from common.scalers import SCALERS, make_scaler
+from common.scoring import compute_profile_scores, line_codes, rank_desc, score_profiles
+
+def _named(df, config):
+    return df.rename(columns={df.columns[i]: name for i, name in config.columns.items()})
+
+# ─── 1. 라인 분류 ──────────────────────────────────────────────────
+class LineLabeling:
+    params = SCALES
+    param_names = ["scale"]
+
+    def setup(self, scale):
+        self.cpu = _named(cpu_workbook(scale), CPU_CONFIG)
+        self.gpu = _named(gpu_workbook(scale), GPU_CONFIG)
+        self.cpu["라인"] = assign_lines(self.cpu, CPU_CONFIG.name_column, CPU_CONFIG.line_value_column, CPU_CONFIG.lines)
+
+    def time_assign_lines_cpu(self, scale):
+        assign_lines(self.cpu, CPU_CONFIG.name_column, CPU_CONFIG.line_value_column, CPU_CONFIG.lines)
+
+    def time_assign_lines_gpu(self, scale):
+        assign_lines(self.gpu, GPU_CONFIG.name_column, GPU_CONFIG.line_value_column, GPU_CONFIG.lines)
+
+    def time_apply_tiers_cpu(self, scale):
+        apply_tiers(self.cpu, CPU_CONFIG.tiers, CPU_CONFIG.lines)
+
+# ─── 2. 정규화 ─────────────────────────────────────────────────────
+class Normalization:
+    params = [SCALES, sorted(SCALERS)]
+    param_names = ["scale", "scaler"]
+
+    def setup(self, scale, scaler):
+        self.values = feature_matrix(GPU_ROWS * scale, len(GPU_CONFIG.features))
+
+    def time_fit_transform(self, scale, scaler):
+        make_scaler(scaler).fit_transform(self.values)
+
+# ─── 3. 점수 / 순위 ────────────────────────────────────────────────
+class Scoring:
+    params = SCALES
+    param_names = ["scale"]
+
+    def setup(self, scale):
+        rows = GPU_ROWS * scale
+        self.values = feature_matrix(rows, len(GPU_CONFIG.score_columns))
+        self.lines = line_labels(rows, GPU_CONFIG.lines)
+        self.scores, _ = compute_profile_scores(self.values, GPU_CONFIG.weights, GPU_CONFIG.min_weight)
+        self.groups = line_codes(self.lines)
+
+    def time_compute_profile_scores(self, scale):
+        compute_profile_scores(self.values, GPU_CONFIG.weights, GPU_CONFIG.min_weight, renormalize=True)
+
+    def time_compute_profile_scores_strict(self, scale):
+        compute_profile_scores(self.values, GPU_CONFIG.weights, GPU_CONFIG.min_weight, renormalize=False)
+
+    def time_rank_desc(self, scale):
+        rank_desc(self.scores, na_option="bottom")
+
+    def time_rank_desc_by_line(self, scale):
+        rank_desc(self.scores, groups=self.groups)
+
+    def time_score_profiles(self, scale):
+        score_profiles(self.values, GPU_CONFIG.weights, lines=self.lines, min_weight=GPU_CONFIG.min_weight)
+
+class Pareto:
+    params = SCALES
+    param_names = ["scale"]
+
+    def setup(self, scale):
+        self.scored = score_gpu(gpu_workbook(scale))
+
+    def time_pareto_depth_by_line(self, scale):
+        pareto_depth_by_line(self.scored, GPU_CONFIG.pareto_benefit, GPU_CONFIG.pareto_cost)
+
+# ─── 4. 전체 파이프라인 (엑셀 → 점수 테이블) ───────────────────────
+class ScorePipeline:
+    params = SCALES
+    param_names = ["scale"]
+
+    def setup(self, scale):
+        self.cpu = cpu_workbook(scale)
+        self.gpu = gpu_workbook(scale)
+        self.cpu_scored = score_cpu(self.cpu)
+        self.gpu_scored = score_gpu(self.gpu)
+
+    def time_score_cpu(self, scale):
+        score_cpu(self.cpu)
+
+    def time_score_gpu(self, scale):
+        score_gpu(self.gpu)
+
+    def time_cpu_tables(self, scale):
+        cpu_total_table(self.cpu_scored)
+        cpu_line_table(self.cpu_scored)
+
+    def time_gpu_tables(self, scale):
+        gpu_total_table(self.gpu_scored)
+        gpu_line_table(self.gpu_scored)
+
+    def peakmem_score_gpu(self, scale):
+        score_gpu(self.gpu)
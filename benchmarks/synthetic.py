@@ -0,0 +1,146 @@
+"""벤치마크용 합성 데이터 (data/*.xlsx, video-card.json과 같은 모양을 scale배 크기로 생성)
+
+실제 파일 없이도 같은 코드 경로를 타도록
+- 엑셀: read_workbook(header=...) 결과와 같은 열 위치, 라인 블록 아래에 '<라인> 라인↑' 헤더 행
+- 카탈로그: video-card.json과 같은 필드, 워크스테이션 모델(제외 대상)과 VRAM 표기 섞음
+seed가 같으면 항상 같은 데이터 (커밋 간 비교용).
+"""
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from common.cpu_priority import CONFIG as CPU_CONFIG
+from common.gpu_priority import CONFIG as GPU_CONFIG
+
+SCALES = [1, 10, 100]
+
+# 1× = 실제 월별 엑셀 / 카탈로그 크기 정도
+CPU_ROWS = 200
+GPU_ROWS = 120
+CATALOG_ROWS = 6000
+
+GPU_FAMILIES = [("지포스 RTX", "GeForce RTX"), ("라데온 RX", "Radeon RX"), ("아크 B", "Arc B")]
+GPU_SUFFIXES = ["", " Ti", " SUPER", " Ti SUPER", " XT", " XTX"]
+WORKSTATION_PREFIXES = ["Quadro RTX", "Radeon Pro W", "RTX A"]
+
+# ─── 1. 모델명 ─────────────────────────────────────────────────────
+def gpu_models(count, seed=0):
+    """[(엑셀 한글명, 카탈로그 칩셋명)] 중복 없이 count개"""
+    rng = np.random.default_rng(seed)
+    models, seen = [], set()
+    while len(models) < count:
+        kr, en = GPU_FAMILIES[rng.integers(len(GPU_FAMILIES))]
+        number = int(rng.integers(100, 100_000))
+        suffix = GPU_SUFFIXES[rng.integers(len(GPU_SUFFIXES))]
+        if (en, number, suffix) not in seen:
+            seen.add((en, number, suffix))
+            models.append((f"{kr} {number}{suffix}", f"{en} {number}{suffix}"))
+    return models
+
+def cpu_names(count, seed=0):
+    rng = np.random.default_rng(seed)
+    names = []
+    for _ in range(count):
+        if rng.random() < 0.5:
+            names.append(f"라이젠{rng.choice([3, 5, 7, 9])} {rng.integers(1000, 10_000)}{rng.choice(['', 'X', 'X3D', 'G'])}")
+        else:
+            names.append(f"코어i{rng.choice([3, 5, 7, 9])} {rng.integers(10_000, 100_000)}{rng.choice(['', 'K', 'F', 'KF'])}")
+    return names
+
+# ─── 2. 엑셀 모양 DataFrame ────────────────────────────────────────
+def _workbook(config, names, fill_row, rng, extra_columns=()):
+    """라인마다 SKU 블록 + 블록 아래 헤더 행, 열 위치는 config.columns 기준"""
+    width = max([*config.columns, *extra_columns]) + 1
+    rows = []
+    for line, block in zip(config.lines, np.array_split(np.asarray(names, dtype=object), len(config.lines))):
+        for name in block:
+            row = [np.nan] * width
+            row[0] = name
+            fill_row(row, rng)
+            rows.append(row)
+        header = [np.nan] * width
+        header[0] = f"{line} 라인↑"
+        rows.append(header)
+    return pd.DataFrame(rows, columns=[f"열{i}" for i in range(width)])
+
+def _price(rng, base, missing):
+    return np.nan if rng.random() < missing else int(base * rng.uniform(0.5, 8) // 10 * 10)
+
+def cpu_workbook(scale=1, seed=0):
+    """CPU 가성비 엑셀(header=3)을 읽은 것과 같은 모양"""
+    rng = np.random.default_rng(seed)
+
+    def fill(row, rng):
+        row[1:5] = rng.uniform(0.3, 1.3, 4).tolist()      # 게임성능 (4090 / 5070 / 4060Ti / 3050)
+        row[5], row[6] = rng.uniform(0.4, 1.2), rng.uniform(0.2, 1.8)  # 시네벤치 싱글 / 멀티
+        row[8] = _price(rng, 100_000, 0.2)
+        row[13] = np.nan if np.isnan(row[8]) else f"{row[8] / rng.uniform(80, 130):,.2f}"
+
+    return _workbook(CPU_CONFIG, cpu_names(CPU_ROWS * scale, seed), fill, rng)
+
+def gpu_workbook(scale=1, seed=0):
+    """그래픽카드 가성비 엑셀(header=2)을 읽은 것과 같은 모양, 가격은 '1,234,000원' 형식 (일부 결측)"""
+    rng = np.random.default_rng(seed)
+    models = gpu_models(GPU_ROWS * scale, seed)
+
+    def fill(row, rng):
+        row[1:4] = sorted(rng.uniform(0.2, 2.3, 3), reverse=True)  # 게임성능 FHD / QHD / UHD
+        row[4:8] = rng.uniform(1_000, 40_000, 4).round().tolist()  # 파스 / 타스 / 스노 / 블렌더
+        row[8:11] = rng.uniform(20, 300, 3).round(1).tolist()      # FPS FHD / QHD / UHD
+        for i in rng.choice(range(2, 11), int(rng.integers(0, 4)), replace=False):
+            row[i] = np.nan                                        # 일부 벤치마크 없음
+        price = _price(rng, 300_000, 0.3)
+        row[GPU_CONFIG.price_column] = np.nan if np.isnan(price) else f"{price:,}원"
+        row[14] = np.nan if np.isnan(price) else price / row[1] / 100
+
+    names = [kr + str(rng.choice(["", "", " 8GB", " 16GB", " GDDR6"])) for kr, _ in models]
+    return _workbook(GPU_CONFIG, names, fill, rng, extra_columns=[GPU_CONFIG.price_column])
+
+# ─── 3. 카탈로그 (video-card.json) ─────────────────────────────────
+def video_card_catalog(scale=1, seed=0):
+    """video-card.json 항목 리스트, 칩셋은 같은 seed의 gpu_workbook 모델에서 뽑음 (일부는 VRAM 표기 / 워크스테이션)"""
+    rng = np.random.default_rng(seed + 1)
+    models = gpu_models(GPU_ROWS * scale, seed)
+    items = []
+    for i in range(CATALOG_ROWS * scale):
+        memory = int(rng.choice([4, 6, 8, 12, 16, 24]))
+        roll = rng.random()
+        if roll < 0.05:
+            chipset = f"{WORKSTATION_PREFIXES[i % len(WORKSTATION_PREFIXES)]} {rng.integers(1000, 10_000)}"
+        else:
+            chipset = models[rng.integers(len(models))][1] + (f" {memory}GB" if roll < 0.3 else "")
+        items.append({
+            "name": f"Brand {i} {chipset} OC",
+            "price": None if rng.random() < 0.3 else round(float(rng.uniform(100, 2000)), 2),
+            "chipset": chipset,
+            "memory": memory,
+            "core_clock": int(rng.integers(1000, 2600)),
+            "boost_clock": None if rng.random() < 0.1 else int(rng.integers(1500, 3000)),
+            "color": rng.choice(["Black", "White", "Silver"]).item(),
+            "length": None if rng.random() < 0.1 else int(rng.integers(150, 360)),
+        })
+    return items
+
+def write_catalog(items, directory, filename="video-card.json"):
+    """카탈로그를 JSON 배열 파일로 저장하고 경로 반환"""
+    path = os.path.join(directory, filename)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(items, f, ensure_ascii=False)
+    return path
+
+# ─── 4. 점수 계산 입력 행렬 ────────────────────────────────────────
+def feature_matrix(rows, features, seed=0, missing=0.05):
+    """(SKU × 특성) 0~1 값, missing 비율만큼 NaN"""
+    rng = np.random.default_rng(seed)
+    values = rng.random((rows, features))
+    values[rng.random(values.shape) < missing] = np.nan
+    return values
+
+def line_labels(rows, lines, seed=0, missing=0.05):
+    """SKU별 라인명 (missing 비율만큼 결측)"""
+    rng = np.random.default_rng(seed)
+    labels = np.asarray(lines, dtype=object)[rng.integers(len(lines), size=rows)]
+    labels[rng.random(rows) < missing] = None
+    return labels
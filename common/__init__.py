@@ -0,0 +1 @@
+"""CPU/GPU 성능 순위 스크립트들이 공유하는 모듈."""
@@ -0,0 +1,273 @@
+import hashlib
+import json
+import os
+import re
+import types
+from collections.abc import Mapping
+
+import numpy as np
+
+from common.ingest import CACHE_DIR, file_hash
+from common import normalizer
+from common.normalizer import normalize_cpu_model, normalize_model_name
+
+CHUNK_SIZE = 1 << 16
+
+# ─── 1. JSON 배열 / NDJSON 스트리밍 ────────────────────────────────
+def _iter_ndjson(f):
+    for line in f:
+        if line.strip():
+            yield json.loads(line)
+
+WHITESPACE = " \t\r\n"
+DELIMITERS = WHITESPACE + ",]"
+
+def _iter_array(f, chunk_size):
+    """최상위 JSON 배열의 원소를 하나씩 파싱 (버퍼는 chunk_size 정도만 유지)"""
+    decoder = json.JSONDecoder()
+    buf, pos, eof = "", 0, False
+
+    def fill():
+        """읽은 부분(pos 앞)을 버리고 다음 청크를 붙임"""
+        nonlocal buf, pos, eof
+        chunk = f.read(chunk_size)
+        eof = not chunk
+        buf, pos = buf[pos:] + chunk, 0
+
+    def skip(chars):
+        """chars를 건너뛰고 다음 문자가 있으면 True, 입력이 끝났으면 False"""
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in chars:
+                pos += 1
+            if pos < len(buf):
+                return True
+            if eof:
+                return False
+            fill()
+
+    def next_token():
+        if not skip(WHITESPACE):
+            raise ValueError("JSON 배열이 닫히지 않았습니다")
+        return buf[pos]
+
+    if not skip(WHITESPACE) or buf[pos] != "[":
+        raise ValueError("JSON 배열이 아닙니다")
+    pos += 1
+    if next_token() == "]":
+        return
+
+    while True:
+        try:
+            item, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            fill()
+            continue
+        # 값 바로 뒤가 버퍼 끝이거나 구분자가 아니면 청크 경계에서 잘린 값일 수 있음 ('2.' + '5e3') → 더 읽고 다시 파싱
+        if not eof and (end == len(buf) or buf[end] not in DELIMITERS):
+            fill()
+            continue
+        yield item
+
+        pos = end
+        token = buf[pos] if pos < len(buf) and buf[pos] in ",]" else next_token()
+        if token == "]":
+            return
+        if token != ",":
+            raise json.JSONDecodeError("배열 원소 사이에 ',' 또는 ']'가 필요합니다", buf, pos)
+        pos += 1
+        if pos > chunk_size:
+            buf, pos = buf[pos:], 0
+        next_token()
+
+def iter_catalog(path, chunk_size=CHUNK_SIZE):
+    """카탈로그 JSON(배열 또는 NDJSON)의 항목을 하나씩 반환 (ijson이 있으면 ijson 사용)"""
+    with open(path, "r", encoding="utf-8") as f:
+        head = f.read(1024).lstrip()
+        f.seek(0)
+        if not head.startswith("["):
+            yield from _iter_ndjson(f)
+            return
+
+        try:
+            import ijson
+        except ImportError:
+            yield from _iter_array(f, chunk_size)
+            return
+
+    with open(path, "rb") as f:
+        yield from ijson.items(f, "item", use_float=True)
+
+# ─── 2. 저장할 필드만 담는 레코드 ──────────────────────────────────
+class _Record:
+    """__slots__ 레코드 (기존 코드의 dict 접근 details['x'], details.get('x')를 그대로 지원)"""
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    @classmethod
+    def from_fields(cls, fields):
+        record = cls.__new__(cls)
+        for key, value in fields.items():
+            setattr(record, key, value)
+        return record
+
+    def to_dict(self):
+        return {key: getattr(self, key) for key in self.__slots__}
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()})"
+
+class CpuRecord(_Record):
+    __slots__ = ("model", "normalized_model", "cores", "threads", "base_clock", "boost_clock",
+                 "tdp", "graphics", "smt", "price")
+
+    def __init__(self, item, model, normalized):
+        cores = item.get("core_count")
+        self.model = model
+        self.normalized_model = normalized
+        self.cores = cores
+        self.threads = cores * 2 if item.get("smt") and cores is not None else cores
+        self.base_clock = item.get("core_clock")
+        self.boost_clock = item.get("boost_clock")
+        self.tdp = item.get("tdp")
+        self.graphics = item.get("graphics")
+        self.smt = item.get("smt")
+        self.price = item.get("price")
+
+class GpuRecord(_Record):
+    __slots__ = ("original_chipset", "normalized_chipset", "memory", "core_clock", "boost_clock", "length")
+
+    def __init__(self, item, chipset, normalized):
+        self.original_chipset = chipset
+        self.normalized_chipset = normalized
+        self.memory = item.get("memory")
+        self.core_clock = item.get("core_clock")
+        self.boost_clock = item.get("boost_clock")
+        self.length = item.get("length")
+
+# ─── 3. 카탈로그 로드 (파싱하면서 제외/정규화) ───────────────────────
+def load_cpu_catalog(path, exclude=None):
+    """cpu.json → {정규화명: CpuRecord}, exclude(모델명)가 True인 항목은 버림"""
+    models = {}
+    for item in iter_catalog(path):
+        model = (item.get("name") or "").strip()
+        if model and not (exclude and exclude(model)):
+            normalized = normalize_cpu_model(model)
+            models[normalized] = CpuRecord(item, model, normalized)
+    return models
+
+def load_gpu_catalog(path, exclude=None):
+    """video-card.json → {정규화 칩셋명: GpuRecord}, exclude(칩셋명)가 True인 항목은 버림"""
+    models = {}
+    for item in iter_catalog(path):
+        chipset = (item.get("chipset") or "").strip()
+        if chipset and not (exclude and exclude(chipset)):
+            normalized = normalize_model_name(chipset)
+            models[normalized] = GpuRecord(item, chipset, normalized)
+    return models
+
+# ─── 4. 미리 만든 인덱스 (.npy, 메모리 맵) ───────────────────────────
+# 인덱스 파일 형식이 바뀌면 올려서 기존 인덱스를 무효화 (정규화/제외 규칙 변경은 rules_spec으로 자동 반영)
+INDEX_VERSION = 1
+CATALOGS = {"cpu": (load_cpu_catalog, CpuRecord), "gpu": (load_gpu_catalog, GpuRecord)}
+
+def _code_spec(code):
+    """함수 본문 바이트코드 + 상수 (중첩 함수/제너레이터도 재귀, 줄 번호/주소는 제외)"""
+    consts = [
+        _code_spec(c) if isinstance(c, types.CodeType) else repr(sorted(c)) if isinstance(c, frozenset) else repr(c)
+        for c in code.co_consts
+    ]
+    return f"{code.co_code.hex()}:{consts}:{code.co_names}"
+
+def rules_spec(exclude=None):
+    """제외 함수 본문 + normalizer 모듈의 정규식(패턴/플래그), 변환표, 정규화 함수 본문"""
+    parts = [_code_spec(exclude.__code__) if exclude and hasattr(exclude, "__code__") else getattr(exclude, "__qualname__", "")]
+    for name, value in sorted(vars(normalizer).items()):
+        if isinstance(value, re.Pattern):
+            parts.append(f"{name}={value.pattern!r}/{value.flags}")
+        elif name.isupper() and isinstance(value, dict) and all(isinstance(v, str) for v in value.values()):
+            parts.append(f"{name}={sorted(value.items())!r}")
+        elif isinstance(getattr(value, "__wrapped__", value), types.FunctionType) and value.__module__ == normalizer.__name__:
+            parts.append(f"{name}={_code_spec(getattr(value, '__wrapped__', value).__code__)}")
+    return "|".join(parts)
+
+def index_path(path, kind, exclude=None, cache_dir=CACHE_DIR):
+    """카탈로그 내용(sha256) + 레코드 형식 + 제외/정규화 규칙이 같으면 같은 인덱스 파일"""
+    record_cls = CATALOGS[kind][1]
+    spec = hashlib.sha1(f"{INDEX_VERSION}|{'|'.join(record_cls.__slots__)}|{rules_spec(exclude)}".encode()).hexdigest()[:8]
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(cache_dir, f"{stem}-{kind}-idx{spec}-{file_hash(path)[:16]}.npy")
+
+def build_index(models, record_cls):
+    """{정규화명: 레코드} → 정규화명 순으로 정렬된 구조체 배열 (필드 값은 JSON 문자열로 타입까지 보존)"""
+    keys = sorted(models)
+    columns = {"key": keys}
+    for field in record_cls.__slots__:
+        columns[field] = [json.dumps(models[k].get(field), ensure_ascii=False) for k in keys]
+    dtype = [(name, f"<U{max((len(v) for v in values), default=1) or 1}") for name, values in columns.items()]
+    table = np.empty(len(keys), dtype=dtype)
+    for name, values in columns.items():
+        table[name] = values
+    return table
+
+class CatalogIndex(Mapping):
+    """정규화명 → 레코드 dict처럼 쓰는 읽기 전용 인덱스 (이진 탐색, 레코드는 조회할 때 생성)"""
+
+    def __init__(self, table, record_cls):
+        self.table = table
+        self.record_cls = record_cls
+        self.keys_array = table["key"]
+
+    def _position(self, key):
+        if not isinstance(key, str):
+            return None
+        i = int(np.searchsorted(self.keys_array, key))
+        return i if i < len(self.keys_array) and self.keys_array[i] == key else None
+
+    def __contains__(self, key):
+        return self._position(key) is not None
+
+    def __getitem__(self, key):
+        i = self._position(key)
+        if i is None:
+            raise KeyError(key)
+        row = self.table[i]
+        return self.record_cls.from_fields({f: json.loads(row[f]) for f in self.record_cls.__slots__})
+
+    def __iter__(self):
+        return (str(k) for k in self.keys_array)
+
+    def __len__(self):
+        return len(self.keys_array)
+
+def load_catalog_index(path, kind, exclude=None, cache_dir=CACHE_DIR):
+    """카탈로그 인덱스를 메모리 맵으로 로드, 없거나 JSON이 바뀌었으면 한 번 스트리밍 파싱해서 생성"""
+    loader, record_cls = CATALOGS[kind]
+    cached = index_path(path, kind, exclude, cache_dir)
+    if not os.path.exists(cached):
+        table = build_index(loader(path, exclude), record_cls)
+        os.makedirs(cache_dir, exist_ok=True)
+        _remove_stale_index(cached)
+        tmp = cached + ".tmp"
+        with open(tmp, "wb") as f:
+            np.save(f, table)
+        os.replace(tmp, cached)
+    return CatalogIndex(np.load(cached, mmap_mode="r"), record_cls)
+
+def _remove_stale_index(cached):
+    """같은 카탈로그의 이전 버전 인덱스 삭제"""
+    directory, name = os.path.split(cached)
+    prefix = name.rsplit("-", 2)[0] + "-"
+    for old in os.listdir(directory):
+        if old.startswith(prefix) and old.endswith(".npy") and old != name:
+            os.remove(os.path.join(directory, old))
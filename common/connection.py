@@ -0,0 +1,99 @@
+import os
+import sqlite3
+import threading
+import time
+
+# ─── 1. 접속 설정 (환경변수) ───────────────────────────────────────
+# default: 매칭 테이블(cpu/gpu_detailed_matches), service: 서비스 테이블(cpu/gpu)
+# 접속 정보는 저장소에 두지 않음: HOST / USER / PASSWORD는 환경변수로 반드시 지정
+REQUIRED_KEYS = ["HOST", "USER", "PASSWORD"]
+
+# SQLite 기본 파일 (":memory:"면 연결마다 빈 DB라서 단계 사이에 테이블이 이어지지 않음)
+SQLITE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "local.db")
+
+def _prefix(target):
+    return "COMHERE_DB_" if target == "default" else f"COMHERE_{target.upper()}_DB_"
+
+def _env(target, key, default=None):
+    return os.environ.get(_prefix(target) + key, os.environ.get("COMHERE_DB_" + key, default))
+
+def db_config(target="default"):
+    """대상 DB 접속 정보 (COMHERE_DB_* / COMHERE_<TARGET>_DB_* 환경변수), 필수 값이 없으면 RuntimeError"""
+    missing = [key for key in REQUIRED_KEYS if not _env(target, key)]
+    if missing:
+        names = ", ".join(_prefix(target) + key for key in missing)
+        fallback = "" if target == "default" else " (또는 COMHERE_DB_*)"
+        raise RuntimeError(f"DB 접속 정보 없음 ({target}): 환경변수 {names}{fallback} 를 설정하세요")
+    return {
+        "host": _env(target, "HOST"),
+        "port": int(_env(target, "PORT", 3306)),
+        "database": _env(target, "NAME", "comhere"),
+        "user": _env(target, "USER"),
+        "password": _env(target, "PASSWORD"),
+    }
+
+def sqlite_path(target="default"):
+    """SQLite 백엔드의 DB 파일 (COMHERE_DB_SQLITE_PATH, 기본 data/local.db)"""
+    return _env(target, "SQLITE_PATH", SQLITE_PATH)
+
+def backend(target="default"):
+    """mysql (기본) 또는 sqlite (COMHERE_DB_BACKEND=sqlite, 로컬 테스트용)"""
+    return _env(target, "BACKEND", "mysql")
+
+# ─── 2. 커넥션 풀 ──────────────────────────────────────────────────
+_pools = {}
+_pools_lock = threading.Lock()
+
+def get_pool(target="default"):
+    """대상별 mysql.connector 커넥션 풀 (프로세스당 하나, 처음 요청할 때 생성)"""
+    with _pools_lock:
+        if target not in _pools:
+            from mysql.connector import pooling
+            _pools[target] = pooling.MySQLConnectionPool(
+                pool_name=f"comhere_{target}",
+                pool_size=int(_env(target, "POOL_SIZE", 5)),
+                pool_reset_session=True,
+                **db_config(target),
+            )
+        return _pools[target]
+
+def _connect_sqlite(target):
+    path = sqlite_path(target)
+    if path != ":memory:":
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    return sqlite3.connect(path, check_same_thread=False)
+
+# ─── 3. 연결 (재시도 + 지수 백오프) ────────────────────────────────
+def create_mysql_connection(target="default", retries=3, backoff=0.5):
+    """풀에서 연결을 하나 꺼냄 (close() 하면 풀로 반환). 실패 시 재시도 후 None"""
+    if backend(target) == "sqlite":
+        return _connect_sqlite(target)
+
+    from mysql.connector import Error
+
+    for attempt in range(retries):
+        try:
+            connection = get_pool(target).get_connection()
+            if connection.is_connected():
+                print("✅ MySQL 연결 성공")
+                return connection
+        except Error as e:
+            if attempt == retries - 1:
+                print(f"❌ MySQL 연결 실패: {e}")
+                return None
+            wait = backoff * (2 ** attempt)
+            print(f"⚠️ MySQL 연결 실패, {wait:.1f}초 후 재시도 ({attempt + 1}/{retries}): {e}")
+            time.sleep(wait)
+    return None
+
+def db_errors():
+    """except 절에서 잡을 DB 예외 타입 (sqlite3.Error + 설치돼 있으면 mysql.connector.Error)
+
+    except 식은 예외가 났을 때만 평가되므로 `except db_errors() as e:`로 쓰면
+    정상 경로에서는 mysql.connector를 import하지 않음
+    """
+    try:
+        from mysql.connector import Error
+    except ImportError:
+        return (sqlite3.Error,)
+    return (sqlite3.Error, Error)
@@ -0,0 +1,82 @@
+import pandas as pd
+
+from common.lines import apply_tiers, assign_lines
+from common.pareto import pareto_depth_by_line
+from common.scalers import make_scaler
+from common.schema import enforce
+from common.scoring import score_profiles
+from common.scoring_config import load_config
+
+# ─── 0. 점수 설정 (config/scoring.toml) ───────────────────────────
+CONFIG = load_config("cpu")
+HEADER_ROW = CONFIG.header_row
+
+TOTAL_COLUMNS = [
+    "CPU명", "라인",
+    "CPU_가격",                      # 가격 정보 추가
+    "종합_성능점수", "종합_성능_순위",
+    "순수_성능점수", "순수_성능_순위",
+    "파레토_깊이"
+]
+
+LINE_COLUMNS = [
+    "CPU명", "라인",
+    "종합_성능점수", "라인_내_종합_성능_순위",
+    "순수_성능점수", "라인_내_순수_성능_순위",
+    "CPU_가격", "게이밍_가성비",
+    "파레토_깊이"
+]
+
+# score_cpu 결과에 반드시 있어야 하는 컬럼
+SCORED_COLUMNS = list(dict.fromkeys(TOTAL_COLUMNS + LINE_COLUMNS + CONFIG.score_columns))
+
+# ─── 1. 점수 및 순위 계산 ──────────────────────────────────────────
+def score_cpu(df):
+    """CPU 가성비 엑셀(header=3)에서 라인, 정규화 값, 프로필별 점수/순위를 계산"""
+    # ▼ 컬럼명 정리
+    df = df.rename(columns={df.columns[i]: name for i, name in CONFIG.columns.items()})
+
+    # ▼ 라벨 역방향 채우기: 아래쪽에서 라벨 선언 → 위쪽에 적용
+    df["라인"] = assign_lines(df, CONFIG.name_column, CONFIG.line_value_column, CONFIG.lines)
+
+    # ▼ CPU 외의 행 제거
+    df["게이밍_가성비"] = pd.to_numeric(df["게이밍_가성비"].astype(str).str.replace(r"[^\d\.]", "", regex=True), errors="coerce")
+
+    # ▼ 라인별 GPU 성능 선택
+    df = apply_tiers(df, CONFIG.tiers, CONFIG.lines)
+
+    # ▼ 숫자형 변환
+    for col in CONFIG.features:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+
+    # ▼ 정규화 (invert 대상은 1 - 정규화 값)
+    scaler = make_scaler(CONFIG.scaler, **CONFIG.scaler_options)
+    df[[f"{col}_norm" for col in CONFIG.features]] = scaler.fit_transform(df[CONFIG.features])
+    for col in CONFIG.inverted:
+        df[f"{col}_반전_norm"] = 1 - df[f"{col}_norm"]
+
+    # ▼ 점수 및 전체/라인 내 순위 계산 (모든 프로필을 한 번에)
+    result = score_profiles(
+        df[CONFIG.score_columns].to_numpy(dtype=float), CONFIG.weights, lines=df["라인"],
+        min_weight=CONFIG.min_weight, renormalize=CONFIG.renormalize, na_option=CONFIG.na_rank
+    )
+
+    for j, name in enumerate(CONFIG.profile_names):
+        df[f"{name}_성능점수"] = result.scores[:, j]
+        df[f"{name}_성능_순위"] = result.ranks[:, j]
+        df[f"라인_내_{name}_성능_순위"] = result.line_ranks[:, j]
+
+    # ▼ 라인별 가격-성능 파레토 지배 깊이 (1 = 프런티어, 다른 SKU에 지배되지 않음)
+    df["파레토_깊이"] = pareto_depth_by_line(df, CONFIG.pareto_benefit, CONFIG.pareto_cost)
+
+    # ▼ 스키마 적용 (float32 점수, Int16 순위, category 라인)
+    return enforce(df, CONFIG, required=SCORED_COLUMNS, label="CPU 점수")
+
+# ─── 2. 출력 테이블 ────────────────────────────────────────────────
+def cpu_total_table(df):
+    """전체 종합 성능 순위 (CPU_성능_순위_가격포함.csv)"""
+    return enforce(df.sort_values(by="종합_성능점수", ascending=False)[TOTAL_COLUMNS].reset_index(drop=True), CONFIG)
+
+def cpu_line_table(df):
+    """라인별 정렬: 라인 → 라인 내 종합 성능 순위 (CPU_라인별_성능_순위.csv)"""
+    return enforce(df.sort_values(by=["라인", "라인_내_종합_성능_순위"])[LINE_COLUMNS].reset_index(drop=True), CONFIG)
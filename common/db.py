@@ -0,0 +1,218 @@
+import sqlite3
+
+import numpy as np
+
+# ─── 1. DB 종류별 차이 ─────────────────────────────────────────────
+def is_sqlite(connection):
+    """로컬 테스트용 SQLite 연결인지 여부 (아니면 MySQL로 간주)"""
+    return isinstance(connection, sqlite3.Connection)
+
+def placeholder(connection):
+    return "?" if is_sqlite(connection) else "%s"
+
+def quote(name):
+    # MySQL과 SQLite 모두 백틱 인용을 지원
+    return f"`{name}`"
+
+def _sql_type(values):
+    """스테이징 테이블 컬럼 타입 (첫 번째 값 기준)"""
+    sample = next((v for v in values if v is not None), None)
+    if isinstance(sample, (bool, int)):
+        return "BIGINT"
+    if isinstance(sample, float):
+        return "DOUBLE"
+    return "VARCHAR(255)"
+
+# ─── 2. DataFrame → 파라미터 튜플 ──────────────────────────────────
+def frame_rows(df, columns):
+    """DataFrame의 columns를 DB 파라미터 튜플 리스트로 변환 (NaN → None, numpy 타입 → 파이썬 타입)"""
+    values = df[columns].astype(object).where(df[columns].notna(), None)
+    return [
+        tuple(v.item() if isinstance(v, np.generic) else v for v in row)
+        for row in values.itertuples(index=False, name=None)
+    ]
+
+def last_per_key(rows):
+    """같은 키가 여러 번 나오면 마지막 행만 남김 (행 단위 UPDATE를 순서대로 실행한 것과 동일)"""
+    return list({row[0]: row for row in rows}.values())
+
+# ─── 3. 일괄 업데이트 ──────────────────────────────────────────────
+def _create_temp_sql(connection, name, columns, types, key_column):
+    temporary = "TEMP" if is_sqlite(connection) else "TEMPORARY"
+    defs = ", ".join(f"{quote(c)} {t}" for c, t in zip(columns, types))
+    return f"CREATE {temporary} TABLE {quote(name)} ({defs}, PRIMARY KEY ({quote(key_column)}))"
+
+def _drop_temp_sql(connection, name):
+    if is_sqlite(connection):
+        return f"DROP TABLE IF EXISTS temp.{quote(name)}"
+    return f"DROP TEMPORARY TABLE IF EXISTS {quote(name)}"
+
+def _update_join_sql(connection, table, staging, key_column, columns, keep_existing_on_null):
+    # SQLite는 UPDATE ... JOIN 대신 UPDATE ... FROM (3.33+)
+    target = quote(table) if is_sqlite(connection) else "t"
+    sets = []
+    for col in columns:
+        value = f"s.{quote(col)}"
+        if keep_existing_on_null:
+            value = f"COALESCE({value}, {target}.{quote(col)})"
+        sets.append(f"{'' if is_sqlite(connection) else 't.'}{quote(col)} = {value}")
+
+    if is_sqlite(connection):
+        return (
+            f"UPDATE {quote(table)} SET {', '.join(sets)} FROM {quote(staging)} AS s "
+            f"WHERE {target}.{quote(key_column)} = s.{quote(key_column)}"
+        )
+    return (
+        f"UPDATE {quote(table)} AS t JOIN {quote(staging)} AS s "
+        f"ON t.{quote(key_column)} = s.{quote(key_column)} SET {', '.join(sets)}"
+    )
+
+def _stage_and_update(connection, cursor, table, key_column, columns, rows, keep_existing_on_null, batch_size):
+    """임시 테이블 적재 + UPDATE ... JOIN (commit은 호출한 쪽에서)"""
+    staging = f"tmp_{table}_bulk"
+    all_columns = [key_column] + list(columns)
+    types = [_sql_type(values) for values in zip(*rows)]
+    mark = placeholder(connection)
+    insert = (
+        f"INSERT INTO {quote(staging)} ({', '.join(quote(c) for c in all_columns)}) "
+        f"VALUES ({', '.join([mark] * len(all_columns))})"
+    )
+
+    try:
+        cursor.execute(_drop_temp_sql(connection, staging))
+        cursor.execute(_create_temp_sql(connection, staging, all_columns, types, key_column))
+        for start in range(0, len(rows), batch_size):
+            cursor.executemany(insert, rows[start:start + batch_size])
+        cursor.execute(_update_join_sql(connection, table, staging, key_column, columns, keep_existing_on_null))
+        return cursor.rowcount
+    finally:
+        cursor.execute(_drop_temp_sql(connection, staging))
+
+def bulk_update(connection, table, key_column, columns, rows, keep_existing_on_null=False, batch_size=1000):
+    """rows = [(키, 값1, 값2, ...)] 를 임시 테이블에 적재한 뒤 UPDATE ... JOIN 한 번으로 반영
+
+    - 모든 작업은 하나의 트랜잭션 (실패 시 롤백 후 예외 전달)
+    - keep_existing_on_null=True 이면 값이 None인 컬럼은 기존 값을 유지
+    - 반환값: 업데이트된 행 수
+    """
+    rows = last_per_key(rows)
+    if not rows:
+        return 0
+
+    cursor = connection.cursor()
+    try:
+        updated = _stage_and_update(connection, cursor, table, key_column, columns, rows, keep_existing_on_null, batch_size)
+        connection.commit()
+        return updated
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
+
+# ─── 4. 전체 재적재 (shadow 테이블 + RENAME 교체) ──────────────────
+def reload_table(connection, table, create_query, columns, rows, chunk_size=500):
+    """table 내용을 rows로 통째로 교체
+
+    - MySQL: {table}_new 에 청크 단위 executemany로 적재한 뒤 RENAME TABLE로 원자적 교체
+      (읽는 쪽에서는 교체 전후 어느 시점에도 빈 테이블이 보이지 않음, AUTO_INCREMENT도 1부터)
+    - SQLite: 한 트랜잭션 안에서 DELETE 후 적재
+    - 반환값: 적재한 행 수
+    """
+    cursor = connection.cursor()
+    cursor.execute(create_query)
+    connection.commit()
+
+    shadow, old = f"{table}_new", f"{table}_old"
+    target = table if is_sqlite(connection) else shadow
+    mark = placeholder(connection)
+    insert = (
+        f"INSERT INTO {quote(target)} ({', '.join(quote(c) for c in columns)}) "
+        f"VALUES ({', '.join([mark] * len(columns))})"
+    )
+
+    try:
+        if is_sqlite(connection):
+            cursor.execute(f"DELETE FROM {quote(table)}")
+        else:
+            cursor.execute(f"DROP TABLE IF EXISTS {quote(shadow)}")
+            cursor.execute(f"CREATE TABLE {quote(shadow)} LIKE {quote(table)}")
+
+        for start in range(0, len(rows), chunk_size):
+            cursor.executemany(insert, rows[start:start + chunk_size])
+        connection.commit()
+
+        if not is_sqlite(connection):
+            cursor.execute(f"DROP TABLE IF EXISTS {quote(old)}")
+            cursor.execute(f"RENAME TABLE {quote(table)} TO {quote(old)}, {quote(shadow)} TO {quote(table)}")
+            cursor.execute(f"DROP TABLE {quote(old)}")
+        return len(rows)
+    except Exception:
+        connection.rollback()
+        if not is_sqlite(connection):
+            cursor.execute(f"DROP TABLE IF EXISTS {quote(shadow)}")
+        raise
+    finally:
+        cursor.close()
+
+# ─── 5. 스냅샷 기반 반영 (증분 모드) ──────────────────────────────
+def sync_update(connection, table, key_column, columns, rows, snapshot, incremental=False, keep_existing_on_null=False):
+    """bulk_update로 반영하고 snapshot(common.snapshot.Snapshot)을 갱신
+
+    - incremental=True 이면 스냅샷 대비 새로 생기거나 바뀐 행만 반영 (스냅샷이 없으면 전체)
+    - UPDATE만 하는 테이블이므로 사라진 키는 건드리지 않음 (전체 반영과 동일)
+    - 반환값: 업데이트된 행 수
+    """
+    rows = last_per_key(rows)
+    changes = snapshot.diff(rows) if incremental else None
+    if changes is None:
+        updated = bulk_update(connection, table, key_column, columns, rows, keep_existing_on_null)
+    else:
+        print(f"🔁 {table}: 변경 {len(changes.updated)}개, 신규 {len(changes.inserted)}개만 반영 (전체 {len(rows)}개)")
+        updated = bulk_update(connection, table, key_column, columns, changes.inserted + changes.updated, keep_existing_on_null)
+    snapshot.save(rows)
+    return updated
+
+def sync_table(connection, table, create_query, key_column, columns, rows, snapshot, incremental=False, chunk_size=500):
+    """reload_table로 재적재하고 snapshot을 갱신 (rows의 첫 컬럼 = key_column)
+
+    - incremental=True 이면 스냅샷 대비 INSERT/UPDATE/DELETE를 변경된 키에만 실행
+    - 스냅샷이 없거나 키가 중복되면 전체 재적재
+    - 변경분은 한 트랜잭션으로 반영 (실패 시 롤백 후 예외 전달)
+    - 같은 테이블의 다른 컬럼 스냅샷(라인/순위 등)은 추가/삭제된 키만큼 무효화
+    - 반환값: 반영한 행 수
+    """
+    keys = [row[0] for row in rows]
+    changes = snapshot.diff(rows) if incremental and len(set(keys)) == len(keys) else None
+    if changes is None:
+        count = reload_table(connection, table, create_query, columns, rows, chunk_size)
+        snapshot.invalidate_siblings()
+        snapshot.save(rows)
+        return count
+
+    print(f"🔁 {table}: 신규 {len(changes.inserted)}개, 변경 {len(changes.updated)}개, 삭제 {len(changes.deleted)}개만 반영 (전체 {len(rows)}개)")
+    mark = placeholder(connection)
+    insert = (
+        f"INSERT INTO {quote(table)} ({', '.join(quote(c) for c in columns)}) "
+        f"VALUES ({', '.join([mark] * len(columns))})"
+    )
+    delete = f"DELETE FROM {quote(table)} WHERE {quote(key_column)} = {mark}"
+
+    cursor = connection.cursor()
+    try:
+        for start in range(0, len(changes.deleted), chunk_size):
+            cursor.executemany(delete, [(key,) for key in changes.deleted[start:start + chunk_size]])
+        for start in range(0, len(changes.inserted), chunk_size):
+            cursor.executemany(insert, changes.inserted[start:start + chunk_size])
+        if changes.updated:
+            _stage_and_update(connection, cursor, table, key_column, columns[1:], changes.updated, False, chunk_size)
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
+
+    snapshot.invalidate_siblings([row[0] for row in changes.inserted] + changes.deleted)
+    snapshot.save(rows)
+    return len(changes.inserted) + len(changes.updated) + len(changes.deleted)
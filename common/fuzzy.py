@@ -0,0 +1,102 @@
+import csv
+import re
+from collections import defaultdict
+
+import numpy as np
+
+NGRAM = 3
+DEFAULT_THRESHOLD = 0.6
+DEFAULT_TOP_K = 5
+
+# 모델 번호 토큰 (5600x, 4060, 12400f, 9 ...) → 후보와 반드시 일치해야 함 (4060 ↔ 4070 오매칭 방지)
+MODEL_NUMBER_PATTERN = re.compile(r"\d+[a-z]*")
+# 모델 번호로 보지 않는 표기 (메모리 규격, 공정, VRAM 용량)
+NUMBER_NOISE_PATTERN = re.compile(r"\b(?:g?ddr\d+x?|\d+\s*(?:nm|gb))\b")
+# VRAM 용량 (모델 번호에서는 빠지므로 따로 비교: 검색어와 후보 모두 용량이 있으면 같아야 함)
+# 후보 이름에 용량이 없으면 통과 → 카탈로그 메모리 필드와의 비교는 호출하는 쪽 (gpu.py의 same_vram)
+VRAM_SIZE_PATTERN = re.compile(r"\b(\d+)\s*gb\b")
+NO_VRAM = -1
+
+# ─── 1. n-gram / 모델 번호 ─────────────────────────────────────────
+def ngrams(name, n=NGRAM):
+    """앞뒤 공백을 붙인 문자 n-gram 집합 (소문자 기준)"""
+    padded = f"  {name.lower()} "
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+def model_numbers(name):
+    """모델 번호 토큰 정렬 튜플: 'AMD Ryzen 5 5600X' → ('5', '5600x')"""
+    return tuple(sorted(MODEL_NUMBER_PATTERN.findall(NUMBER_NOISE_PATTERN.sub(" ", name.lower()))))
+
+def vram_size(name):
+    """이름의 VRAM 용량(GB), 없으면 NO_VRAM: 'geforce rtx 4060 ti 16gb' → 16"""
+    found = VRAM_SIZE_PATTERN.search(name.lower())
+    return int(found.group(1)) if found else NO_VRAM
+
+# ─── 2. 역색인 ─────────────────────────────────────────────────────
+class TrigramIndex:
+    """카탈로그 이름의 문자 trigram 역색인
+
+    - 검색어의 trigram 목록(posting)만 훑어 공통 trigram 수를 세므로 전체 이름과 1:1 비교하지 않음
+    - 유사도 = Jaccard(검색어 trigram, 후보 trigram)
+    """
+
+    def __init__(self, names, n=NGRAM):
+        self.n = n
+        self.names = list(names)
+        self.sizes = np.empty(len(self.names), dtype=np.int32)
+        self.number_codes = {}
+        self.numbers = np.empty(len(self.names), dtype=np.int32)
+        self.vram = np.empty(len(self.names), dtype=np.int32)
+        postings = defaultdict(list)
+        for i, name in enumerate(self.names):
+            grams = ngrams(name, n)
+            self.sizes[i] = len(grams)
+            self.numbers[i] = self.number_codes.setdefault(model_numbers(name), len(self.number_codes))
+            self.vram[i] = vram_size(name)
+            for gram in grams:
+                postings[gram].append(i)
+        self.postings = {gram: np.asarray(ids, dtype=np.int32) for gram, ids in postings.items()}
+
+    def search(self, query, k=DEFAULT_TOP_K, threshold=DEFAULT_THRESHOLD, same_numbers=False):
+        """유사도 상위 k개 [(이름, 점수)] (threshold 미만 제외, 점수 내림차순)
+
+        same_numbers=True 이면 모델 번호 토큰이 검색어와 같고 VRAM 용량이 다르지 않은 후보만
+        """
+        grams = ngrams(query, self.n)
+        hits = [self.postings[g] for g in grams if g in self.postings]
+        if not hits:
+            return []
+
+        ids, shared = np.unique(np.concatenate(hits), return_counts=True)
+        scores = shared / (len(grams) + self.sizes[ids] - shared)
+        keep = scores >= threshold
+        if same_numbers:
+            code = self.number_codes.get(model_numbers(query))
+            keep &= self.numbers[ids] == code if code is not None else False
+            vram = vram_size(query)
+            if vram != NO_VRAM:
+                keep &= (self.vram[ids] == vram) | (self.vram[ids] == NO_VRAM)
+        ids, scores = ids[keep], scores[keep]
+        if len(ids) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+            ids, scores = ids[top], scores[top]
+        order = np.lexsort((ids, -scores))
+        return [(self.names[ids[i]], float(scores[i])) for i in order]
+
+    def best_match(self, query, threshold=DEFAULT_THRESHOLD):
+        """모델 번호가 같고 VRAM 용량이 다르지 않은 후보 중 유사도 최고 (이름, 점수), 없으면 None"""
+        if not model_numbers(query):
+            return None
+        found = self.search(query, 1, threshold, same_numbers=True)
+        return found[0] if found else None
+
+# ─── 3. 매칭 감사 로그 ─────────────────────────────────────────────
+AUDIT_COLUMNS = ["excel_name", "normalized_name", "matched_name", "match_type", "score"]
+
+def write_match_audit(path, rows):
+    """매칭 결과 [(엑셀명, 정규화명, 매칭된 카탈로그명, 매칭 유형, 점수)]를 CSV로 저장"""
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f)
+        writer.writerow(AUDIT_COLUMNS)
+        writer.writerows(rows)
+    print(f"📝 매칭 감사 로그 저장: {path}")
@@ -0,0 +1,98 @@
+import pandas as pd
+
+from common.lines import apply_tiers, assign_lines
+from common.pareto import pareto_depth_by_line
+from common.scalers import make_scaler
+from common.schema import enforce
+from common.scoring import score_profiles
+from common.scoring_config import load_config
+
+# ─── 0. 점수 설정 (config/scoring.toml) ───────────────────────────
+CONFIG = load_config("gpu")
+HEADER_ROW = CONFIG.header_row
+MIN_WEIGHT = CONFIG.min_weight
+
+# 라인 포함 사용할 컬럼 (특성 + 가격)
+TARGET_COLUMNS = [CONFIG.name_column, "라인", *CONFIG.features, "GPU_가격"]
+
+TOTAL_COLUMNS = [
+    "GPU명", "라인", "GPU_가격",
+    "종합_성능점수", "유효가중치_종합", "종합_성능_순위",
+    "순수_성능점수", "유효가중치_순수", "순수_성능_순위",
+    "파레토_깊이"
+]
+
+LINE_COLUMNS = [
+    "GPU명", "라인", "유효가중치_종합",
+    "종합_성능점수", "라인_내_종합_성능_순위", "유효가중치_순수",
+    "순수_성능점수", "라인_내_순수_성능_순위",
+    "파레토_깊이"
+]
+
+# score_gpu 결과에 반드시 있어야 하는 컬럼
+SCORED_COLUMNS = list(dict.fromkeys(TOTAL_COLUMNS + LINE_COLUMNS + CONFIG.score_columns))
+
+# ─── 1. 점수 및 순위 계산 ──────────────────────────────────────────
+def score_gpu(df):
+    """그래픽카드 가성비 엑셀(header=2)에서 라인, 정규화 값, 프로필별 점수/순위를 계산"""
+    # ▼ 컬럼명 정리
+    price_column = df.columns[CONFIG.price_column]
+    df = df.rename(columns={df.columns[i]: name for i, name in CONFIG.columns.items()})
+
+    # ▼ 가격 정보 추출
+    df["GPU_가격"] = (
+        df[price_column]
+        .astype(str)
+        .str.replace(",", "")
+        .str.replace("원", "")
+        .str.extract(r'(\d+)')  # 숫자만 추출
+        .astype(float)
+    )
+
+    # ▼ GPU 라인 분류: 라인명 탐지 후 역방향으로 전파
+    df["라인"] = assign_lines(df, CONFIG.name_column, CONFIG.line_value_column, CONFIG.lines)
+    df = df[df["라인"].notna()].copy()
+
+    # ▼ 라인별 벤치마크 선택 (설정에 규칙이 있을 때)
+    df = apply_tiers(df, CONFIG.tiers, CONFIG.lines)
+
+    # ▼ 사용할 컬럼 선택 (라인 포함) 및 숫자형 변환
+    df = df[TARGET_COLUMNS]
+    for col in TARGET_COLUMNS[2:]:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+
+    # ▼ 정규화 (invert 대상은 1 - 정규화 값)
+    scaler = make_scaler(CONFIG.scaler, **CONFIG.scaler_options)
+    df[[f"{col}_norm" for col in CONFIG.features]] = scaler.fit_transform(df[CONFIG.features])
+    for col in CONFIG.inverted:
+        df[f"{col}_반전_norm"] = 1 - df[f"{col}_norm"]
+
+    # ▼ 점수, 유효 가중치, 전체/라인 내 순위를 프로필별로 한 번에 계산
+    result = score_profiles(
+        df[CONFIG.score_columns].to_numpy(dtype=float), CONFIG.weights, lines=df["라인"],
+        min_weight=CONFIG.min_weight, renormalize=CONFIG.renormalize, na_option=CONFIG.na_rank
+    )
+
+    for j, name in enumerate(CONFIG.profile_names):
+        df[f"{name}_성능점수"] = result.scores[:, j]
+        df[f"유효가중치_{name}"] = result.weight_sums[:, j]
+        df[f"{name}_성능_순위"] = result.ranks[:, j]
+        df[f"라인_내_{name}_성능_순위"] = result.line_ranks[:, j]
+
+    # ▼ 라인별 가격-성능 파레토 지배 깊이 (1 = 프런티어, 다른 SKU에 지배되지 않음)
+    df["파레토_깊이"] = pareto_depth_by_line(df, CONFIG.pareto_benefit, CONFIG.pareto_cost)
+
+    # ▼ 스키마 적용 (float32 점수, Int16 순위, category 라인)
+    return enforce(df, CONFIG, required=SCORED_COLUMNS, label="GPU 점수")
+
+# ─── 2. 출력 테이블 ────────────────────────────────────────────────
+def gpu_total_table(df_norm):
+    """전체 종합/순수 성능 순위 (gpu_total_priority_price.csv)"""
+    return enforce(df_norm.sort_values(by="종합_성능_순위", kind="stable").reset_index(drop=True)[TOTAL_COLUMNS], CONFIG)
+
+def gpu_line_table(df_norm):
+    """라인별 내부 순위, 유효 가중치 조건(≥ 0.5)을 만족하는 GPU만 (gpu_line_priority.csv)"""
+    df_line = df_norm.sort_values(by=["라인", "라인_내_종합_성능_순위"]).reset_index(drop=True)[LINE_COLUMNS]
+    return enforce(df_line[
+        (df_line["유효가중치_종합"] >= MIN_WEIGHT) & (df_line["유효가중치_순수"] >= MIN_WEIGHT)
+    ].copy(), CONFIG)
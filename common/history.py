@@ -0,0 +1,127 @@
+"""월별 점수/가격/순위 이력 저장소 (Parquet, 부품/월 파티션, 추가만 함)
+
+    data/history/part=cpu/month=2025-06/run-20250701T093000123456.parquet
+
+같은 월을 다시 적재하면 파일을 덮어쓰지 않고 새 run 파일을 추가하며, 조회는 파티션마다 가장 최근 run만 사용.
+"""
+import glob
+import os
+import re
+from datetime import datetime, timezone
+
+import pandas as pd
+
+HISTORY_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "history")
+
+MONTH_PATTERN = re.compile(r"^\d{4}-\d{2}$")
+
+# ─── 1. 저장할 컬럼 ────────────────────────────────────────────────
+def history_frame(df, config):
+    """score_cpu / score_gpu 결과에서 라인이 있는 SKU만 골라 이력 스키마로 변환
+
+    모델명 / 라인 / 가격 / 원본·정규화 특성 / 프로필별 점수·유효 가중치·순위 / 파레토_깊이
+    """
+    price = f"{config.part.upper()}_가격"
+    columns = [config.name_column, "라인", price, *config.features, *config.score_columns]
+    for name in config.profile_names:
+        columns += [f"{name}_성능점수", f"유효가중치_{name}", f"{name}_성능_순위", f"라인_내_{name}_성능_순위"]
+    columns.append("파레토_깊이")
+    columns = [col for col in dict.fromkeys(columns) if col in df.columns]
+
+    frame = df.loc[df["라인"].notna(), columns].rename(columns={config.name_column: "모델명", price: "가격"})
+    frame["모델명"] = frame["모델명"].astype(str).str.strip()
+    return frame.reset_index(drop=True)
+
+# ─── 2. 저장소 ─────────────────────────────────────────────────────
+class HistoryStore:
+    """부품/월 파티션 Parquet 이력 (pyarrow 필요)"""
+
+    def __init__(self, root=HISTORY_DIR):
+        self.root = root
+
+    def partition(self, part, month):
+        if not MONTH_PATTERN.match(month):
+            raise ValueError(f"월 형식은 YYYY-MM: {month}")
+        return os.path.join(self.root, f"part={part}", f"month={month}")
+
+    def append(self, part, month, frame):
+        """history_frame 결과를 새 run 파일로 추가 (임시 파일에 쓴 뒤 이름 변경)"""
+        return self.append_many([(part, month, frame)])[0]
+
+    def append_many(self, items):
+        """[(부품, 월, 프레임)]을 같은 run 시각으로 한 번에 추가
+
+        모두 임시 파일에 쓴 뒤 마지막에 한꺼번에 이름을 바꾸므로, 중간에 실패하면 아무 run도 추가되지 않음
+        """
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        paths = []
+        try:
+            for part, month, frame in items:
+                directory = self.partition(part, month)
+                os.makedirs(directory, exist_ok=True)
+                path = os.path.join(directory, f"run-{stamp}.parquet")
+                paths.append(path)
+                frame.to_parquet(path + ".tmp", index=False)
+        except Exception:
+            for path in paths:
+                if os.path.exists(path + ".tmp"):
+                    os.remove(path + ".tmp")
+            raise
+        for path in paths:
+            os.replace(path + ".tmp", path)
+        return paths
+
+    def months(self, part):
+        """적재된 월 목록 (오름차순)"""
+        pattern = os.path.join(self.root, f"part={glob.escape(part)}", "month=*")
+        return sorted(
+            os.path.basename(d)[len("month="):] for d in glob.glob(pattern)
+            if glob.glob(os.path.join(d, "run-*.parquet"))
+        )
+
+    def latest_run(self, part, month):
+        runs = sorted(glob.glob(os.path.join(self.partition(part, month), "run-*.parquet")))
+        return runs[-1] if runs else None
+
+    # ─── 3. 조회 ───────────────────────────────────────────────────
+    def load(self, part, months=None, columns=None, names=None):
+        """여러 달의 최신 run을 하나의 DataFrame으로 (month 컬럼 추가)
+
+        - columns: 읽을 컬럼 (모델명은 항상 포함), names: 이 모델명만 (Parquet 필터로 읽는 단계에서 거름)
+        """
+        months = self.months(part) if months is None else list(months)
+        if columns is not None:
+            columns = list(dict.fromkeys(["모델명", *columns]))
+        filters = [("모델명", "in", list(names))] if names is not None else None
+
+        frames = []
+        for month in months:
+            path = self.latest_run(part, month)
+            if path is None:
+                continue
+            frame = pd.read_parquet(path, columns=columns, filters=filters)
+            frames.append(frame.assign(month=month))
+        if not frames:
+            return pd.DataFrame(columns=["month", *(columns or ["모델명"])])
+        return pd.concat(frames, ignore_index=True)
+
+    def cross_section(self, part, month, columns=None):
+        """한 달의 전체 SKU 단면"""
+        return self.load(part, [month], columns).drop(columns="month")
+
+    def trajectory(self, part, names, column="가격"):
+        """모델별 월 추이 (행: 월, 열: 모델명), 예: trajectory("gpu", ["지포스 RTX 4060"], "종합_성능_순위")"""
+        frame = self.load(part, columns=[column], names=names)
+        return frame.pivot_table(index="month", columns="모델명", values=column, aggfunc="last").reindex(columns=list(names))
+
+# ─── 4. 파이프라인에서 기록 ────────────────────────────────────────
+def record_history(part, month, df, config, root=HISTORY_DIR):
+    """점수 계산 결과를 이력에 추가 (pyarrow가 없으면 건너뜀)"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        print("⚠️ pyarrow가 없어 이력 저장을 건너뜀")
+        return None
+    path = HistoryStore(root).append(part, month, history_frame(df, config))
+    print(f"📝 이력 저장: {os.path.relpath(path, root)}")
+    return path
@@ -0,0 +1,61 @@
+"""`python -X importtime` 결과로 스크립트 시작 비용(import 시간)을 요약
+
+    python -m common.importtime cpu/cpu_csv_restore.py
+    python run_pipeline.py --month 2025-06 --no-db --profile-import
+"""
+import os
+import re
+import subprocess
+import sys
+from collections import namedtuple
+
+# -X importtime 한 줄: "import time: <self us> | <cumulative us> | <들여쓰기><모듈명>"
+IMPORTTIME_PATTERN = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)\s*$")
+
+ImportEntry = namedtuple("ImportEntry", ["name", "self_us", "cumulative_us", "depth"])
+
+# ─── 1. 파싱 ───────────────────────────────────────────────────────
+def parse_importtime(lines):
+    """-X importtime 출력 줄들에서 ImportEntry 목록과 나머지(프로그램 자체의 stderr) 줄을 분리"""
+    entries, others = [], []
+    for line in lines:
+        match = IMPORTTIME_PATTERN.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append(ImportEntry(name, int(self_us), int(cumulative_us), len(indent) // 2))
+        elif not line.startswith("import time: self [us]"):
+            others.append(line)
+    return entries, others
+
+# ─── 2. 요약 ───────────────────────────────────────────────────────
+def format_report(entries, top=15):
+    """최상위 import별 누적 시간 상위 top개와 전체 합계 (ms)"""
+    roots = sorted((e for e in entries if e.depth == 0), key=lambda e: e.cumulative_us, reverse=True)
+    total = sum(e.cumulative_us for e in roots)
+    lines = [f"⏱️ import 시간 합계: {total / 1000:.1f}ms (최상위 모듈 {len(roots)}개, 전체 {len(entries)}개)"]
+    for e in roots[:top]:
+        share = e.cumulative_us / total * 100 if total else 0.0
+        lines.append(f"  {e.cumulative_us / 1000:9.1f}ms {share:5.1f}%  {e.name}")
+    return "\n".join(lines)
+
+# ─── 3. 실행 ───────────────────────────────────────────────────────
+def profile_command(args, top=15):
+    """python -X importtime <args>를 실행하고 import 시간 요약을 출력 (종료 코드 반환)
+
+    프로그램의 stdout은 그대로 통과시키고, stderr에서 importtime 줄만 걸러 요약
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        stderr=subprocess.PIPE, text=True, env={**os.environ, "PYTHONIOENCODING": "utf-8"}
+    )
+    entries, others = parse_importtime(result.stderr.splitlines())
+    if others:
+        print("\n".join(others), file=sys.stderr)
+    print(format_report(entries, top))
+    return result.returncode
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("사용법: python -m common.importtime <script.py> [인자...]")
+        sys.exit(2)
+    sys.exit(profile_command(sys.argv[1:]))
@@ -0,0 +1,130 @@
+import hashlib
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", ".cache")
+
+# 숫자/문자가 섞인 object 컬럼은 정수부, 실수부, 불리언부, 날짜부, 문자부 컬럼으로 나눠 저장
+# 그 밖의 타입(time, timedelta, 시간대가 있는 datetime 등)이 섞인 시트는 캐시하지 않음
+INT_SUFFIX = "::int"
+NUM_SUFFIX = "::num"
+BOOL_SUFFIX = "::bool"
+DATETIME_SUFFIX = "::datetime"
+TEXT_SUFFIX = "::text"
+PART_SUFFIXES = (NUM_SUFFIX, BOOL_SUFFIX, DATETIME_SUFFIX, TEXT_SUFFIX)
+
+# ─── 1. 원본 파일 해시 ─────────────────────────────────────────────
+def file_hash(path):
+    """원본 파일 내용의 sha256 (엑셀이 바뀌면 캐시 키가 바뀜)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def cache_path(path, header=0, sheet_name=0, cache_dir=CACHE_DIR):
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(cache_dir, f"{stem}-s{sheet_name}-h{header}-{file_hash(path)[:16]}.parquet")
+
+# ─── 2. DataFrame ↔ 컬럼형 변환 ────────────────────────────────────
+def _is_int(value):
+    return isinstance(value, (int, np.integer)) and not isinstance(value, bool)
+
+def _is_float(value):
+    return isinstance(value, (float, np.floating)) and not pd.isna(value)
+
+def _is_bool(value):
+    return isinstance(value, (bool, np.bool_))
+
+def _is_datetime(value):
+    return isinstance(value, datetime) and value.tzinfo is None
+
+def to_columnar(df):
+    """엑셀에서 읽은 DataFrame을 Parquet로 쓸 수 있는 타입 고정 컬럼으로 변환
+
+    나눠 담을 수 없는 타입의 셀이 있으면 TypeError (읽은 쪽은 캐시 없이 그대로 사용)
+    """
+    out = {}
+    for col in df.columns:
+        series = df[col]
+        name = str(col)
+        if series.dtype != object:
+            out[name] = series.to_numpy()
+            continue
+
+        is_int = series.map(_is_int).astype(bool)
+        is_float = series.map(_is_float).astype(bool)
+        is_bool = series.map(_is_bool).astype(bool)
+        is_datetime = series.map(_is_datetime).astype(bool)
+        is_text = series.map(lambda v: isinstance(v, str)).astype(bool)
+        other = series.notna() & ~(is_int | is_float | is_bool | is_datetime | is_text)
+        if other.any():
+            raise TypeError(f"{name} 컬럼에 캐시할 수 없는 타입: {type(series[other].iloc[0]).__name__}")
+
+        out[name + INT_SUFFIX] = series.where(is_int).astype("Int64").to_numpy()
+        out[name + NUM_SUFFIX] = series.where(is_float).astype(float).to_numpy()
+        out[name + BOOL_SUFFIX] = pd.array(series.where(is_bool).to_numpy(dtype=object), dtype="boolean")
+        out[name + DATETIME_SUFFIX] = pd.to_datetime(series.where(is_datetime).to_numpy(dtype=object)).as_unit("us")
+        out[name + TEXT_SUFFIX] = pd.array(series.where(is_text).to_numpy(dtype=object), dtype="string")
+    return pd.DataFrame(out)
+
+def from_columnar(table):
+    """to_columnar로 저장한 컬럼을 원래의 object 컬럼으로 복원 (불리언/날짜부가 없는 이전 캐시도 읽음)"""
+    out = {}
+    for name in table.columns:
+        if name.endswith(PART_SUFFIXES):
+            continue
+        if not name.endswith(INT_SUFFIX):
+            out[name] = table[name]
+            continue
+
+        base = name[:-len(INT_SUFFIX)]
+        values = np.full(len(table), np.nan, dtype=object)
+        for suffix, cast in ((INT_SUFFIX, int), (NUM_SUFFIX, float), (BOOL_SUFFIX, bool), (DATETIME_SUFFIX, pd.Timestamp.to_pydatetime), (TEXT_SUFFIX, str)):
+            if base + suffix not in table:
+                continue
+            part = table[base + suffix]
+            present = part.notna().to_numpy()
+            values[present] = [cast(v) for v in part[present]]
+        out[base] = pd.Series(values, index=table.index, dtype=object)
+    return pd.DataFrame(out)
+
+# ─── 3. 엑셀 읽기 (캐시 우선) ──────────────────────────────────────
+def read_workbook(path, header=0, sheet_name=0, cache_dir=CACHE_DIR):
+    """엑셀 시트를 읽되, 같은 내용/옵션으로 이미 파싱한 적이 있으면 Parquet 캐시를 메모리 맵으로 로드
+
+    pyarrow가 없으면 캐시 없이 엑셀을 직접 읽음
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return pd.read_excel(path, header=header, sheet_name=sheet_name, engine="openpyxl")
+
+    cached = cache_path(path, header, sheet_name, cache_dir)
+    if os.path.exists(cached):
+        return from_columnar(pd.read_parquet(cached, memory_map=True))
+
+    df = pd.read_excel(path, header=header, sheet_name=sheet_name, engine="openpyxl")
+    df.columns = [str(col) for col in df.columns]
+    try:
+        columnar = to_columnar(df)
+    except TypeError as e:
+        print(f"⚠️ 캐시 생략 ({os.path.basename(path)}): {e}")
+        return df
+    os.makedirs(cache_dir, exist_ok=True)
+    _remove_stale(cached)
+    tmp = cached + ".tmp"
+    columnar.to_parquet(tmp, index=False)
+    os.replace(tmp, cached)
+    return df
+
+def _remove_stale(cached):
+    """같은 엑셀/옵션의 이전 버전 캐시 삭제"""
+    directory, name = os.path.split(cached)
+    prefix = name.rsplit("-", 1)[0] + "-"
+    for old in os.listdir(directory):
+        if old.startswith(prefix) and old.endswith(".parquet") and old != name:
+            os.remove(os.path.join(directory, old))
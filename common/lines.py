@@ -0,0 +1,57 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+# 라인 구분 키워드는 config/scoring.toml의 lines (위쪽이 우선순위 높음)
+
+# ─── 1. 라인 헤더 패턴 ─────────────────────────────────────────────
+def compile_line_pattern(keywords):
+    """키워드별 lookahead를 우선순위 순서로 이어 붙인 정규식
+
+    한 셀에 키워드가 여러 개 있으면 위치와 상관없이 목록 앞쪽 키워드가 잡힘
+    """
+    return re.compile("^(?:" + "|".join(f"(?=.*?({re.escape(k)}))" for k in keywords) + ")", re.DOTALL)
+
+# ─── 2. 라벨 역방향 채우기 ─────────────────────────────────────────
+def assign_lines(df, name_col, value_col, keywords, marker="라인"):
+    """'<키워드> ... 라인' 헤더 행을 찾아 그 위쪽 행들에 라인명을 채움
+
+    - 헤더 행 자신과 value_col이 비어있는 행은 라인 없음
+    - 아래쪽 헤더가 없는 행도 라인 없음
+    """
+    names = df[name_col].astype(str)
+    is_header = names.str.contains(marker, regex=False, na=False)
+
+    # 정규식은 헤더 행에만 (캡처 그룹은 키워드별, 잡힌 그룹 중 첫 번째가 라인명)
+    found = names[is_header].str.extract(compile_line_pattern(keywords))
+    captured = found.notna().to_numpy()
+    first = found.to_numpy(dtype=object)[np.arange(len(found)), captured.argmax(axis=1)]
+    labels = pd.Series(np.where(captured.any(axis=1), first, np.nan), index=found.index, dtype=object).reindex(df.index)
+
+    is_label = labels.notna()
+    return labels.bfill().where(~is_label & df[value_col].notna())
+
+# ─── 3. 라인별 열 선택 ─────────────────────────────────────────────
+def line_index(labels, lines):
+    """라인 값을 lines 목록의 위치로 변환 (목록에 없거나 결측이면 -1)"""
+    return pd.Categorical(labels, categories=lines).codes.astype(np.int64)
+
+def select_by_line(values, codes, column_index):
+    """행마다 라인 코드 → 후보 열 위치로 값을 골라 모음 (np.take_along_axis)
+
+    - values: (SKU × 후보 열) 배열, codes: line_index 결과
+    - column_index: 라인 코드별 후보 열 위치, -1이면 선택 없음 → NaN
+    """
+    values = np.asarray(values, dtype=float)
+    picks = np.where(codes >= 0, np.asarray(column_index)[codes], -1)
+    gathered = np.take_along_axis(values, np.maximum(picks, 0)[:, None], axis=1)[:, 0]
+    return np.where(picks >= 0, gathered, np.nan)
+
+def apply_tiers(df, tiers, lines):
+    """설정의 라인별 벤치마크 규칙(TierRule)마다 대상 컬럼을 채움 (df["라인"] 기준)"""
+    codes = line_index(df["라인"], lines)
+    for rule in tiers:
+        values = np.column_stack([pd.to_numeric(df[col], errors="coerce") for col in rule.columns])
+        df[rule.target] = select_by_line(values, codes, rule.index)
+    return df
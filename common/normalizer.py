@@ -0,0 +1,120 @@
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# ─── 1. 한글 → 영문 변환표 / 정규식 (모듈 로드 시 한 번만 컴파일) ───
+CPU_KR_TO_EN = {
+    "코어 울트라": "Core Ultra",
+    "코어": "Intel Core ",
+    "라이젠": "AMD Ryzen ",
+    "펜티엄 골드 ": "Intel Pentium Gold ",
+    "애슬론 ": "AMD Athlon ",
+    "셀러론 ": "Intel Celeron ",
+}
+GPU_KR_TO_EN = {
+    "지포스": "geforce",
+    "라데온": "radeon",
+    "아크": "arc",
+    "그래픽스": "graphics",
+}
+
+def _alternation(table):
+    """변환표 키를 긴 것부터 나열한 정규식 하나로 (한 번 훑으면서 모두 치환, '코어 울트라'가 '코어'보다 우선)"""
+    return re.compile("|".join(re.escape(k) for k in sorted(table, key=len, reverse=True)))
+
+CPU_KR_PATTERN = _alternation(CPU_KR_TO_EN)
+GPU_KR_PATTERN = _alternation(GPU_KR_TO_EN)
+
+# AMD A107700K → A10-7700K, FX8350 → FX-8350, i71234K → i7-1234K
+CPU_DASH_PATTERN = re.compile(r"\b(A\d{2}|FX|i[3579])(\d{4})([A-Z]*)\b", re.IGNORECASE)
+CPU_SYMBOL_PATTERN = re.compile(r"[^\w\s\-]")   # 하이픈은 유지
+GPU_SYMBOL_PATTERN = re.compile(r"[^\w\s]")
+SPACE_PATTERN = re.compile(r"\s+")
+GDDR_PATTERN = re.compile(r"\s+gddr\d+x?", re.IGNORECASE)
+VRAM_PATTERN = re.compile(r"(.*?)(?:\s+(\d+)\s*gb)?$", re.IGNORECASE)
+
+CACHE_SIZE = 1 << 16
+
+# ─── 2. 이름 하나씩 (같은 이름은 캐시에서) ─────────────────────────
+@lru_cache(maxsize=CACHE_SIZE)
+def _normalize_cpu(name):
+    name = CPU_KR_PATTERN.sub(lambda m: CPU_KR_TO_EN[m.group(0)], name.strip())
+    name = CPU_DASH_PATTERN.sub(r"\1-\2\3", name)
+    name = CPU_SYMBOL_PATTERN.sub("", name)
+    return SPACE_PATTERN.sub(" ", name).strip()
+
+def normalize_cpu_model(name) -> str:
+    """CPU명 정규화 (예: '라이젠5 5600X' → 'AMD Ryzen 5 5600X'), 문자열이 아니면 ''"""
+    if not isinstance(name, str) or not name.strip():
+        return ""
+    return _normalize_cpu(name)
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _normalize_gpu(name):
+    name = GPU_KR_PATTERN.sub(lambda m: GPU_KR_TO_EN[m.group(0)], name.lower().strip())
+    name = GPU_SYMBOL_PATTERN.sub(" ", name)
+    return SPACE_PATTERN.sub(" ", name).strip()
+
+def normalize_model_name(name) -> str:
+    """GPU명 정규화 (소문자, 한글 → 영문, 특수문자 → 공백), 문자열이 아니면 ''"""
+    if not isinstance(name, str) or not name:
+        return ""
+    return _normalize_gpu(name)
+
+def delete_model_gddr(name):
+    """'... gddr6x' 같은 메모리 규격 표기 제거"""
+    return GDDR_PATTERN.sub("", name.strip())
+
+@lru_cache(maxsize=CACHE_SIZE)
+def extract_model_and_vram(name):
+    """'rtx 4060 ti 8gb' → ('rtx 4060 ti', 8)"""
+    match = VRAM_PATTERN.search(name.strip())
+    if match:
+        model = match.group(1).strip()
+        vram = int(match.group(2)) if match.group(2) else None
+        return model, vram
+    return name, None
+
+def gpu_model_key(name):
+    """DB의 chipset과 맞춰보는 키: 정규화 → GDDR 제거 → VRAM 제거"""
+    return extract_model_and_vram(delete_model_gddr(normalize_model_name(name)))[0]
+
+# ─── 3. Series 단위 (고유값만 .str 연산으로 한 번씩) ─────────────────
+def _cpu_str(text):
+    return (
+        text.str.strip()
+        .str.replace(CPU_KR_PATTERN, lambda m: CPU_KR_TO_EN[m.group(0)], regex=True)
+        .str.replace(CPU_DASH_PATTERN, r"\1-\2\3", regex=True)
+        .str.replace(CPU_SYMBOL_PATTERN, "", regex=True)
+        .str.replace(SPACE_PATTERN, " ", regex=True)
+        .str.strip()
+    )
+
+def _gpu_str(text):
+    return (
+        text.str.lower().str.strip()
+        .str.replace(GPU_KR_PATTERN, lambda m: GPU_KR_TO_EN[m.group(0)], regex=True)
+        .str.replace(GPU_SYMBOL_PATTERN, " ", regex=True)
+        .str.replace(SPACE_PATTERN, " ", regex=True)
+        .str.strip()
+    )
+
+def _gpu_key_str(text):
+    text = _gpu_str(text).str.strip().str.replace(GDDR_PATTERN, "", regex=True)
+    return text.str.strip().str.extract(VRAM_PATTERN, expand=True)[0].str.strip()
+
+SERIES_NORMALIZERS = {"cpu": _cpu_str, "gpu": _gpu_str, "gpu_key": _gpu_key_str}
+
+def normalize_series(series, part="cpu"):
+    """Series 전체 정규화 (part: cpu=normalize_cpu_model, gpu=normalize_model_name, gpu_key=gpu_model_key)
+
+    고유값만 추려 pandas .str 연산으로 처리한 뒤 원래 위치로 펼침, 문자열이 아닌 값은 ''
+    """
+    codes, uniques = pd.factorize(series)
+    uniques = pd.Series(uniques, dtype=object)
+    text = uniques.where(uniques.map(lambda v: isinstance(v, str)), "").astype(str)
+    normalized = SERIES_NORMALIZERS[part](text).fillna("").to_numpy(dtype=object)
+    # factorize의 결측 코드(-1)는 마지막에 붙인 ''를 가리킴
+    return pd.Series(np.append(normalized, "")[codes], index=series.index, dtype=object)
@@ -0,0 +1,85 @@
+from bisect import bisect_left
+
+import numpy as np
+import pandas as pd
+
+# ─── 1. 지배 깊이 (비지배 정렬 층) ─────────────────────────────────
+# a가 b를 지배: 모든 축에서 a가 b보다 나쁘지 않고, 적어도 한 축에서 더 좋음 (값이 같은 SKU끼리는 지배하지 않음)
+# 깊이 1 = 파레토 프런티어, 깊이 k = 깊이 k-1 이하 SKU를 빼면 프런티어가 되는 SKU
+
+def _depth_2d(x, y):
+    """두 축(모두 클수록 좋음) 지배 깊이, O(n log n)
+
+    x 내림차순(동률이면 y 내림차순)으로 훑으면 앞에서 나온 점만 뒤의 점을 지배할 수 있고,
+    층마다 마지막 점의 (y, x)만 보면 지배 여부를 알 수 있음. 층 꼬리 키는 층 번호가
+    커질수록 줄어들므로 이진 탐색으로 들어갈 첫 층을 찾음.
+    """
+    order = np.lexsort((-y, -x))
+    depth = np.empty(len(x), dtype=np.int64)
+    tails = []  # 층별 꼬리의 -(y, x) (오름차순 유지)
+    for i in order:
+        key = (-y[i], -x[i])
+        layer = bisect_left(tails, key)
+        if layer == len(tails):
+            tails.append(key)
+        else:
+            tails[layer] = key
+        depth[i] = layer + 1
+    return depth
+
+def _depth_nd(values):
+    """축이 여럿일 때 지배 깊이 (합 내림차순으로 훑으며 앞선 점과만 NumPy로 비교, O(n²·d))"""
+    order = np.argsort(-values.sum(axis=1), kind="stable")
+    ordered = values[order]
+    depth = np.empty(len(values), dtype=np.int64)
+    ordered_depth = np.zeros(len(values), dtype=np.int64)
+    for k in range(len(ordered)):
+        earlier = ordered[:k]
+        dominates = (earlier >= ordered[k]).all(axis=1) & (earlier > ordered[k]).any(axis=1)
+        ordered_depth[k] = ordered_depth[:k][dominates].max(initial=0) + 1
+    depth[order] = ordered_depth
+    return depth
+
+def dominance_depth(values, maximize=None):
+    """(SKU × 축) 값의 지배 깊이 (1 = 프런티어), 값에 NaN이 있는 SKU는 0
+
+    - maximize: 축별 True(클수록 좋음) / False(작을수록 좋음, 예: 가격), None이면 모두 True
+    - 두 축이면 O(n log n) 스윕, 그 이상은 O(n²) 벡터 비교
+    """
+    values = np.asarray(values, dtype=float)
+    values = values.reshape(-1, 1) if values.ndim == 1 else values
+    if maximize is not None:
+        values = np.where(np.asarray(maximize, dtype=bool), values, -values)
+
+    depth = np.zeros(len(values), dtype=np.int64)
+    valid = ~np.isnan(values).any(axis=1)
+    if not valid.any():
+        return depth
+    if values.shape[1] == 1:
+        distinct = np.unique(-values[valid, 0])
+        depth[valid] = np.searchsorted(distinct, -values[valid, 0]) + 1
+    elif values.shape[1] == 2:
+        depth[valid] = _depth_2d(values[valid, 0], values[valid, 1])
+    else:
+        depth[valid] = _depth_nd(values[valid])
+    return depth
+
+def pareto_front(values, maximize=None):
+    """파레토 프런티어(비지배 SKU) 여부"""
+    return dominance_depth(values, maximize) == 1
+
+# ─── 2. 라인별 적용 ────────────────────────────────────────────────
+def pareto_depth_by_line(df, benefit, cost, line_column="라인"):
+    """라인마다 (benefit 축 ↑, cost 축 ↓) 지배 깊이, 라인/값이 없는 SKU나 축이 없으면 결측 (Int64)"""
+    columns = [*benefit, *cost]
+    if not columns:
+        return pd.Series(pd.NA, index=df.index, dtype="Int64")
+    values = df[columns].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+    maximize = [True] * len(benefit) + [False] * len(cost)
+    lines = df[line_column].to_numpy(dtype=object)
+
+    depth = np.zeros(len(df), dtype=np.int64)
+    for line in pd.unique(lines[pd.notna(lines)]):
+        members = np.flatnonzero(lines == line)
+        depth[members] = dominance_depth(values[members], maximize)
+    return pd.Series(depth, index=df.index, dtype="Int64").mask(depth == 0)
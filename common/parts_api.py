@@ -0,0 +1,154 @@
+import glob
+import gzip
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime, timezone
+
+from common.ingest import CACHE_DIR
+
+API_CACHE_DIR = os.path.join(CACHE_DIR, "api")
+DEFAULT_TTL = 24 * 60 * 60  # 초
+STAMP_FORMAT = "%Y%m%dT%H%M%S"
+SNAPSHOT_STAMP = re.compile(r"-(\d{8}T\d{6})\.json\.gz$")
+
+# ─── 1. 클라이언트 ─────────────────────────────────────────────────
+class PCPartPickerClient:
+    """pcpartpicker.API로 부품 목록을 받아 dict 리스트로 반환"""
+
+    def fetch(self, part, region="us"):
+        from pcpartpicker import API
+        data = API(region).retrieve(part)
+        return json.loads(data.to_json()).get(part, [])
+
+class StubClient:
+    """로컬 파일({directory}/{part}.json, 예: cpu.json)을 API 응답 대신 사용 (오프라인/테스트용)"""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def fetch(self, part, region="us"):
+        with open(os.path.join(self.directory, f"{part}.json"), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data.get(part, []) if isinstance(data, dict) else data
+
+# ─── 2. 스냅샷 캐시 (gzip, 시각별 버전) ────────────────────────────
+class SnapshotCache:
+    """client 응답을 {cache_dir}/{part}-{region}-{YYYYmmddTHHMMSS}.json.gz 스냅샷으로 보관
+
+    - 최신 스냅샷이 ttl초 이내면 그대로 사용
+    - 오래됐으면 최신 스냅샷을 바로 돌려주고 백그라운드(daemon) 스레드에서 새로 받아 저장
+      (프로세스가 먼저 끝나면 갱신은 버려지고, 임시 파일에 쓴 뒤 이름을 바꾸므로 기존 스냅샷은 그대로)
+    - 스냅샷이 하나도 없을 때만 API를 기다림, API가 실패하면 최신 스냅샷으로 대체
+    - offline=True 이면 API를 호출하지 않음 (스냅샷이 없으면 예외)
+    - 부품/지역별로 최근 keep개만 남김
+    """
+
+    def __init__(self, client, cache_dir=API_CACHE_DIR, ttl=DEFAULT_TTL, offline=False, keep=5):
+        self.client = client
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.offline = offline
+        self.keep = keep
+        self._refreshing = {}
+        self._lock = threading.Lock()
+
+    def snapshots(self, part, region):
+        """스냅샷 경로 목록 (오래된 것부터)"""
+        pattern = os.path.join(self.cache_dir, f"{glob.escape(part)}-{glob.escape(region)}-*.json.gz")
+        return sorted(path for path in glob.glob(pattern) if SNAPSHOT_STAMP.search(path))
+
+    def read(self, path):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return json.load(f)["items"]
+
+    def _age(self, path):
+        stamp = datetime.strptime(SNAPSHOT_STAMP.search(path).group(1), STAMP_FORMAT).replace(tzinfo=timezone.utc)
+        return (datetime.now(timezone.utc) - stamp).total_seconds()
+
+    def refresh(self, part, region):
+        """API에서 새로 받아 스냅샷으로 저장하고 항목 반환"""
+        items = self.client.fetch(part, region)
+        now = datetime.now(timezone.utc)
+        path = os.path.join(self.cache_dir, f"{part}-{region}-{now.strftime(STAMP_FORMAT)}.json.gz")
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp = path + ".tmp"
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            json.dump({"part": part, "region": region, "fetched_at": now.isoformat(), "items": items}, f, ensure_ascii=False)
+        os.replace(tmp, path)
+        for old in self.snapshots(part, region)[:-self.keep]:
+            os.remove(old)
+        return items
+
+    def _refresh_in_background(self, part, region):
+        def run():
+            try:
+                self.refresh(part, region)
+                print(f"🔄 {part}/{region} API 스냅샷 갱신 완료")
+            except Exception as e:
+                print(f"⚠️ {part}/{region} API 스냅샷 갱신 실패 (기존 스냅샷 유지): {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.pop((part, region), None)
+
+        with self._lock:
+            if (part, region) in self._refreshing:
+                return
+            # daemon이라 CLI 종료를 네트워크 호출이 막지 않음 (기다리려면 wait)
+            thread = self._refreshing[part, region] = threading.Thread(target=run, name=f"refresh-{part}-{region}", daemon=True)
+        thread.start()
+
+    def wait(self, timeout=None):
+        """진행 중인 백그라운드 갱신을 최대 timeout초까지 기다림, 모두 끝났으면 True"""
+        with self._lock:
+            threads = list(self._refreshing.values())
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in threads:
+            thread.join(None if deadline is None else max(deadline - time.monotonic(), 0))
+        return not any(thread.is_alive() for thread in threads)
+
+    def fetch(self, part, region="us"):
+        snapshots = self.snapshots(part, region)
+        latest = snapshots[-1] if snapshots else None
+
+        if latest is None:
+            if self.offline:
+                raise FileNotFoundError(f"{part}/{region} API 스냅샷이 없습니다 (오프라인 모드)")
+            return self.refresh(part, region)
+
+        if not self.offline and self._age(latest) >= self.ttl:
+            self._refresh_in_background(part, region)
+        return self.read(latest)
+
+# ─── 3. 기본 클라이언트 선택 (환경변수) ─────────────────────────────
+_caches = {}
+
+def get_client():
+    """COMHERE_PARTS_API=stub:<폴더> 이면 StubClient, 아니면 pcpartpicker, 응답은 SnapshotCache로 감쌈
+
+    - COMHERE_PARTS_API_TTL: 스냅샷 유효 시간(초, 기본 86400), 0이면 캐시 없이 매번 호출
+    - COMHERE_PARTS_API_OFFLINE=1: API를 호출하지 않고 최신 스냅샷만 사용
+    """
+    source = os.environ.get("COMHERE_PARTS_API", "pcpartpicker")
+    if source.startswith("stub:"):
+        client = StubClient(source[len("stub:"):])
+    elif source == "pcpartpicker":
+        client = PCPartPickerClient()
+    else:
+        raise ValueError(f"알 수 없는 부품 API: {source}")
+
+    ttl = int(os.environ.get("COMHERE_PARTS_API_TTL", DEFAULT_TTL))
+    offline = os.environ.get("COMHERE_PARTS_API_OFFLINE", "") not in ("", "0")
+    if ttl <= 0 and not offline:
+        return client
+    # 같은 설정이면 프로세스 안에서 하나만 (백그라운드 갱신 중복 방지)
+    key = (source, ttl, offline)
+    if key not in _caches:
+        _caches[key] = SnapshotCache(client, ttl=ttl, offline=offline)
+    return _caches[key]
+
+def fetch_parts(part, region="us", client=None):
+    """부품 목록 (API 원본 항목 dict 리스트)"""
+    return (client or get_client()).fetch(part, region)
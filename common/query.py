@@ -0,0 +1,224 @@
+"""점수 테이블(cpu_total_table / gpu_total_table 결과) 위의 메모리 내 Top-K / 순위 조회
+
+    python -m common.query --month 2025-06 --port 8765
+
+    GET /top?part=gpu&k=5&line=상위 메인스트림&max_price=800000&profile=종합
+    GET /ranks?part=cpu&start=1&stop=10[&line=하이엔드]
+    GET /sku?part=gpu&name=지포스 RTX 4060
+
+라인(전체 포함)별로 점수 내림차순 정렬 인덱스와 가격순 merge sort tree를 미리 만들어 두고,
+조회는 이진 탐색 + 필요한 k개만 꺼내므로 DB를 거치지 않음.
+"""
+import argparse
+import heapq
+import json
+from collections import namedtuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import islice
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+# 범위(라인 또는 전체)별 점수 순서: positions는 점수 내림차순 행 위치, ranks는 그 순서의 전체 순위
+ScoreOrder = namedtuple("ScoreOrder", ["positions", "scores", "ranks"])
+
+# 범위별 가격 merge sort tree: prices는 가격 오름차순,
+# levels[l]은 가격순 배열을 2^l개씩 나눈 블록마다 점수순으로 정렬한 (-점수, 행 위치) 배열 쌍
+PriceTree = namedtuple("PriceTree", ["prices", "levels"])
+
+# ─── 1. 인덱스 ─────────────────────────────────────────────────────
+def _detect_column(columns, suffix):
+    return next((col for col in columns if str(col).endswith(suffix)), None)
+
+class ScoreIndex:
+    """점수 테이블 하나(부품 하나)에 대한 프로필 × 라인별 정렬 인덱스
+
+    - top: 점수 상위 k개 (라인 / 가격 범위 조건), O(log n + k log log n)
+    - rank_range: 전체 순위가 start~stop인 SKU (라인 조건), O(log n + k)
+    - find: 모델명으로 조회, O(1)
+    """
+
+    def __init__(self, table, name_column=None, price_column=None, line_column="라인"):
+        self.table = table.reset_index(drop=True)
+        self.name_column = name_column or self.table.columns[0]
+        self.price_column = price_column or _detect_column(self.table.columns, "_가격")
+        self.line_column = line_column
+        self.profiles = [str(col)[:-len("_성능점수")] for col in self.table.columns if str(col).endswith("_성능점수")]
+        self.lines = [line for line in self.table[line_column].dropna().unique()]
+
+        self._names = {}
+        for position, name in enumerate(self.table[self.name_column].astype(str).str.strip()):
+            self._names.setdefault(name, []).append(position)
+
+        line_values = self.table[line_column].to_numpy(dtype=object)
+        scopes = {None: np.arange(len(self.table))}
+        scopes.update({line: np.flatnonzero(line_values == line) for line in self.lines})
+        prices = (
+            self.table[self.price_column].to_numpy(dtype=float) if self.price_column
+            else np.full(len(self.table), np.nan)
+        )
+
+        self._scores, self._orders, self._trees = {}, {}, {}
+        for profile in self.profiles:
+            scores = self._scores[profile] = self.table[f"{profile}_성능점수"].to_numpy(dtype=float)
+            ranks = self.table[f"{profile}_성능_순위"].to_numpy()
+            for line, members in scopes.items():
+                members = members[~np.isnan(scores[members])]
+                self._orders[profile, line] = self._score_order(members, scores, ranks)
+                self._trees[profile, line] = self._price_tree(members, scores, prices)
+
+    @staticmethod
+    def _score_order(members, scores, ranks):
+        order = members[np.lexsort((members, -scores[members]))]
+        return ScoreOrder(order, scores[order], ranks[order])
+
+    @staticmethod
+    def _price_tree(members, scores, prices):
+        members = members[~np.isnan(prices[members])]
+        by_price = members[np.lexsort((members, prices[members]))]
+        slots = np.arange(len(by_price))
+        levels, width = [], 1
+        while True:
+            order = by_price[np.lexsort((by_price, -scores[by_price], slots // width))]
+            levels.append((-scores[order], order))
+            if width >= len(by_price):
+                break
+            width *= 2
+        return PriceTree(prices[by_price], levels)
+
+    def _check(self, profile, line):
+        if profile not in self.profiles:
+            raise KeyError(f"알 수 없는 프로필: {profile} ({', '.join(self.profiles)})")
+        if line is not None and line not in self.lines:
+            raise KeyError(f"알 수 없는 라인: {line} ({', '.join(self.lines)})")
+
+    # ─── 2. 조회 ───────────────────────────────────────────────────
+    def top(self, k=5, profile="종합", line=None, min_price=None, max_price=None):
+        """점수 상위 k개 (가격 조건이 있으면 가격이 없는 SKU는 제외)"""
+        self._check(profile, line)
+        if min_price is None and max_price is None:
+            return self.table.iloc[self._orders[profile, line].positions[:k]]
+        if not self.price_column:
+            raise KeyError("가격 컬럼이 없는 테이블")
+
+        tree = self._trees[profile, line]
+        lo = 0 if min_price is None else int(np.searchsorted(tree.prices, min_price, side="left"))
+        hi = len(tree.prices) if max_price is None else int(np.searchsorted(tree.prices, max_price, side="right"))
+
+        # [lo, hi)를 O(log n)개의 블록으로 나누고, 블록마다 이미 점수순인 목록을 필요한 k개만큼만 병합
+        runs, level = [], 0
+        while lo < hi:
+            if lo & 1:
+                runs.append(self._block(tree, level, lo))
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                runs.append(self._block(tree, level, hi))
+            lo, hi, level = lo >> 1, hi >> 1, level + 1
+
+        picked = [position for _, position in islice(heapq.merge(*runs), k)]
+        return self.table.iloc[picked]
+
+    @staticmethod
+    def _block(tree, level, block):
+        neg_scores, positions = tree.levels[level]
+        start, stop = block << level, (block + 1) << level
+        return zip(neg_scores[start:stop], positions[start:stop])
+
+    def rank_range(self, start=1, stop=10, profile="종합", line=None):
+        """전체 순위가 start 이상 stop 이하인 SKU (line을 주면 그 라인 안에서만)"""
+        self._check(profile, line)
+        order = self._orders[profile, line]
+        lo = np.searchsorted(order.ranks, start, side="left")
+        hi = np.searchsorted(order.ranks, stop, side="right")
+        return self.table.iloc[order.positions[lo:hi]]
+
+    def find(self, name):
+        """모델명이 정확히 같은 행 (앞뒤 공백 무시)"""
+        return self.table.iloc[self._names.get(name.strip(), [])]
+
+# ─── 3. 점수 테이블 로드 ───────────────────────────────────────────
+def load_indexes(month, parts=("cpu", "gpu"), data_dir=None):
+    """월별 엑셀을 점수화해 부품별 ScoreIndex 생성 (DB 없이 메모리에서만)"""
+    from common.ingest import read_workbook
+    from common.workbooks import DATA_DIR, find_workbook
+
+    indexes = {}
+    for part in parts:
+        path = find_workbook(part, month, data_dir or DATA_DIR)
+        if part == "cpu":
+            from common.cpu_priority import HEADER_ROW, cpu_total_table, score_cpu
+            table = cpu_total_table(score_cpu(read_workbook(path, header=HEADER_ROW)))
+        else:
+            from common.gpu_priority import HEADER_ROW, gpu_total_table, score_gpu
+            table = gpu_total_table(score_gpu(read_workbook(path, header=HEADER_ROW)))
+        indexes[part] = ScoreIndex(table)
+    return indexes
+
+# ─── 4. HTTP 래퍼 ──────────────────────────────────────────────────
+def _records(frame):
+    """DataFrame → JSON 직렬화 가능한 dict 목록 (NaN은 null)"""
+    return json.loads(frame.to_json(orient="records", force_ascii=False))
+
+def _number(params, key, default=None, cast=float):
+    return cast(params[key]) if key in params else default
+
+def handle_query(indexes, path, params):
+    """경로와 쿼리 파라미터로 조회 결과(dict 목록)를 만듦, 잘못된 요청은 KeyError/ValueError"""
+    part = params.get("part", "gpu")
+    if part not in indexes:
+        raise KeyError(f"알 수 없는 부품: {part} ({', '.join(indexes)})")
+    index = indexes[part]
+    profile, line = params.get("profile", "종합"), params.get("line")
+
+    if path == "/top":
+        return _records(index.top(
+            _number(params, "k", 5, int), profile, line,
+            _number(params, "min_price"), _number(params, "max_price")
+        ))
+    if path == "/ranks":
+        return _records(index.rank_range(_number(params, "start", 1, int), _number(params, "stop", 10, int), profile, line))
+    if path == "/sku":
+        return _records(index.find(params.get("name", "")))
+    raise KeyError(f"알 수 없는 경로: {path} (/top, /ranks, /sku)")
+
+def make_handler(indexes):
+    class QueryHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            try:
+                status, body = 200, handle_query(indexes, url.path, params)
+            except (KeyError, ValueError) as e:
+                status, body = 400, {"error": str(e.args[0] if e.args else e)}
+            payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    return QueryHandler
+
+def serve(indexes, host="127.0.0.1", port=8765):
+    """조회 서버 실행 (Ctrl+C로 종료)"""
+    server = ThreadingHTTPServer((host, port), make_handler(indexes))
+    print(f"✅ 조회 서버 시작: http://{host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CPU/GPU 점수 테이블 Top-K / 순위 조회 서버")
+    parser.add_argument("--month", required=True, help="대상 월 (예: 2025-06)")
+    parser.add_argument("--parts", default="cpu,gpu", help="불러올 부품 (쉼표 구분)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    serve(load_indexes(args.month, [p.strip() for p in args.parts.split(",") if p.strip()]), args.host, args.port)
@@ -0,0 +1,194 @@
+import numpy as np
+
+# 분위수 기반 스케일러(clip, rank)가 열마다 보관하는 최대 표본 수 (넘으면 균등 간격 순서 통계량으로 압축)
+MAX_SAMPLES = 100_000
+
+# ─── 0. 공통 ───────────────────────────────────────────────────────
+def _as_2d(X):
+    X = np.asarray(X, dtype=float)
+    return X.reshape(-1, 1) if X.ndim == 1 else X
+
+def _safe_scale(span):
+    """범위가 0(상수 열)이거나 NaN이면 1로 바꿔 나눗셈을 막음 (상수 열은 0으로 정규화됨)"""
+    return np.where((span == 0) | np.isnan(span), 1.0, span)
+
+class _Scaler:
+    """fit / partial_fit / transform 공통 틀 (NaN은 무시하고 학습, 변환 후에도 NaN 유지)"""
+
+    def fit(self, X):
+        self._reset()
+        return self.partial_fit(X)
+
+    def fit_transform(self, X):
+        return self.fit(X).transform(X)
+
+    def partial_fit(self, X):
+        raise NotImplementedError
+
+    def transform(self, X):
+        raise NotImplementedError
+
+    def _reset(self):
+        raise NotImplementedError
+
+# ─── 1. 최소-최대 ──────────────────────────────────────────────────
+class MinMaxScaler(_Scaler):
+    """열마다 (x - min) / (max - min), sklearn MinMaxScaler와 같은 연산 순서 (x * scale + offset)"""
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        self.data_min = None
+        self.data_max = None
+
+    def partial_fit(self, X):
+        X = _as_2d(X)
+        chunk_min, chunk_max = np.fmin.reduce(X, axis=0), np.fmax.reduce(X, axis=0)
+        if self.data_min is None:
+            self.data_min, self.data_max = chunk_min, chunk_max
+        else:
+            self.data_min, self.data_max = np.fmin(self.data_min, chunk_min), np.fmax(self.data_max, chunk_max)
+        return self
+
+    def transform(self, X):
+        scale = 1.0 / _safe_scale(self.data_max - self.data_min)
+        return _as_2d(X) * scale + (0.0 - self.data_min * scale)
+
+# ─── 2. 분위수 표본 (clip / rank 공용) ─────────────────────────────
+class _SampleScaler(_Scaler):
+    """열마다 정렬된 표본과 표본별 가중치(대표하는 행 수)를 유지
+
+    청크를 합칠 때 MAX_SAMPLES를 넘으면 누적 가중치 기준 균등 간격으로 압축 (분위수는 근사),
+    압축된 표본도 원래 행 수만큼의 가중치를 가지므로 나중 청크가 과대 반영되지 않음
+    """
+
+    def __init__(self, max_samples=MAX_SAMPLES):
+        self.max_samples = max_samples
+        self._reset()
+
+    def _reset(self):
+        self.samples = None
+        self.weights = None
+
+    def partial_fit(self, X):
+        X = _as_2d(X)
+        if self.samples is None:
+            self.samples = [np.empty(0) for _ in range(X.shape[1])]
+            self.weights = [np.empty(0) for _ in range(X.shape[1])]
+        for j in range(X.shape[1]):
+            col = X[:, j]
+            col = col[~np.isnan(col)]
+            values = np.concatenate([self.samples[j], col])
+            weights = np.concatenate([self.weights[j], np.ones(len(col))])
+            order = np.argsort(values, kind="stable")
+            values, weights = values[order], weights[order]
+            if len(values) > self.max_samples:
+                centers = self._centers(weights)
+                picks = np.interp(np.linspace(centers[0], centers[-1], self.max_samples), centers, np.arange(len(values)))
+                values = values[picks.round().astype(np.int64)]
+                weights = np.full(self.max_samples, weights.sum() / self.max_samples)
+            self.samples[j], self.weights[j] = values, weights
+        return self
+
+    @staticmethod
+    def _centers(weights):
+        """표본별 누적 가중치 중앙 위치 (가중치가 모두 1이면 0.5, 1.5, ...)"""
+        return np.cumsum(weights) - weights / 2
+
+    def _positions(self, j):
+        """표본별 분위 위치 0 ~ 1 (가중치가 모두 1이면 i / (n - 1))"""
+        centers = self._centers(self.weights[j])
+        span = centers[-1] - centers[0]
+        return (centers - centers[0]) / (span if span > 0 else 1.0)
+
+    def _percentiles(self, q):
+        return np.array([
+            np.interp(q / 100, self._positions(j), sample) if len(sample) else np.nan
+            for j, sample in enumerate(self.samples)
+        ])
+
+class ClippedMinMaxScaler(_SampleScaler):
+    """lower/upper 백분위수로 잘라낸 뒤 최소-최대 (가격이 튀는 SKU 하나가 나머지를 눌러버리지 않게)"""
+
+    def __init__(self, lower=1.0, upper=99.0, max_samples=MAX_SAMPLES):
+        self.lower = lower
+        self.upper = upper
+        super().__init__(max_samples)
+
+    def transform(self, X):
+        low, high = self._percentiles(self.lower), self._percentiles(self.upper)
+        scale = 1.0 / _safe_scale(high - low)
+        return np.clip(_as_2d(X), low, high) * scale + (0.0 - low * scale)
+
+class RankScaler(_SampleScaler):
+    """학습 표본 안에서의 백분위 순위 (최솟값 0, 최댓값 1, 동점은 평균 순위)"""
+
+    def transform(self, X):
+        X = _as_2d(X)
+        out = np.full(X.shape, np.nan)
+        for j, sample in enumerate(self.samples):
+            if not len(sample):
+                continue
+            weights = self.weights[j]
+            below = np.r_[0.0, np.cumsum(weights)]
+            left = below[np.searchsorted(sample, X[:, j], side="left")]
+            right = below[np.searchsorted(sample, X[:, j], side="right")]
+            # 가중치가 모두 1이면 (left + right - 1) / 2 / (n - 1)
+            span = below[-1] - (weights[0] + weights[-1]) / 2
+            ranks = ((left + right) / 2 - weights[0] / 2) / (span if span > 0 else 1.0)
+            out[:, j] = np.where(np.isnan(X[:, j]), np.nan, np.clip(ranks, 0.0, 1.0))
+        return out
+
+# ─── 3. 표준화 (z-score) ───────────────────────────────────────────
+class StandardScaler(_Scaler):
+    """열마다 (x - 평균) / 표준편차, 청크별 개수/평균/제곱편차합을 병합 (상수 열은 0)"""
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        self.count = None
+        self.mean = None
+        self.m2 = None
+
+    def partial_fit(self, X):
+        X = _as_2d(X)
+        valid = ~np.isnan(X)
+        n = valid.sum(axis=0).astype(float)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(n > 0, np.where(valid, X, 0.0).sum(axis=0) / n, 0.0)
+        m2 = np.where(valid, (X - mean) ** 2, 0.0).sum(axis=0)
+        if self.count is None:
+            self.count, self.mean, self.m2 = n, mean, m2
+            return self
+
+        # 병렬 분산 병합 (Chan et al.)
+        total = self.count + n
+        with np.errstate(invalid="ignore", divide="ignore"):
+            delta = mean - self.mean
+            weight = np.where(total > 0, n / total, 0.0)
+            self.mean = self.mean + delta * weight
+            self.m2 = self.m2 + m2 + delta ** 2 * self.count * weight
+        self.count = total
+        return self
+
+    def transform(self, X):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            std = np.sqrt(np.where(self.count > 0, self.m2 / self.count, np.nan))
+        mean = np.where(self.count > 0, self.mean, np.nan)
+        return (_as_2d(X) - mean) / _safe_scale(std)
+
+# ─── 4. 이름으로 생성 ──────────────────────────────────────────────
+SCALERS = {
+    "minmax": MinMaxScaler,
+    "clip": ClippedMinMaxScaler,
+    "rank": RankScaler,
+    "zscore": StandardScaler,
+}
+
+def make_scaler(name="minmax", **options):
+    """설정의 scaler 이름("minmax"/"clip"/"rank"/"zscore")과 옵션으로 스케일러 생성"""
+    if name not in SCALERS:
+        raise ValueError(f"알 수 없는 scaler: {name} ({', '.join(SCALERS)} 중 하나)")
+    return SCALERS[name](**options)
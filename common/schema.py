@@ -0,0 +1,92 @@
+import logging
+
+import numpy as np
+import pandas as pd
+
+from common.scoring import MISSING_RANK
+
+logger = logging.getLogger(__name__)
+
+# ─── 0. 컬럼 규칙 ──────────────────────────────────────────────────
+# 점수 테이블의 dtype 계약 (컬럼명으로 종류를 판단)
+# - line: 라인 → category (카테고리는 가나다순이라 라인 기준 정렬 결과가 문자열과 같음)
+# - text: *명 (CPU명, GPU명 등) → Arrow 문자열 (pandas가 지원할 때)
+# - score: *_norm, *_성능점수 → float32 (순위는 float64로 계산한 뒤 변환하므로 순위에는 영향 없음)
+# - rank: *_순위, 파레토_깊이 → Int16 (순위 없음 = 결측, DB에 쓸 때만 MISSING_RANK로 바꿈)
+#   값이 Int16 범위를 넘으면(SKU 32,767개 초과) Int32 / Int64로
+# 유효가중치_*는 min_weight 경계 비교에 쓰이므로 float64 유지
+
+def column_kind(name):
+    name = str(name)
+    if name == "라인":
+        return "line"
+    if name.endswith("_순위") or name == "파레토_깊이":
+        return "rank"
+    if name.endswith("_norm") or name.endswith("_성능점수"):
+        return "score"
+    if name.endswith("명"):
+        return "text"
+    return None
+
+def _text_dtype():
+    """NaN 결측을 쓰는 Arrow 문자열 (pandas 3의 기본 str과 같음), 지원하지 않으면 object 유지"""
+    try:
+        import pyarrow  # noqa: F401
+        return pd.StringDtype("pyarrow", na_value=np.nan)
+    except (ImportError, TypeError):
+        return None
+
+RANK_DTYPES = ["Int16", "Int32", "Int64"]
+
+def _rank_dtype(values):
+    """값 범위가 들어가는 가장 작은 nullable 정수 타입"""
+    low, high = values.min(), values.max()
+    if pd.isna(low):
+        return RANK_DTYPES[0]
+    return next(
+        dtype for dtype in RANK_DTYPES
+        if np.iinfo(dtype.lower()).min <= low and high <= np.iinfo(dtype.lower()).max
+    )
+
+# ─── 1. 스키마 적용 ────────────────────────────────────────────────
+def _cast(series, kind, lines):
+    if kind == "line":
+        if isinstance(series.dtype, pd.CategoricalDtype) and list(series.cat.categories) == lines:
+            return series
+        return pd.Categorical(series, categories=lines)
+    if kind == "score":
+        return series if series.dtype == np.float32 else series.astype(np.float32)
+    if kind == "rank":
+        values = pd.to_numeric(series, errors="coerce")
+        dtype = _rank_dtype(values)
+        return series if series.dtype == dtype else values.astype(dtype)
+    dtype = _text_dtype()
+    return series if dtype is None or series.dtype == dtype else series.astype(dtype)
+
+def enforce(df, config, required=(), label=None):
+    """단계 경계에서 dtype 계약을 적용 (컬럼을 제자리에서 바꾸며 복사본을 만들지 않음)
+
+    - required: 반드시 있어야 하는 컬럼, 없으면 ValueError
+    - label: 주면 적용 전/후 메모리 사용량을 debug 로그로 남김
+    """
+    missing = [col for col in required if col not in df.columns]
+    if missing:
+        raise ValueError(f"스키마 위반: {', '.join(map(str, missing))} 컬럼 없음")
+
+    report = label and logger.isEnabledFor(logging.DEBUG)
+    before = df.memory_usage(deep=True).sum() if report else None
+    lines = sorted(config.lines)
+    for col in df.columns:
+        kind = column_kind(col)
+        if kind:
+            df[col] = _cast(df[col], kind, lines)
+
+    if report:
+        after = df.memory_usage(deep=True).sum()
+        logger.debug("%s 메모리: %.1fKB → %.1fKB (%+.0f%%)", label, before / 1024, after / 1024, (after - before) / max(before, 1) * 100)
+    return df
+
+# ─── 2. DB 경계 ────────────────────────────────────────────────────
+def fill_missing_ranks(df, columns):
+    """DB에 쓸 순위 컬럼의 결측을 MISSING_RANK(999)로 채움 (DB 쪽 계약은 그대로 유지)"""
+    return df.assign(**{col: pd.to_numeric(df[col], errors="coerce").fillna(MISSING_RANK).astype(int) for col in columns})
@@ -0,0 +1,101 @@
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+# 프로필별 점수 계산 결과 (모든 배열은 SKU × 프로필)
+ProfileScores = namedtuple("ProfileScores", ["scores", "weight_sums", "ranks", "line_ranks"])
+
+# DB 쪽 순위 컬럼은 순위 없음을 999로 저장 (점수 테이블에서는 결측, schema.fill_missing_ranks로 변환)
+MISSING_RANK = 999
+
+# ─── 1. 가중치 벡터/행렬 생성 ─────────────────────────────────────
+def weight_vector(weights, columns):
+    """{컬럼명: 가중치} dict를 columns 순서의 가중치 벡터로 변환 (없는 컬럼은 0)"""
+    return np.array([weights.get(col, 0.0) for col in columns], dtype=float)
+
+def weight_matrix(profiles, columns):
+    """{프로필명: {컬럼명: 가중치}} dict를 (프로필 × 특성) 가중치 행렬로 변환"""
+    return np.vstack([weight_vector(weights, columns) for weights in profiles.values()])
+
+# ─── 2. 점수 계산 (NaN 마스킹 + 유효 가중치 재정규화) ─────────────
+def compute_profile_scores(values, weights, min_weight=0.5, renormalize=True):
+    """정규화 행렬(SKU × 특성)과 가중치 행렬(프로필 × 특성)로 모든 프로필 점수를 한 번에 계산
+
+    - renormalize=True: NaN 특성은 가중치에서 제외하고 남은 |가중치| 합을 유효 가중치로 사용,
+      유효 가중치 < min_weight 이면 NaN, 1.0 미만이면 1 / 유효 가중치 로 재정규화
+    - renormalize=False: 가중치가 0이 아닌 특성 중 하나라도 NaN이면 점수는 NaN
+    """
+    values = np.asarray(values, dtype=float)
+    weights = np.atleast_2d(np.asarray(weights, dtype=float))
+    valid = ~np.isnan(values)
+    filled = np.where(valid, values, 0.0)
+
+    # BLAS 행렬곱은 행 위치에 따라 반올림이 달라져 동점이 깨지므로,
+    # (SKU × 프로필) 전체를 특성 순서대로 누적해 기존 합산 순서와 같은 값을 만든다
+    weight_sums = np.zeros((values.shape[0], weights.shape[0]))
+    for j in range(weights.shape[1]):
+        weight_sums += valid[:, j, None] * np.abs(weights[:, j])
+
+    if renormalize:
+        with np.errstate(divide="ignore"):
+            scale = np.where(weight_sums < 1.0, 1.0 / weight_sums, 1.0)
+    else:
+        scale = 1.0
+
+    # 유효 가중치가 0인 행은 scale이 inf (0 × inf = NaN), 아래에서 어차피 NaN으로 덮음
+    scores = np.zeros_like(weight_sums)
+    with np.errstate(invalid="ignore"):
+        for j in range(weights.shape[1]):
+            scores += filled[:, j, None] * weights[:, j] * scale
+
+    if renormalize:
+        scores[weight_sums < min_weight] = np.nan
+    else:
+        scores[(~valid) @ (weights != 0).T] = np.nan
+    return scores, weight_sums
+
+# ─── 3. 순위 계산 (rank(ascending=False, method='min')과 동일) ─────
+def rank_desc(scores, groups=None, na_option="keep"):
+    """점수 행렬의 열마다 내림차순 min 순위를 계산
+
+    - groups: SKU별 그룹 코드 (음수는 그룹 없음 → 순위 없음), None이면 전체 순위
+    - na_option="keep": 순위 없는 행은 NaN, "bottom": 그룹 내 유효 개수 + 1
+    - 반환값은 float 배열 (순위는 정수값, 결측은 NaN → DB에 쓸 때만 MISSING_RANK로 채움)
+    """
+    scores = np.atleast_2d(np.asarray(scores, dtype=float).T).T
+    n = scores.shape[0]
+    codes = np.zeros(n, dtype=np.int64) if groups is None else np.asarray(groups, dtype=np.int64)
+    ranks = np.full(scores.shape, np.nan)
+    positions = np.arange(n)
+
+    for j in range(scores.shape[1]):
+        col = scores[:, j]
+        valid = ~np.isnan(col) & (codes >= 0)
+        idx = positions[valid]
+        order = np.lexsort((-col[idx], codes[idx]))
+        idx, sorted_codes, sorted_vals = idx[order], codes[idx][order], col[idx][order]
+
+        k = np.arange(len(idx))
+        new_group = np.r_[True, sorted_codes[1:] != sorted_codes[:-1]][:len(idx)]
+        new_value = new_group | np.r_[True, sorted_vals[1:] != sorted_vals[:-1]][:len(idx)]
+        group_start = np.maximum.accumulate(np.where(new_group, k, 0))
+        tie_start = np.maximum.accumulate(np.where(new_value, k, 0))
+        ranks[idx, j] = tie_start - group_start + 1
+
+        if na_option == "bottom" and groups is None:
+            ranks[~valid, j] = len(idx) + 1
+    return ranks
+
+def line_codes(lines):
+    """라인 값 배열을 그룹 코드로 변환 (결측은 -1)"""
+    codes, _ = pd.factorize(pd.Series(lines, dtype=object))
+    return codes
+
+# ─── 4. 다중 프로필 일괄 점수/순위 ─────────────────────────────────
+def score_profiles(values, weights, lines=None, min_weight=0.5, renormalize=True, na_option="keep"):
+    """(프로필 × 특성) 가중치 행렬로 점수, 유효 가중치, 전체 순위, 라인 내 순위를 한 번에 계산"""
+    scores, weight_sums = compute_profile_scores(values, weights, min_weight, renormalize)
+    ranks = rank_desc(scores, na_option=na_option)
+    line_ranks = None if lines is None else rank_desc(scores, groups=line_codes(lines))
+    return ProfileScores(scores, weight_sums, ranks, line_ranks)
@@ -0,0 +1,122 @@
+import os
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+from common.scalers import SCALERS
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+
+CONFIG_PATH = os.environ.get(
+    "COMHERE_SCORING_CONFIG",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config", "scoring.toml")
+)
+
+NA_RANK_OPTIONS = ("keep", "bottom")
+WEIGHT_TOLERANCE = 1e-9  # 가중치 합 비교 시 부동소수점 오차 허용치
+
+# 파트별로 컴파일된 점수 설정 (배열은 한 번만 만들어 점수 엔진에 그대로 넘김)
+# - columns: {엑셀 열 위치: 컬럼명}
+# - tiers: 라인별 벤치마크 선택 규칙 목록 (TierRule)
+# - scaler / scaler_options: 정규화 방식 (common.scalers.make_scaler 인자)
+# - score_columns: features 순서의 정규화 컬럼명 (invert 대상은 *_반전_norm)
+# - weights: (프로필 × 특성) 가중치 행렬
+# - pareto_benefit / pareto_cost: 파레토 지배 깊이 축 (클수록 / 작을수록 좋은 컬럼, 비어 있으면 계산 안 함)
+ScoringConfig = namedtuple("ScoringConfig", [
+    "part", "header_row", "name_column", "line_value_column", "columns", "price_column", "lines", "tiers",
+    "features", "inverted", "scaler", "scaler_options", "score_columns", "profile_names", "weights",
+    "renormalize", "min_weight", "na_rank", "pareto_benefit", "pareto_cost",
+])
+
+# 라인별 벤치마크 선택 규칙
+# - columns: 후보 열 목록, index: 라인 코드(lines 위치)별 후보 열 위치 (-1은 선택 없음)
+TierRule = namedtuple("TierRule", ["target", "columns", "index"])
+
+# ─── 1. 설정 파일 읽기 ─────────────────────────────────────────────
+@lru_cache(maxsize=None)
+def read_config(path=CONFIG_PATH):
+    """TOML 설정 파일을 dict로 읽음 (경로별로 한 번만)"""
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+# ─── 2. 컴파일 (검증 + 인덱스/가중치 배열) ─────────────────────────
+def _check_known(part, section, names, known):
+    unknown = [name for name in names if name not in known]
+    if unknown:
+        raise ValueError(f"[{part}.{section}] 알 수 없는 컬럼: {', '.join(unknown)}")
+
+def compile_config(part, raw):
+    """[part] 섹션을 ScoringConfig로 변환 (컬럼명 오타는 여기서 ValueError)"""
+    columns = {int(pos): name for pos, name in sorted(raw["columns"].items(), key=lambda item: int(item[0]))}
+    lines = list(raw["lines"])
+    known = set(columns.values())
+
+    tiers = []
+    for target, mapping in raw.get("tiers", {}).items():
+        if not mapping:
+            raise ValueError(f"[{part}.tiers.{target}] 라인별 벤치마크가 하나도 없음")
+        _check_known(part, f"tiers.{target}", mapping, set(lines))
+        _check_known(part, f"tiers.{target}", mapping.values(), known)
+        tier_columns = list(dict.fromkeys(mapping.values()))
+        index = np.array([tier_columns.index(mapping[line]) if line in mapping else -1 for line in lines], dtype=np.int64)
+        tiers.append(TierRule(target, tier_columns, index))
+        known.add(target)
+
+    features = list(raw["features"]["normalize"])
+    inverted = list(raw["features"].get("invert", []))
+    _check_known(part, "features.normalize", features, known)
+    _check_known(part, "features.invert", inverted, set(features))
+    scaler = raw["features"].get("scaler", "minmax")
+    if scaler not in SCALERS:
+        raise ValueError(f"[{part}.features] scaler는 {tuple(SCALERS)} 중 하나여야 함: {scaler}")
+    score_columns = [f"{col}_반전_norm" if col in inverted else f"{col}_norm" for col in features]
+
+    profiles = raw["profiles"]
+    for name, weights in profiles.items():
+        _check_known(part, f"profiles.{name}", weights, set(features))
+    weights = np.array([[float(w.get(col, 0.0)) for col in features] for w in profiles.values()])
+
+    # |가중치| 합이 min_weight 미만이면 모든 점수가 NaN, 1을 넘으면 재정규화(1 / 유효 가중치)가 어긋남
+    min_weight = float(raw.get("min_weight", 0.5))
+    for name, total in zip(profiles, np.abs(weights).sum(axis=1)):
+        if not min_weight - WEIGHT_TOLERANCE <= total <= 1.0 + WEIGHT_TOLERANCE:
+            raise ValueError(f"[{part}.profiles.{name}] |가중치| 합은 min_weight({min_weight}) 이상 1 이하여야 함: {total:g}")
+
+    na_rank = raw.get("na_rank", "keep")
+    if na_rank not in NA_RANK_OPTIONS:
+        raise ValueError(f"[{part}] na_rank는 {NA_RANK_OPTIONS} 중 하나여야 함: {na_rank}")
+
+    return ScoringConfig(
+        part=part,
+        header_row=int(raw["header_row"]),
+        name_column=raw["name_column"],
+        line_value_column=raw["line_value_column"],
+        columns=columns,
+        price_column=raw.get("price_column"),
+        lines=lines,
+        tiers=tiers,
+        features=features,
+        inverted=inverted,
+        scaler=scaler,
+        scaler_options=dict(raw["features"].get("scaler_options", {})),
+        score_columns=score_columns,
+        profile_names=list(profiles),
+        weights=weights,
+        renormalize=bool(raw.get("renormalize", True)),
+        min_weight=min_weight,
+        na_rank=na_rank,
+        pareto_benefit=list(raw.get("pareto", {}).get("benefit", [])),
+        pareto_cost=list(raw.get("pareto", {}).get("cost", [])),
+    )
+
+@lru_cache(maxsize=None)
+def load_config(part, path=CONFIG_PATH):
+    """파트("cpu"/"gpu")의 컴파일된 점수 설정 (프로세스당 한 번만 컴파일)"""
+    raw = read_config(path)
+    if part not in raw:
+        raise KeyError(f"{path}에 [{part}] 섹션이 없음")
+    return compile_config(part, raw[part])
@@ -0,0 +1,99 @@
+import glob
+import hashlib
+import os
+from collections import namedtuple
+
+import pandas as pd
+
+from common.connection import backend, db_config, sqlite_path
+
+SNAPSHOT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", ".snapshots")
+
+# inserted/updated: 파라미터 튜플 리스트, deleted: 키 리스트
+RowDiff = namedtuple("RowDiff", ["inserted", "updated", "deleted"])
+
+# ─── 1. 행 내용 해시 ───────────────────────────────────────────────
+def row_hashes(rows):
+    """rows = [(키, 값1, ...)] → 키별 내용 해시 Series (uint64)"""
+    if not rows:
+        return pd.Series([], index=pd.Index([], dtype=object), dtype="uint64")
+    frame = pd.DataFrame(rows).astype(str)
+    hashes = pd.Series(pd.util.hash_pandas_object(frame, index=False).to_numpy(), index=frame[0].to_numpy(), dtype="uint64")
+    # 같은 키가 여러 번 나오면 마지막 행 기준 (last_per_key와 동일)
+    return hashes[~hashes.index.duplicated(keep="last")]
+
+def diff_rows(rows, previous):
+    """이전 스냅샷(키 → 해시)과 비교해 새로 생긴/바뀐 행과 사라진 키를 구함"""
+    current = row_hashes(rows)
+    known = current.index.isin(previous.index)
+    changed = known.copy()
+    changed[known] = current[known].to_numpy() != previous.reindex(current.index[known]).to_numpy()
+
+    by_key = {row[0]: row for row in rows}
+    return RowDiff(
+        inserted=[by_key[k] for k in current.index[~known]],
+        updated=[by_key[k] for k in current.index[changed]],
+        deleted=list(previous.index[~previous.index.isin(current.index)]),
+    )
+
+# ─── 2. 스냅샷 저장소 ──────────────────────────────────────────────
+def _db_id(target):
+    """같은 테이블이라도 접속 대상(DB)이 다르면 다른 스냅샷"""
+    if backend(target) == "sqlite":
+        identity = "sqlite:" + os.path.abspath(sqlite_path(target))
+    else:
+        config = db_config(target)
+        identity = f"mysql:{config['host']}:{config['port']}/{config['database']}"
+    return hashlib.sha1(identity.encode()).hexdigest()[:12]
+
+class Snapshot:
+    """마지막으로 DB에 반영한 (키 → 내용 해시) 목록, 테이블 + 반영 컬럼 단위로 Parquet에 보관"""
+
+    def __init__(self, target, table, key_column, columns, snapshot_dir=SNAPSHOT_DIR):
+        self.target = target
+        self.table = table
+        self.snapshot_dir = snapshot_dir
+        spec = hashlib.sha1("|".join([key_column, *columns]).encode()).hexdigest()[:8]
+        self.path = os.path.join(snapshot_dir, f"{_db_id(target)}-{table}-{spec}.parquet")
+
+    def load(self):
+        """이전 스냅샷 (없거나 pyarrow가 없으면 None → 전체 반영)"""
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            return None
+        if not os.path.exists(self.path):
+            return None
+        table = pd.read_parquet(self.path)
+        return pd.Series(table["hash"].to_numpy(), index=table["key"].to_numpy(), dtype="uint64")
+
+    def diff(self, rows):
+        """이전 스냅샷 대비 변경분, 스냅샷이 없으면 None"""
+        previous = self.load()
+        return None if previous is None else diff_rows(rows, previous)
+
+    def save(self, rows):
+        """DB 반영이 끝난 rows를 새 스냅샷으로 기록 (임시 파일에 쓴 뒤 교체)"""
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            return
+        hashes = row_hashes(rows)
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        tmp = self.path + ".tmp"
+        pd.DataFrame({"key": hashes.index.astype(str), "hash": hashes.to_numpy()}).to_parquet(tmp, index=False)
+        os.replace(tmp, self.path)
+
+    def siblings(self):
+        """같은 테이블의 다른 컬럼 스냅샷 경로 (행이 추가/삭제/재적재되면 함께 무효화)"""
+        pattern = os.path.join(self.snapshot_dir, f"{_db_id(self.target)}-{glob.escape(self.table)}-*.parquet")
+        return [path for path in glob.glob(pattern) if path != self.path]
+
+    def invalidate_siblings(self, keys=None):
+        """keys가 None이면 같은 테이블의 다른 스냅샷을 모두 삭제, 아니면 해당 키만 제거"""
+        for path in self.siblings():
+            if keys is None:
+                os.remove(path)
+                continue
+            table = pd.read_parquet(path)
+            table[~table["key"].isin(list(keys))].to_parquet(path, index=False)
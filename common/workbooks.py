@@ -0,0 +1,34 @@
+import os
+import re
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+# 'CPU 가성비 (25년 6월) v1.0.xlsx', '그래픽카드 가성비 (25년 6월) v1.1.xlsx'
+WORKBOOK_PATTERN = re.compile(r"^(?P<label>CPU|그래픽카드) 가성비 \((?P<year>\d{2})년 (?P<month>\d{1,2})월\).*\.xlsx$")
+PART_LABELS = {"CPU": "cpu", "그래픽카드": "gpu"}
+
+# ─── 1. 파일명 → (부품, 월) ────────────────────────────────────────
+def parse_workbook_name(filename):
+    """엑셀 파일명에서 (부품, 'YYYY-MM')를 추출, 형식이 다르면 None"""
+    match = WORKBOOK_PATTERN.match(os.path.basename(filename))
+    if not match:
+        return None
+    month = f"20{match.group('year')}-{int(match.group('month')):02d}"
+    return PART_LABELS[match.group("label")], month
+
+# ─── 2. 엑셀 찾기 ──────────────────────────────────────────────────
+def discover_workbooks(data_dir=DATA_DIR):
+    """data_dir의 모든 월별 엑셀 → [(부품, 'YYYY-MM', 경로)] (부품, 월 순 정렬)"""
+    found = []
+    for name in os.listdir(data_dir):
+        parsed = parse_workbook_name(name)
+        if parsed:
+            found.append((*parsed, os.path.join(data_dir, name)))
+    return sorted(found)
+
+def find_workbook(part, month, data_dir=DATA_DIR):
+    """부품/월에 해당하는 엑셀 경로 (같은 월이 여러 개면 파일명 기준 마지막 버전)"""
+    matches = [path for p, m, path in discover_workbooks(data_dir) if p == part and m == month]
+    if not matches:
+        raise FileNotFoundError(f"{part} {month} 엑셀을 찾을 수 없습니다: {data_dir}")
+    return matches[-1]
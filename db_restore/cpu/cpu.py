@@ -1,84 +1,34 @@
-import re
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
-import json
-import mysql.connector
-from mysql.connector import Error
-from pcpartpicker import API
 from datetime import datetime
 
-# ─── 1. 모델명 정규화 ─────────────────────────────────────────────
-def normalize_cpu_model(name: str) -> str:
-    if not name:
-        return ""
-
-    name = name.strip()
-
-    # 한글 모델명을 영문으로 변환
-    replacements = {
-        "코어 울트라": "Core Ultra",
-        "코어": "Intel Core ",
-        "라이젠": "AMD Ryzen ",
-        "펜티엄 골드 ": "Intel Pentium Gold ",
-        "애슬론 ": "AMD Athlon ",
-        "셀러론 ": "Intel Celeron ",
-    }
-    for kr, en in replacements.items():
-        name = name.replace(kr, en)
-
-    # AMD A107700K 같은 경우 → AMD A10-7700K로 바꾸기
-    name = re.sub(r'\b(A\d{2})(\d{4})([A-Z]*)\b', r'\1-\2\3', name, flags=re.IGNORECASE)
-    name = re.sub(r'\b(FX)(\d{4})([A-Z]*)\b', r'\1-\2\3', name, flags=re.IGNORECASE)
-    name = re.sub(r'\b(i[3579])(\d{4})([A-Z]*)\b', r'\1-\2\3', name, flags=re.IGNORECASE)
-
-    # 특수문자 중 하이픈은 유지하고 나머지만 제거
-    name = re.sub(r'[^\w\s\-]', '', name)
-
-    # 다중 공백 제거
-    name = re.sub(r'\s+', ' ', name)
-
-    return name.strip()
-
-# ─── 2. 제외 대상 필터링 ─────────────────────────────────────────
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from common.catalog import load_catalog_index
+from common.connection import create_mysql_connection, db_errors
+from common.db import sync_table
+from common.fuzzy import TrigramIndex, write_match_audit
+from common.ingest import read_workbook
+from common.normalizer import normalize_cpu_model
+from common.parts_api import fetch_parts
+from common.snapshot import Snapshot
+
+# ─── 1. 제외 대상 필터링 ─────────────────────────────────────────
 def is_excludable_cpu_model(model):
     model = model.lower()
     return any(keyword in model for keyword in ["xeon", "epyc", "platinum", "opteron"])
 
-# ─── 3. JSON 모델 로드 ───────────────────────────────────────────
+# ─── 2. JSON 모델 로드 ───────────────────────────────────────────
 def load_json_cpu_models(json_path):
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    models_dict = {}  # normalized_name → detailed_info
-
-    for item in data:
-        model = item.get("name", "").strip()  # ← "model" → "name"
-        if model and not is_excludable_cpu_model(model):
-            normalized = normalize_cpu_model(model)
-
-            detailed_info = {
-                'model': model,
-                'normalized_model': normalized,
-                'cores': item.get('core_count'),
-                'threads': item.get('core_count') * 2 if item.get('smt') else item.get('core_count'),
-                'base_clock': item.get('core_clock'),
-                'boost_clock': item.get('boost_clock'),
-                'tdp': item.get('tdp'),
-                'graphics': item.get('graphics'),
-                'smt': item.get('smt'),
-                'price': item.get('price')
-            }
-
-            models_dict[normalized] = detailed_info
-
-    return models_dict
+    """정규화명 → CpuRecord 인덱스 (cpu.json이 바뀌었을 때만 다시 파싱, 평소에는 메모리 맵 로드)"""
+    return load_catalog_index(json_path, "cpu", exclude=is_excludable_cpu_model)
 
 # ─── . JSON 모델 로드 (API 전용) ───────────────────────────────────────────
-def load_api_cpu_models(region="us"):
+def load_api_cpu_models(region="us", client=None):
+    """API(또는 캐시/스텁) CPU 목록 → 정규화명 → 상세 정보"""
     try:
-        api = API(region)
-        cpu_data = api.retrieve("cpu")
-        cpu_dict = json.loads(cpu_data.to_json())
-        raw_list = cpu_dict.get("cpu", [])
+        raw_list = fetch_parts("cpu", region, client)
 
         print(f"📊 API에서 수신한 CPU 수: {len(raw_list)}")
 
@@ -138,7 +88,7 @@ def load_api_cpu_models(region="us"):
 
 
 
-# ─── 4. 엑셀 → 정규화 후보군 추출 ────────────────────────────────
+# ─── 3. 엑셀 → 정규화 후보군 추출 ────────────────────────────────
 def create_cpu_variants(df, first_column):
     variants = []
     excluded = []
@@ -164,7 +114,7 @@ def create_cpu_variants(df, first_column):
     return variants, excluded
 
 
-# ─── 5. 조건별 매칭 수행 ────────────────────────────────────────
+# ─── 4. 조건별 매칭 수행 ────────────────────────────────────────
 # def match_cpu_variants(variants, json_models_dict, api_models_dict):
 #     matched = []
 #     unmatched = []
@@ -195,7 +145,8 @@ def create_cpu_variants(df, first_column):
 #         seen.add(orig)
 
 #     return matched, unmatched
-def match_cpu_variants(variants, json_models_dict, api_models_dict):
+def match_cpu_variants(variants, json_models_dict, api_models_dict, fuzzy_index=None):
+    """정확히 일치(JSON → API) 우선, 없으면 fuzzy_index(JSON 이름 trigram 색인)로 유사 매칭"""
     matched = []
     unmatched = []
     seen = set()
@@ -211,14 +162,27 @@ def match_cpu_variants(variants, json_models_dict, api_models_dict):
             matched.append({
                 "original": orig,
                 "normalized_name": norm,
+                "match_type": "JSON",
+                "score": 1.0,
                 "cpu_details": json_models_dict[norm]
             })
         elif norm in api_models_dict:
             matched.append({
                 "original": orig,
                 "normalized_name": norm,
+                "match_type": "API",
+                "score": 1.0,
                 "cpu_details": api_models_dict[norm]
             })
+        elif fuzzy_index and (fuzzy := fuzzy_index.best_match(norm)):
+            # 예: 'Intel Core i5-12400F DDR4' → 'Intel Core i5-12400F' (모델 번호가 같은 후보만)
+            matched.append({
+                "original": orig,
+                "normalized_name": norm,
+                "match_type": "JSON_FUZZY",
+                "score": round(fuzzy[1], 4),
+                "cpu_details": json_models_dict[fuzzy[0]]
+            })
         else:
             unmatched.append((orig, norm))  # ⬅️ 튜플로 저장
 
@@ -228,24 +192,7 @@ def match_cpu_variants(variants, json_models_dict, api_models_dict):
 
 
 
-# ─── 6. MySQL 데이터베이스 연결 ────────────────────────────────
-def create_mysql_connection():
-    try:
-        connection = mysql.connector.connect(
-            host='152.69.235.49',
-            port=3306,       # MySQL 서버 주소
-            database='comhere',       # 데이터베이스 이름
-            user='comhere88',    # MySQL 사용자명
-            password='comHere88512!' # MySQL 비밀번호
-        )
-        if connection.is_connected():
-            print("✅ MySQL 데이터베이스 연결 성공")
-            return connection
-    except Error as e:
-        print(f"❌ MySQL 연결 실패: {e}")
-        return None
-
-# ─── 7. 매칭된 CPU 정보 저장 ────────────────────────────────────
+# ─── 6. 매칭된 CPU 정보 저장 ────────────────────────────────────
 # def save_cpu_matched_data(connection, matched_cpu_data):
 #     if not matched_cpu_data:
 #         print("💾 저장할 CPU 매칭 데이터가 없습니다.")
@@ -321,14 +268,12 @@ def create_mysql_connection():
 #         cursor.close()
 #         return 0
 
-# ─── 7. 매칭 + 매칭 안된 CPU 정보 저장 ────────────────────────────────────
-def save_cpu_matched_data(connection, matched_cpu_data, unmatched_cpu_list):
+# ─── 6. 매칭 + 매칭 안된 CPU 정보 저장 ────────────────────────────────────
+def save_cpu_matched_data(connection, matched_cpu_data, unmatched_cpu_list, chunk_size=500, incremental=False):
     if not matched_cpu_data and not unmatched_cpu_list:
         print("💾 저장할 CPU 데이터가 없습니다.")
         return 0
 
-    cursor = connection.cursor()
-
     create_table_query = """
     CREATE TABLE IF NOT EXISTS cpu_detailed_matches (
         cpu_id INT AUTO_INCREMENT PRIMARY KEY,
@@ -342,35 +287,12 @@ def save_cpu_matched_data(connection, matched_cpu_data, unmatched_cpu_list):
         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
     """
-    try:
-        cursor.execute(create_table_query)
-        connection.commit()
-        print("✅ 테이블 생성/확인 완료")
-    except Error as e:
-        print(f"❌ 테이블 생성 실패: {e}")
-        cursor.close()
-        return 0
-
-    try:
-        cursor.execute("DELETE FROM cpu_detailed_matches")
-        connection.commit()
-        cursor.execute("ALTER TABLE cpu_detailed_matches AUTO_INCREMENT = 1")
-        connection.commit()
-        print("🗑️ 기존 데이터 삭제 및 AUTO_INCREMENT 초기화 완료")
-    except Error as e:
-        print(f"⚠️ 데이터 삭제 또는 AUTO_INCREMENT 초기화 실패: {e}")
-
-    insert_query = """
-    INSERT INTO cpu_detailed_matches (
-        model, cores, threads, base_clock_ghz, boost_clock_ghz, tdp_watt, graphics
-    ) VALUES (%s, %s, %s, %s, %s, %s, %s)
-    """
-
-    inserted_count = 0
+    columns = ["model", "cores", "threads", "base_clock_ghz", "boost_clock_ghz", "tdp_watt", "graphics"]
 
+    rows = []
     for match in matched_cpu_data:
         details = match["cpu_details"]
-        data_tuple = (
+        rows.append((
             match["normalized_name"],
             int(details.get("cores", 0)) if details.get("cores") else None,
             int(details.get("threads", 0)) if details.get("threads") else None,
@@ -378,51 +300,43 @@ def save_cpu_matched_data(connection, matched_cpu_data, unmatched_cpu_list):
             float(details.get("boost_clock", 0)) if details.get("boost_clock") else None,
             int(details.get("tdp", 0)) if details.get("tdp") else None,
             details.get("graphics")
-        )
-        try:
-            cursor.execute(insert_query, data_tuple)
-            inserted_count += 1
-        except Error as e:
-            print(f"❌ 데이터 삽입 실패 ({match['normalized_name']}): {e}")
-
-    for original, normalized in unmatched_cpu_list:
-        try:
-            cursor.execute(insert_query, (normalized, None, None, None, None, None, None))
-            inserted_count += 1
-        except Error as e:
-            print(f"❌ 매칭 실패 모델 삽입 실패 ({normalized}): {e}")
+        ))
+    rows.extend((normalized, None, None, None, None, None, None) for _, normalized in unmatched_cpu_list)
 
+    # shadow 테이블에 적재 후 교체 → 재적재 중에도 기존 데이터가 계속 보임 (증분 모드면 바뀐 모델만 INSERT/UPDATE/DELETE)
     try:
-        connection.commit()
-        cursor.close()
+        snapshot = Snapshot("default", "cpu_detailed_matches", "model", columns)
+        inserted_count = sync_table(connection, "cpu_detailed_matches", create_table_query, "model", columns, rows, snapshot, incremental, chunk_size)
         print(f"✅ CPU 데이터 {inserted_count}개 저장 완료 (매칭 + 미매칭 포함)")
         return inserted_count
-    except Error as e:
-        print(f"❌ 커밋 실패: {e}")
-        connection.rollback()
-        cursor.close()
+    except db_errors() as e:
+        print(f"❌ CPU 데이터 재적재 실패: {e}")
         return 0
 
 
 
-# ─── 8. 메인 실행 함수 ─────────────────────────────────────────
-def main_cpu(excel_path, json_path):
-    df = pd.read_excel(excel_path, engine='openpyxl')
+# ─── 7. 메인 실행 함수 ─────────────────────────────────────────
+def match_cpu(excel_path, json_path, audit_path=None, client=None):
+    """엑셀의 CPU명을 JSON/API 모델과 매칭 → (matched, unmatched, excluded), audit_path가 있으면 매칭 내역 CSV 저장"""
+    # 엑셀 / JSON / API 로드는 서로 독립 → 스레드 풀에서 동시에
+    print("📦 엑셀 / JSON 모델 / API CPU 데이터 동시 로드 중...")
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        excel_future = pool.submit(read_workbook, excel_path)
+        json_future = pool.submit(load_json_cpu_models, json_path)
+        api_future = pool.submit(load_api_cpu_models, "us", client)
+    df = excel_future.result()
+    json_models_dict = json_future.result()
+    api_models_dict = api_future.result()
+
     df = df.drop(index=list(range(0, 4)) + list(range(129, len(df))))
     first_col = df.columns[0]
 
-    print("📦 JSON 모델 로드 중...")
-    json_models_dict = load_json_cpu_models(json_path)
-
-    print("🌐 API CPU 데이터 로드 중...")
-    api_models_dict = load_api_cpu_models()
-
     variants, excluded = create_cpu_variants(df, first_col)
-    matched, unmatched = match_cpu_variants(variants, json_models_dict, api_models_dict)
+    matched, unmatched = match_cpu_variants(variants, json_models_dict, api_models_dict, TrigramIndex(json_models_dict))
 
     print("\n🎯 매칭 결과 요약")
     print("=" * 60)
-    print(f"✅ 매칭 성공: {len(matched)}개")
+    print(f"✅ 매칭 성공: {len(matched)}개 (유사 매칭 {sum(m['match_type'] == 'JSON_FUZZY' for m in matched)}개)")
     print(f"❌ 매칭 실패: {len(unmatched)}개")
     print(f"🚫 제외된 항목: {len(excluded)}개")
 
@@ -431,15 +345,27 @@ def main_cpu(excel_path, json_path):
         for m in matched:
             d = m["cpu_details"]
             print(f"- {m['original']} → {d['model']} ({d.get('source', 'json')}), {d.get('cores')}C/{d.get('threads')}T, {d.get('base_clock')}→{d.get('boost_clock')}GHz, {d.get('tdp')}W")
+            if m["match_type"] == "JSON_FUZZY":
+                print(f"    ↳ 유사 매칭 (점수 {m['score']})")
+
+    if audit_path:
+        write_match_audit(audit_path, [
+            (m["original"], m["normalized_name"], m["cpu_details"]["model"], m["match_type"], m["score"]) for m in matched
+        ] + [(orig, norm, "", "UNMATCHED", "") for orig, norm in unmatched])
+
+    return matched, unmatched, excluded
+
+def main_cpu(excel_path, json_path, incremental=False, audit_path=None):
+    matched, unmatched, _ = match_cpu(excel_path, json_path, audit_path)
 
     connection = create_mysql_connection()
     if connection:
-        save_cpu_matched_data(connection, matched, unmatched)
+        save_cpu_matched_data(connection, matched, unmatched, incremental=incremental)
         connection.close()
         print("🔌 MySQL 연결 종료")
 
 
-# ─── 9. 실행 경로 지정 ─────────────────────────────────────────
+# ─── 8. 실행 경로 지정 ─────────────────────────────────────────
 if __name__ == "__main__":
     excel_path = 'data/CPU 가성비 (25년 6월) v1.0.xlsx'
     json_path = 'cpu.json'
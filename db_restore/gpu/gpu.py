@@ -1,79 +1,34 @@
-import re
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
-import json
-import mysql.connector
-from mysql.connector import Error
-from pcpartpicker import API
 from datetime import datetime
 
-# ─── 1. 모델명 정규화 ─────────────────────────────────────────────
-def normalize_model_name(name):
-    if not name:
-        return ""
-    name = name.lower().strip()
-    replacements = {
-        "지포스": "geforce",
-        "라데온": "radeon",
-        "아크": "arc",
-        "그래픽스": "graphics"
-    }
-    for kr, en in replacements.items():
-        name = name.replace(kr, en)
-    name = re.sub(r'[^\w\s]', ' ', name)
-    name = re.sub(r'\s+', ' ', name)
-    return name.strip()
-
-# ─── 2. GDDR 제거 ─────────────────────────────────────────────
-def delete_model_gddr(name):
-    return re.sub(r'\s+gddr\d+x?', '', name.strip(), flags=re.IGNORECASE)
-
-# ─── 3. 칩셋명 + VRAM 분리 ─────────────────────────────────────
-def extract_model_and_vram(name):
-    match = re.search(r"(.*?)(?:\s+(\d+)\s*gb)?$", name.strip(), flags=re.IGNORECASE)
-    if match:
-        model = match.group(1).strip()
-        vram = int(match.group(2)) if match.group(2) else None
-        return model, vram
-    return name, None
-
-# ─── 4. 워크스테이션 GPU 필터 ──────────────────────────────────
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from common.catalog import load_catalog_index
+from common.connection import create_mysql_connection, db_errors
+from common.db import sync_table
+from common.fuzzy import TrigramIndex, write_match_audit
+from common.ingest import read_workbook
+from common.normalizer import delete_model_gddr, extract_model_and_vram, normalize_model_name
+from common.parts_api import fetch_parts
+from common.snapshot import Snapshot
+
+# ─── 1. 워크스테이션 GPU 필터 ──────────────────────────────────
 def is_excludable_model(model):
     model = model.lower()
     return any(keyword in model for keyword in ["firepro", "quadro", "tesla", "rtx a", "radeon pro"])
 
-# ─── 5. JSON 모델 로드 (상세 정보 포함) ─────────────────────────
+# ─── 2. JSON 모델 로드 (상세 정보 포함) ─────────────────────────
 def load_json_models_detailed(json_path):
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    models_dict = {}  # normalized_name -> detailed_info
-    
-    for item in data:
-        chipset = item.get("chipset", "").strip()
-        if chipset and not is_excludable_model(chipset):
-            normalized = normalize_model_name(chipset)
-            
-            # JSON에서 상세 정보 추출 (name, price, color 제외)
-            detailed_info = {
-                'original_chipset': chipset,
-                'normalized_chipset': normalized,
-                'memory': item.get('memory', None),
-                'core_clock': item.get('core_clock', None),
-                'boost_clock': item.get('boost_clock', None),
-                'length': item.get('length', None)
-            }
-            
-            models_dict[normalized] = detailed_info
-    
-    return models_dict
+    """정규화 칩셋명 → GpuRecord 인덱스 (video-card.json이 바뀌었을 때만 다시 파싱, 평소에는 메모리 맵 로드)"""
+    return load_catalog_index(json_path, "gpu", exclude=is_excludable_model)
 
-# ─── 6. API 모델 로드 ──────────────────────────────────────────
-def load_api_models(region="us"):
+# ─── 3. API 모델 로드 ──────────────────────────────────────────
+def load_api_models(region="us", client=None):
+    """API(또는 캐시/스텁) 그래픽카드 목록 → 정규화 칩셋명(VRAM 제외) 집합"""
     try:
-        api = API(region)
-        video_card_data = api.retrieve("video-card")
-        video_card_dict = json.loads(video_card_data.to_json())
-        raw_list = video_card_dict.get("video-card", [])
+        raw_list = fetch_parts("video-card", region, client)
 
         print(f"📊 API에서 수신한 GPU 수: {len(raw_list)}")
 
@@ -94,7 +49,7 @@ def load_api_models(region="us"):
         print(f"❌ API 호출 실패: {e}")
         return set()
 
-# ─── 7. 엑셀 → 정규화 후보군 추출 ──────────────────────────────
+# ─── 4. 엑셀 → 정규화 후보군 추출 ──────────────────────────────
 def create_variants(df, first_column):
     variants = []
     excluded = []
@@ -118,8 +73,14 @@ def create_variants(df, first_column):
 
     return variants, excluded
 
-# ─── 8. 조건별 매칭 수행 (상세 정보 포함) ────────────────────────
-def match_variants_detailed(variants, json_models_dict, api_models):
+# ─── 5. 조건별 매칭 수행 (상세 정보 포함) ────────────────────────
+def same_vram(details, name):
+    """name에 VRAM 용량(예: '... 8gb')이 없거나 카탈로그 항목의 메모리 용량과 같으면 True"""
+    _, vram = extract_model_and_vram(name)
+    return vram is None or details.get("memory") == vram
+
+def match_variants_detailed(variants, json_models_dict, api_models, fuzzy_index=None):
+    """JSON(GDDR 포함 → 제거) → API(VRAM 분리) 순으로 정확히 일치, 없으면 fuzzy_index로 JSON 유사 매칭"""
     matched_json = []
     matched_api = []
     unmatched = []
@@ -141,6 +102,7 @@ def match_variants_detailed(variants, json_models_dict, api_models):
                 'excel_name': orig,
                 'normalized_name': gddr,
                 'match_type': 'JSON_GDDR_INTACT',
+                'score': 1.0,
                 'gpu_details': json_models_dict[gddr]
             })
             seen_originals.add(orig)
@@ -150,6 +112,7 @@ def match_variants_detailed(variants, json_models_dict, api_models):
                 'excel_name': orig,
                 'normalized_name': no_gddr,
                 'match_type': 'JSON_GDDR_REMOVED',
+                'score': 1.0,
                 'gpu_details': json_models_dict[no_gddr]
             })
             seen_originals.add(orig)
@@ -158,7 +121,19 @@ def match_variants_detailed(variants, json_models_dict, api_models):
             matched_api.append({
                 'excel_name': orig,
                 'normalized_name': model_only,
-                'match_type': 'API_VRAM_SEPARATED'
+                'match_type': 'API_VRAM_SEPARATED',
+                'score': 1.0
+            })
+            seen_originals.add(orig)
+        # 4. JSON 유사 매칭 (모델 번호가 같은 후보만, 예: 'geforce rtx 4060 ti 16gb' → 'geforce rtx 4060 ti')
+        #    엑셀명에 VRAM 용량이 있는데 최고 후보의 메모리 용량이 다르면 매칭하지 않음 (4060 Ti 8GB ↛ 16GB 카드)
+        elif fuzzy_index and (fuzzy := fuzzy_index.best_match(gddr)) and same_vram(json_models_dict[fuzzy[0]], no_gddr):
+            matched_json.append({
+                'excel_name': orig,
+                'normalized_name': gddr,
+                'match_type': 'JSON_FUZZY',
+                'score': round(fuzzy[1], 4),
+                'gpu_details': json_models_dict[fuzzy[0]]
             })
             seen_originals.add(orig)
         else:
@@ -166,33 +141,13 @@ def match_variants_detailed(variants, json_models_dict, api_models):
 
     return matched_json, matched_api, unmatched
 
-# ─── 9. MySQL 데이터베이스 연결 ────────────────────────────────
-def create_mysql_connection():
-    """MySQL 데이터베이스 연결 생성"""
-    try:
-        connection = mysql.connector.connect(
-            host='',        # MySQL 서버 주소
-            database='',       # 데이터베이스 이름
-            user='',    # MySQL 사용자명
-            password='' # MySQL 비밀번호
-        )
-        if connection.is_connected():
-            print("✅ MySQL 데이터베이스 연결 성공")
-            return connection
-    except Error as e:
-        print(f"❌ MySQL 연결 실패: {e}")
-        return None
-
-# ─── 10. JSON 매칭 데이터 저장 ──────────────────────────────────
-def save_json_matched_data(connection, matched_json_data):
+# ─── 6. JSON 매칭 데이터 저장 ──────────────────────────────────
+def save_json_matched_data(connection, matched_json_data, chunk_size=500, incremental=False):
     """JSON 매칭 중 GDDR 제거되지 않은 항목만 저장"""
     if not matched_json_data:
         print("💾 저장할 JSON 매칭 데이터가 없습니다.")
         return 0
 
-    cursor = connection.cursor()
-
-    # 테이블 생성
     create_table_query = """
     CREATE TABLE IF NOT EXISTS gpu_detailed_matches (
         video_card_id INT AUTO_INCREMENT PRIMARY KEY,
@@ -204,72 +159,36 @@ def save_json_matched_data(connection, matched_json_data):
         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
     """
-    try:
-        cursor.execute(create_table_query)
-        connection.commit()
-        print("✅ 테이블 생성/확인 완료")
-    except Error as e:
-        print(f"❌ 테이블 생성 실패: {e}")
-        cursor.close()
-        return 0
-
-    # 기존 데이터 삭제
-    try:
-        cursor.execute("DELETE FROM gpu_detailed_matches")
-        connection.commit()
-        print("🗑️ 기존 데이터 삭제 완료")
-
-        # AUTO_INCREMENT 초기화
-        cursor.execute("ALTER TABLE gpu_detailed_matches AUTO_INCREMENT = 1")
-        connection.commit()
-        print("🔄 AUTO_INCREMENT 값 초기화 완료")
-    except Error as e:
-        print(f"⚠️ 기존 데이터 삭제 또는 AUTO_INCREMENT 초기화 실패: {e}")
-
-
-    # 데이터 삽입
-    insert_query = """
-    INSERT INTO gpu_detailed_matches (
-        chipset, memory_gb, core_clock_mhz, boost_clock_mhz, length_mm
-    ) VALUES (%s, %s, %s, %s, %s)
-    """
-
-    inserted_count = 0
+    columns = ["chipset", "memory_gb", "core_clock_mhz", "boost_clock_mhz", "length_mm"]
 
+    rows = []
     for match_data in matched_json_data:
         # ✅ GDDR 제거된 항목은 저장하지 않음
         if match_data.get('match_type') == 'JSON_GDDR_REMOVED':
             continue
 
         gpu_details = match_data['gpu_details']
-        data_tuple = (
+        rows.append((
             match_data['normalized_name'],
             int(gpu_details.get('memory', 0)) if gpu_details.get('memory') else None,
             int(gpu_details.get('core_clock', 0)) if gpu_details.get('core_clock') else None,
             int(gpu_details.get('boost_clock', 0)) if gpu_details.get('boost_clock') else None,
             int(gpu_details.get('length', 0)) if gpu_details.get('length') else None
-        )
-
-        try:
-            cursor.execute(insert_query, data_tuple)
-            inserted_count += 1
-        except Error as e:
-            print(f"❌ 데이터 삽입 실패 ({match_data['normalized_name']}): {e}")
+        ))
 
+    # shadow 테이블에 적재 후 교체 → 재적재 중에도 기존 데이터가 계속 보임 (증분 모드면 바뀐 모델만 INSERT/UPDATE/DELETE)
     try:
-        connection.commit()
-        cursor.close()
+        snapshot = Snapshot("default", "gpu_detailed_matches", "chipset", columns)
+        inserted_count = sync_table(connection, "gpu_detailed_matches", create_table_query, "chipset", columns, rows, snapshot, incremental, chunk_size)
         print(f"✅ JSON 매칭 데이터 {inserted_count}개 저장 완료")
         return inserted_count
-    except Error as e:
-        print(f"❌ 데이터 커밋 실패: {e}")
-        connection.rollback()
-        cursor.close()
+    except db_errors() as e:
+        print(f"❌ JSON 매칭 데이터 재적재 실패: {e}")
         return 0
 
 
 
-# ─── 11. API 매칭 데이터 저장 ───────────────────────────────────
+# ─── 7. API 매칭 데이터 저장 ───────────────────────────────────
 def save_api_matched_data(connection, matched_api_data):
     """API와 매칭된 데이터를 간단히 저장"""
     if not matched_api_data:
@@ -293,7 +212,7 @@ def save_api_matched_data(connection, matched_api_data):
     try:
         cursor.execute(create_table_query)
         connection.commit()
-    except Error as e:
+    except db_errors() as e:
         print(f"❌ API 매칭 테이블 생성 실패: {e}")
         cursor.close()
         return 0
@@ -302,7 +221,7 @@ def save_api_matched_data(connection, matched_api_data):
     try:
         cursor.execute("DELETE FROM gpu_api_matches")
         connection.commit()
-    except Error as e:
+    except db_errors() as e:
         print(f"⚠️ 기존 API 매칭 데이터 삭제 실패: {e}")
     
     # 데이터 삽입
@@ -315,33 +234,37 @@ def save_api_matched_data(connection, matched_api_data):
         cursor.close()
         print(f"✅ API 매칭 데이터 {len(matched_api_data)}개 저장 완료")
         return len(matched_api_data)
-    except Error as e:
+    except db_errors() as e:
         print(f"❌ API 매칭 데이터 저장 실패: {e}")
         connection.rollback()
         cursor.close()
         return 0
 
-# ─── 12. 메인 실행 함수 ─────────────────────────────────────────
-def main(excel_path, json_path):
-    # 데이터 로드
-    df = pd.read_excel(excel_path, engine='openpyxl').drop([0, 1])
+# ─── 8. 메인 실행 함수 ─────────────────────────────────────────
+def match_gpu(excel_path, json_path, audit_path=None, client=None):
+    """엑셀의 GPU명을 JSON/API 모델과 매칭 → (matched_json, matched_api, unmatched, excluded), audit_path가 있으면 매칭 내역 CSV 저장"""
+    # 데이터 로드 (엑셀 / JSON / API는 서로 독립 → 스레드 풀에서 동시에)
+    print("📦 엑셀 / JSON 모델 상세 정보 / API 모델 동시 로드 중...")
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        excel_future = pool.submit(read_workbook, excel_path)
+        json_future = pool.submit(load_json_models_detailed, json_path)
+        api_future = pool.submit(load_api_models, "us", client)
+    df = excel_future.result().drop([0, 1])
+    json_models_dict = json_future.result()
+    api_models = api_future.result()
     first_col = df.columns[0]
 
-    print("📦 JSON 모델 상세 정보 로드 중...")
-    json_models_dict = load_json_models_detailed(json_path)
-    api_models = load_api_models()
-
     print(f"📦 JSON 모델 수: {len(json_models_dict)}")
     print(f"🌐 API 모델 수: {len(api_models)}")
 
     # 매칭 수행
     variants, excluded = create_variants(df, first_col)
-    matched_json, matched_api, unmatched = match_variants_detailed(variants, json_models_dict, api_models)
+    matched_json, matched_api, unmatched = match_variants_detailed(variants, json_models_dict, api_models, TrigramIndex(json_models_dict))
 
     # 콘솔 출력
     print("\n🎯 매칭 결과 요약")
     print("=" * 60)
-    print(f"✅ JSON 매칭 성공: {len(matched_json)}개")
+    print(f"✅ JSON 매칭 성공: {len(matched_json)}개 (유사 매칭 {sum(m['match_type'] == 'JSON_FUZZY' for m in matched_json)}개)")
     print(f"🔹 API 매칭 성공 (저장 제외): {len(matched_api)}개")
     print(f"❌ 매칭 실패: {len(unmatched)}개")
     print(f"🚫 제외된 항목: {len(excluded)}개")
@@ -351,9 +274,21 @@ def main(excel_path, json_path):
         print(f"\n📋 JSON 매칭된 모델들:")
         for match in matched_json:
             details = match['gpu_details']
-            print(f"  - {match['excel_name']} → {details['original_chipset']} ({match['match_type']})")
+            print(f"  - {match['excel_name']} → {details['original_chipset']} ({match['match_type']}, 점수 {match['score']})")
             print(f"    VRAM: {details.get('memory', 'N/A')}GB, 코어클럭: {details.get('core_clock', 'N/A')}MHz, 부스트클럭: {details.get('boost_clock', 'N/A')}MHz")
 
+    if audit_path:
+        write_match_audit(audit_path, [
+            (m['excel_name'], m['normalized_name'], m['gpu_details']['original_chipset'], m['match_type'], m['score']) for m in matched_json
+        ] + [
+            (m['excel_name'], m['normalized_name'], m['normalized_name'], m['match_type'], m['score']) for m in matched_api
+        ] + [(orig, normalize_model_name(orig), "", "UNMATCHED", "") for orig in unmatched])
+
+    return matched_json, matched_api, unmatched, excluded
+
+def main(excel_path, json_path, incremental=False, audit_path=None):
+    matched_json, _, unmatched, _ = match_gpu(excel_path, json_path, audit_path)
+
     # MySQL 데이터베이스에 저장
     print("\n" + "=" * 60)
     print("🗄️ MySQL 데이터베이스 저장 시작 (JSON 매칭만)")
@@ -363,7 +298,7 @@ def main(excel_path, json_path):
     if connection:
         try:
             # JSON 매칭 데이터만 저장
-            json_saved = save_json_matched_data(connection, matched_json)
+            json_saved = save_json_matched_data(connection, matched_json, incremental=incremental)
             
             print(f"\n📊 데이터베이스 저장 완료")
             print(f"  - JSON 매칭 (상세): {json_saved}개")
@@ -373,14 +308,13 @@ def main(excel_path, json_path):
         except Exception as e:
             print(f"❌ 데이터베이스 저장 중 오류 발생: {e}")
         finally:
-            if connection.is_connected():
-                connection.close()
-                print("🔌 MySQL 연결 종료")
+            connection.close()  # 풀로 반환
+            print("🔌 MySQL 연결 반환")
     else:
         print("❌ 데이터베이스 연결 실패로 저장을 건너뜁니다.")
 
 
-# ─── 13. 실행 경로 지정 ────────────────────────────────────────
+# ─── 9. 실행 경로 지정 ─────────────────────────────────────────
 if __name__ == "__main__":
     excel_path = "./data/그래픽카드 가성비 (25년 5월) v1.1.xlsx"
     json_path = "video-card.json"
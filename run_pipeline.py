@@ -0,0 +1,126 @@
+"""엑셀 → 점수/순위 → 모델 매칭 → DB 반영을 한 프로세스 안에서 이어서 실행
+
+    python run_pipeline.py --month 2025-06 --parts cpu,gpu [--csv-dir out] [--no-db] [--incremental] [--no-history] [--profile-import]
+
+단계 사이의 데이터는 DataFrame 그대로 넘기고, CSV는 --csv-dir을 준 경우에만 산출물로 저장.
+CPU/GPU 체인은 서로 독립이라 프로세스 풀에서 동시에 실행.
+pandas / DB / API 모듈은 해당 단계에서만 import (--help, 단일 부품 실행의 시작 시간 단축).
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(ROOT)
+from common.workbooks import DATA_DIR, find_workbook
+
+CPU_JSON = os.path.join(ROOT, "db_restore", "cpu", "cpu.json")
+GPU_JSON = os.path.join(ROOT, "db_restore", "gpu", "video-card.json")
+
+# ─── 1. CSV 산출물 (선택) ──────────────────────────────────────────
+def save_artifacts(csv_dir, tables):
+    """{파일명: DataFrame}을 csv_dir에 기존 스크립트와 같은 이름/인코딩으로 저장"""
+    if not csv_dir:
+        return
+    os.makedirs(csv_dir, exist_ok=True)
+    for filename, table in tables.items():
+        table.to_csv(os.path.join(csv_dir, filename), index=False, encoding="utf-8-sig")
+        print(f"✅ 저장 완료: {filename}")
+
+def audit_path(csv_dir, filename):
+    """매칭 감사 로그 경로 (CSV 산출물을 저장할 때만)"""
+    return os.path.join(csv_dir, filename) if csv_dir else None
+
+# ─── 2. CPU 체인 ──────────────────────────────────────────────────
+def run_cpu_chain(month, csv_dir=None, write_db=True, incremental=False, data_dir=DATA_DIR, history=True):
+    """cpu_csv_restore + cpu_level_priority → cpu.py → cpu_db_restore + cpu_line_rank"""
+    from common.cpu_priority import CONFIG, HEADER_ROW as CPU_HEADER_ROW, cpu_line_table, cpu_total_table, score_cpu
+    from common.history import record_history
+    from common.ingest import read_workbook
+
+    excel_path = find_workbook("cpu", month, data_dir)
+    df = score_cpu(read_workbook(excel_path, header=CPU_HEADER_ROW))
+    if history:
+        record_history("cpu", month, df, CONFIG)
+    total, line = cpu_total_table(df), cpu_line_table(df)
+    save_artifacts(csv_dir, {"CPU_성능_순위_가격포함.csv": total, "CPU_라인별_성능_순위.csv": line})
+
+    if write_db:
+        from db_restore.cpu.cpu import main_cpu
+        from db_restore.cpu.cpu_db_restore import update_cpu_data
+        from db_restore.cpu.cpu_line_rank import update_line_rankings
+
+        main_cpu(excel_path, CPU_JSON, incremental, audit_path(csv_dir, "cpu_match_audit.csv"))
+        update_cpu_data(total, incremental)
+        update_line_rankings(line, incremental)
+    return {"part": "cpu", "month": month, "rows": len(total)}
+
+# ─── 3. GPU 체인 ──────────────────────────────────────────────────
+def run_gpu_chain(month, csv_dir=None, write_db=True, incremental=False, data_dir=DATA_DIR, history=True):
+    """gpu_csv_restore + gpu_level_priority → gpu.py → gpu_db_restore + gpu_line_rank + gpu_total_rank"""
+    from common.gpu_priority import CONFIG, HEADER_ROW as GPU_HEADER_ROW, gpu_line_table, gpu_total_table, score_gpu
+    from common.history import record_history
+    from common.ingest import read_workbook
+
+    excel_path = find_workbook("gpu", month, data_dir)
+    df = score_gpu(read_workbook(excel_path, header=GPU_HEADER_ROW))
+    if history:
+        record_history("gpu", month, df, CONFIG)
+    total, line = gpu_total_table(df), gpu_line_table(df)
+    save_artifacts(csv_dir, {"gpu_total_priority_price.csv": total, "gpu_line_priority.csv": line})
+
+    if write_db:
+        from db_restore.gpu import gpu_db_restore, gpu_total_rank
+        from db_restore.gpu.gpu import main as main_gpu
+        from db_restore.gpu.gpu_line_rank import update_gpu_line_priority_to_db
+
+        main_gpu(excel_path, GPU_JSON, incremental, audit_path(csv_dir, "gpu_match_audit.csv"))
+        gpu_db_restore.update_gpu_priority_to_db(total, incremental)
+        update_gpu_line_priority_to_db(line, incremental)
+        gpu_total_rank.update_gpu_priority_to_db(total, incremental)
+    return {"part": "gpu", "month": month, "rows": len(total)}
+
+CHAINS = {"cpu": run_cpu_chain, "gpu": run_gpu_chain}
+
+# ─── 4. 실행 ──────────────────────────────────────────────────────
+def run_pipeline(month, parts=("cpu", "gpu"), csv_dir=None, write_db=True, incremental=False, workers=None, history=True):
+    """부품별 체인을 프로세스 풀에서 동시에 실행 (부품이 하나면 현재 프로세스에서 실행)"""
+    unknown = [p for p in parts if p not in CHAINS]
+    if unknown:
+        raise ValueError(f"알 수 없는 부품: {', '.join(unknown)} (cpu, gpu 중 선택)")
+
+    if len(parts) == 1:
+        return [CHAINS[parts[0]](month, csv_dir, write_db, incremental, history=history)]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers or len(parts)) as pool:
+        futures = [pool.submit(CHAINS[part], month, csv_dir, write_db, incremental, history=history) for part in parts]
+        return [future.result() for future in futures]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CPU/GPU 성능 순위 → DB 반영 파이프라인")
+    parser.add_argument("--month", required=True, help="대상 월 (예: 2025-06)")
+    parser.add_argument("--parts", default="cpu,gpu", help="실행할 부품 (쉼표 구분, 기본: cpu,gpu)")
+    parser.add_argument("--csv-dir", help="중간 결과 CSV를 저장할 폴더 (생략 시 저장 안 함)")
+    parser.add_argument("--no-db", action="store_true", help="매칭/DB 반영 단계를 건너뜀")
+    parser.add_argument("--incremental", action="store_true", help="지난 반영 스냅샷 대비 바뀐 모델만 DB에 반영")
+    parser.add_argument("--no-history", action="store_true", help="점수/가격/순위 이력(data/history/)에 기록하지 않음")
+    parser.add_argument("--profile-import", action="store_true", help="python -X importtime으로 실행해 import 시간 요약 출력")
+    args = parser.parse_args(argv)
+
+    if args.profile_import:
+        from common.importtime import profile_command
+
+        argv = sys.argv[1:] if argv is None else list(argv)
+        return profile_command([os.path.abspath(__file__), *(a for a in argv if a != "--profile-import")])
+
+    parts = [p.strip() for p in args.parts.split(",") if p.strip()]
+    start = time.perf_counter()
+    for result in run_pipeline(args.month, parts, args.csv_dir, not args.no_db, args.incremental, history=not args.no_history):
+        print(f"✅ {result['part'].upper()} {result['month']}: {result['rows']}개 처리")
+    print(f"⏱️ 전체 소요 시간: {time.perf_counter() - start:.1f}초")
+
+if __name__ == "__main__":
+    sys.exit(main())
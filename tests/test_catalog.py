@@ -0,0 +1,54 @@
+import io
+import json
+
+import pytest
+
+from common import normalizer
+from common.catalog import _iter_array, index_path
+
+DOCUMENTS = [
+    ' [ 1 , 2.5e3 ,{"a":[1,2]} ] ',
+    "[]",
+    "\n\t[ ]\n",
+    '[-0.5, 1E-7, true, false, null, "x"]',
+    '[{"name": "라이젠5 5600X", "price": 129.99, "tags": ["a]", "b,\\"c\\""]}, {"smt": true}]',
+    json.dumps([{"chipset": f"GeForce RTX {i}", "memory": i % 24, "boost_clock": None} for i in range(50)], indent=2),
+]
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1 << 16])
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_iter_array_matches_json_load(document, chunk_size):
+    assert list(_iter_array(io.StringIO(document), chunk_size)) == json.loads(document)
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1 << 16])
+@pytest.mark.parametrize("document", ['{"a": 1}', "  ", "[1, 2", "[1 2]", "[1, tru]", "[1,]", "[1x]"])
+def test_iter_array_rejects_invalid(document, chunk_size):
+    with pytest.raises(ValueError):
+        list(_iter_array(io.StringIO(document), chunk_size))
+
+# ─── 인덱스 캐시 키 ────────────────────────────────────────────────
+def exclude_pro(model):
+    return any(keyword in model.lower() for keyword in ["quadro", "tesla"])
+
+def exclude_pro_edited(model):
+    return any(keyword in model.lower() for keyword in ["quadro", "tesla", "firepro"])
+
+@pytest.fixture
+def catalog(tmp_path):
+    path = tmp_path / "video-card.json"
+    path.write_text('[{"chipset": "GeForce RTX 4060"}]', encoding="utf-8")
+    return str(path)
+
+def test_index_path_is_stable(catalog, tmp_path):
+    assert index_path(catalog, "gpu", exclude_pro, str(tmp_path)) == index_path(catalog, "gpu", exclude_pro, str(tmp_path))
+
+def test_index_path_changes_with_exclude_keywords(catalog, tmp_path):
+    assert index_path(catalog, "gpu", exclude_pro, str(tmp_path)) != index_path(catalog, "gpu", exclude_pro_edited, str(tmp_path))
+
+def test_index_path_changes_with_normalizer_rules(catalog, tmp_path, monkeypatch):
+    before = index_path(catalog, "gpu", exclude_pro, str(tmp_path))
+    monkeypatch.setitem(normalizer.GPU_KR_TO_EN, "엔비디아", "nvidia")
+    assert index_path(catalog, "gpu", exclude_pro, str(tmp_path)) != before
+    monkeypatch.undo()
+    monkeypatch.setattr(normalizer, "GPU_SYMBOL_PATTERN", normalizer.re.compile(r"[^\w\s.]"))
+    assert index_path(catalog, "gpu", exclude_pro, str(tmp_path)) != before
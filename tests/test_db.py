@@ -0,0 +1,119 @@
+import sqlite3
+
+import pytest
+
+from common.db import bulk_update, reload_table, sync_table
+from common.snapshot import Snapshot
+
+CREATE = "CREATE TABLE IF NOT EXISTS parts (name VARCHAR(255) PRIMARY KEY, score DOUBLE, rank_no INT)"
+COLUMNS = ["name", "score", "rank_no"]
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:")
+    reload_table(connection, "parts", CREATE, COLUMNS, [("a", 1.0, 1), ("b", 2.0, 2), ("c", 3.0, 3)])
+    yield connection
+    connection.close()
+
+@pytest.fixture
+def snapshot(tmp_path, monkeypatch):
+    monkeypatch.setenv("COMHERE_DB_BACKEND", "sqlite")
+    monkeypatch.setenv("COMHERE_DB_SQLITE_PATH", str(tmp_path / "test.db"))
+    return Snapshot("default", "parts", "name", COLUMNS, snapshot_dir=str(tmp_path / "snapshots"))
+
+def table(connection):
+    return connection.execute("SELECT name, score, rank_no FROM parts ORDER BY name").fetchall()
+
+# ─── bulk_update ───────────────────────────────────────────────────
+def test_bulk_update_last_duplicate_key_wins(connection):
+    updated = bulk_update(connection, "parts", "name", ["score", "rank_no"], [("a", 9.0, 9), ("a", 5.0, 5), ("x", 1.0, 1)])
+    assert updated == 1
+    assert table(connection) == [("a", 5.0, 5), ("b", 2.0, 2), ("c", 3.0, 3)]
+
+def test_bulk_update_keep_existing_on_null(connection):
+    rows = [("a", None, 7), ("b", 8.0, None)]
+    bulk_update(connection, "parts", "name", ["score", "rank_no"], rows, keep_existing_on_null=True)
+    assert table(connection)[:2] == [("a", 1.0, 7), ("b", 8.0, 2)]
+
+    bulk_update(connection, "parts", "name", ["score", "rank_no"], rows)
+    assert table(connection)[:2] == [("a", None, 7), ("b", 8.0, None)]
+
+def test_bulk_update_rolls_back_on_error(connection):
+    with pytest.raises(sqlite3.Error):
+        bulk_update(connection, "parts", "name", ["score", "missing"], [("a", 9.0, 9)])
+    assert table(connection)[0] == ("a", 1.0, 1)
+
+# ─── reload_table ──────────────────────────────────────────────────
+def test_reload_table_replaces_contents(connection):
+    assert reload_table(connection, "parts", CREATE, COLUMNS, [("d", 4.0, 1)], chunk_size=1) == 1
+    assert table(connection) == [("d", 4.0, 1)]
+
+def test_reload_table_keeps_old_rows_on_failure(connection):
+    with pytest.raises(sqlite3.IntegrityError):
+        reload_table(connection, "parts", CREATE, COLUMNS, [("d", 4.0, 1), ("d", 5.0, 2)])
+    assert [row[0] for row in table(connection)] == ["a", "b", "c"]
+
+class RecordingConnection:
+    """MySQL 경로(shadow 테이블 + RENAME)의 SQL 순서만 기록하는 연결"""
+
+    def __init__(self):
+        self.statements = []
+
+    def cursor(self):
+        return self
+
+    def execute(self, sql, params=None):
+        self.statements.append(" ".join(sql.split()))
+
+    def executemany(self, sql, rows):
+        self.statements.append(f"{' '.join(sql.split())} x{len(rows)}")
+
+    def commit(self):
+        self.statements.append("COMMIT")
+
+    def rollback(self):
+        self.statements.append("ROLLBACK")
+
+    def close(self):
+        pass
+
+def test_reload_table_mysql_swaps_shadow_table():
+    connection = RecordingConnection()
+    reload_table(connection, "parts", "CREATE", COLUMNS, [("a", 1.0, 1), ("b", 2.0, 2), ("c", 3.0, 3)], chunk_size=2)
+    assert connection.statements == [
+        "CREATE",
+        "COMMIT",
+        "DROP TABLE IF EXISTS `parts_new`",
+        "CREATE TABLE `parts_new` LIKE `parts`",
+        "INSERT INTO `parts_new` (`name`, `score`, `rank_no`) VALUES (%s, %s, %s) x2",
+        "INSERT INTO `parts_new` (`name`, `score`, `rank_no`) VALUES (%s, %s, %s) x1",
+        "COMMIT",
+        "DROP TABLE IF EXISTS `parts_old`",
+        "RENAME TABLE `parts` TO `parts_old`, `parts_new` TO `parts`",
+        "DROP TABLE `parts_old`",
+    ]
+
+# ─── sync_table (스냅샷 기반 증분) ─────────────────────────────────
+def test_sync_table_applies_insert_update_delete(connection, snapshot):
+    rows = [("a", 1.0, 1), ("b", 2.0, 2), ("c", 3.0, 3)]
+    assert sync_table(connection, "parts", CREATE, "name", COLUMNS, rows, snapshot, incremental=True) == 3
+
+    changed = [("a", 1.0, 1), ("b", 2.5, 1), ("d", 4.0, 3)]
+    assert snapshot.diff(changed) is not None
+    assert sync_table(connection, "parts", CREATE, "name", COLUMNS, changed, snapshot, incremental=True) == 3
+    assert table(connection) == [("a", 1.0, 1), ("b", 2.5, 1), ("d", 4.0, 3)]
+
+    # 바뀐 것이 없으면 아무것도 반영하지 않음
+    assert sync_table(connection, "parts", CREATE, "name", COLUMNS, changed, snapshot, incremental=True) == 0
+
+def test_sync_table_full_reload_without_snapshot(connection, snapshot):
+    rows = [("z", 1.0, 1)]
+    assert sync_table(connection, "parts", CREATE, "name", COLUMNS, rows, snapshot, incremental=True) == 1
+    assert table(connection) == [("z", 1.0, 1)]
+
+def test_sync_table_duplicate_keys_fall_back_to_reload(connection, snapshot):
+    sync_table(connection, "parts", CREATE, "name", COLUMNS, [("a", 1.0, 1)], snapshot)
+    rows = [("a", 1.0, 1), ("a", 2.0, 2)]
+    with pytest.raises(sqlite3.IntegrityError):
+        sync_table(connection, "parts", CREATE, "name", COLUMNS, rows, snapshot, incremental=True)
+    assert table(connection) == [("a", 1.0, 1)]
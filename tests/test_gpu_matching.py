@@ -0,0 +1,57 @@
+import pandas as pd
+import pytest
+
+from common.catalog import GpuRecord
+from common.fuzzy import TrigramIndex, vram_size
+from common.normalizer import normalize_model_name
+from db_restore.gpu.gpu import create_variants, match_variants_detailed
+
+# video-card.json에는 VRAM 표기 없이 한 가지 용량만 있는 칩셋
+CATALOG = [("GeForce RTX 4060 Ti", 16), ("Arc A770", 8), ("Radeon RX 5500 XT", 8)]
+
+def match(names):
+    catalog = {}
+    for chipset, memory in CATALOG:
+        key = normalize_model_name(chipset)
+        catalog[key] = GpuRecord({"memory": memory}, chipset, key)
+    variants, _ = create_variants(pd.DataFrame({"GPU명": names}), "GPU명")
+    return match_variants_detailed(variants, catalog, set(), TrigramIndex(catalog))
+
+@pytest.mark.parametrize("name", ["지포스 RTX 4060 Ti 8GB", "아크 A770 16GB", "라데온 RX 5500 XT 4GB"])
+def test_fuzzy_match_rejects_different_vram(name):
+    matched_json, matched_api, unmatched = match([name])
+    assert matched_json == [] and matched_api == []
+    assert unmatched == [name]
+
+@pytest.mark.parametrize("name, memory", [("지포스 RTX 4060 Ti 16GB", 16), ("아크 A770 8GB", 8), ("라데온 RX 5500 XT 8GB", 8)])
+def test_fuzzy_match_keeps_same_vram(name, memory):
+    matched_json, _, unmatched = match([name])
+    assert unmatched == []
+    assert matched_json[0]["match_type"] == "JSON_FUZZY"
+    assert matched_json[0]["gpu_details"]["memory"] == memory
+
+# ─── best_match 자체도 VRAM 용량이 다른 후보를 고르지 않음 ─────────
+VARIANTS = {
+    "geforce rtx 4060 ti": [8, 16],
+    "geforce rtx 3060": [8, 12],
+    "arc a770": [8, 16],
+    "radeon rx 5500 xt": [4, 8],
+}
+
+def test_best_match_prefers_same_vram_over_closer_name():
+    # 이름은 8GB 쪽이 더 비슷하지만 용량이 다름
+    index = TrigramIndex(["geforce rtx 3060 8gb", "nvidia geforce rtx 3060 12gb"])
+    assert index.search("geforce rtx 3060 12gb", 2)[0][0] == "geforce rtx 3060 8gb"
+    assert index.best_match("geforce rtx 3060 12gb")[0] == "nvidia geforce rtx 3060 12gb"
+    assert TrigramIndex(["geforce rtx 3060 8gb"]).best_match("geforce rtx 3060 12gb") is None
+
+@pytest.mark.parametrize("prefix, suffix", [("", ""), ("", " gddr6"), ("msi ", " oc"), ("nvidia ", " lhr edition")])
+def test_best_match_never_picks_different_vram(prefix, suffix):
+    catalog = [f"{model} {memory}gb" for model, sizes in VARIANTS.items() for memory in sizes]
+    catalog += ["nvidia geforce rtx 3060 12gb lhr edition", "geforce rtx 4060 ti"]
+    index = TrigramIndex(catalog)
+    for model, sizes in VARIANTS.items():
+        for memory in sizes:
+            found = index.best_match(f"{prefix}{model} {memory}gb{suffix}", threshold=0.3)
+            assert found is not None
+            assert vram_size(found[0]) in (memory, -1)
@@ -0,0 +1,65 @@
+import glob
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from common.history import HistoryStore
+
+def month_frame(prices, ranks):
+    return pd.DataFrame({
+        "모델명": list(prices),
+        "라인": ["메인스트림"] * len(prices),
+        "가격": [float(p) for p in prices.values()],
+        "종합_성능_순위": pd.array(ranks, dtype="Int16"),
+    })
+
+@pytest.fixture
+def store(tmp_path):
+    store = HistoryStore(str(tmp_path))
+    store.append_many([
+        ("gpu", "2025-05", month_frame({"RTX 4060": 400, "RX 7600": 350}, [1, 2])),
+        ("gpu", "2025-06", month_frame({"RTX 4060": 390, "RTX 5060": 420}, [2, 1])),
+        ("cpu", "2025-06", month_frame({"라이젠5 7600": 250}, [1])),
+    ])
+    return store
+
+def runs(store, part, month):
+    return glob.glob(os.path.join(store.partition(part, month), "run-*"))
+
+def test_append_many_writes_one_run_per_partition(store):
+    assert store.months("gpu") == ["2025-05", "2025-06"]
+    assert store.months("cpu") == ["2025-06"]
+    names = {os.path.basename(runs(store, part, month)[0]) for part, month in [("gpu", "2025-05"), ("gpu", "2025-06"), ("cpu", "2025-06")]}
+    assert len(names) == 1  # 같은 run 시각
+
+def test_cross_section_round_trip(store):
+    section = store.cross_section("gpu", "2025-06")
+    pd.testing.assert_frame_equal(section, month_frame({"RTX 4060": 390, "RTX 5060": 420}, [2, 1]))
+    assert store.cross_section("gpu", "2025-06", columns=["가격"]).columns.tolist() == ["모델명", "가격"]
+
+def test_trajectory(store):
+    prices = store.trajectory("gpu", ["RTX 4060", "RTX 5060", "없는 모델"])
+    assert prices.index.tolist() == ["2025-05", "2025-06"]
+    assert prices["RTX 4060"].tolist() == [400.0, 390.0]
+    assert np.isnan(prices.loc["2025-05", "RTX 5060"]) and prices["없는 모델"].isna().all()
+    assert store.trajectory("gpu", ["RTX 4060"], "종합_성능_순위")["RTX 4060"].tolist() == [1, 2]
+
+def test_reappend_replaces_month_without_duplicates(store):
+    store.append("gpu", "2025-06", month_frame({"RTX 4060": 380}, [1]))
+    # 이전 run 파일은 남지만 조회는 최신 run만
+    assert len(runs(store, "gpu", "2025-06")) == 2
+    assert store.cross_section("gpu", "2025-06")["모델명"].tolist() == ["RTX 4060"]
+    assert len(store.load("gpu")) == 3
+    assert store.trajectory("gpu", ["RTX 4060"])["RTX 4060"].tolist() == [400.0, 380.0]
+
+def test_append_many_failure_adds_nothing(tmp_path):
+    store = HistoryStore(str(tmp_path))
+    with pytest.raises(ValueError):
+        store.append_many([("gpu", "2025-06", month_frame({"RTX 4060": 390}, [1])), ("gpu", "2025-13x", month_frame({}, []))])
+    assert store.months("gpu") == []
+    assert glob.glob(os.path.join(str(tmp_path), "**", "*.tmp"), recursive=True) == []
+
+def test_load_without_history(tmp_path):
+    assert HistoryStore(str(tmp_path)).load("gpu").empty
@@ -0,0 +1,52 @@
+import io
+from datetime import datetime, time
+
+import numpy as np
+import openpyxl
+import pandas as pd
+
+from common.ingest import INT_SUFFIX, TEXT_SUFFIX, from_columnar, read_workbook, to_columnar
+
+def round_trip(df):
+    buffer = io.BytesIO()
+    to_columnar(df).to_parquet(buffer, index=False)
+    return from_columnar(pd.read_parquet(buffer))
+
+def types(series):
+    return [type(v).__name__ for v in series]
+
+def test_mixed_object_column_keeps_types():
+    df = pd.DataFrame({"a": pd.Series([1, "x", True, datetime(2025, 1, 1), 2.5, None], dtype=object), "b": range(6)})
+    restored = round_trip(df)
+    assert types(restored["a"]) == ["int", "str", "bool", "datetime", "float", "float"]
+    assert restored["a"].tolist()[:5] == [1, "x", True, datetime(2025, 1, 1), 2.5]
+    assert pd.isna(restored["a"].iloc[5])
+    assert restored["b"].tolist() == list(range(6))
+
+def test_reads_cache_without_bool_and_datetime_parts():
+    # 불리언/날짜부가 생기기 전에 만든 캐시
+    table = pd.DataFrame({"a" + INT_SUFFIX: pd.array([1, None], dtype="Int64"), "a::num": [np.nan, np.nan], "a" + TEXT_SUFFIX: pd.array([None, "x"], dtype="string")})
+    assert from_columnar(table)["a"].tolist() == [1, "x"]
+
+def test_read_workbook_cache_matches_excel(tmp_path):
+    path = tmp_path / "book.xlsx"
+    workbook = openpyxl.Workbook()
+    for row in [["이름", "값"], ["a", 1], ["b", "x"], ["c", datetime(2025, 1, 1)], ["d", 2.5]]:
+        workbook.active.append(row)
+    workbook.save(path)
+
+    cold = read_workbook(str(path), cache_dir=str(tmp_path / "cache"))
+    warm = read_workbook(str(path), cache_dir=str(tmp_path / "cache"))
+    assert len(list((tmp_path / "cache").glob("*.parquet"))) == 1
+    assert types(warm["값"]) == types(cold["값"]) and warm["값"].tolist() == cold["값"].tolist()
+
+def test_read_workbook_skips_cache_for_unsupported_types(tmp_path, capsys):
+    path = tmp_path / "book.xlsx"
+    workbook = openpyxl.Workbook()
+    for row in [["값"], [1], [time(1, 2)]]:
+        workbook.active.append(row)
+    workbook.save(path)
+
+    assert read_workbook(str(path), cache_dir=str(tmp_path / "cache"))["값"].tolist() == [1, time(1, 2)]
+    assert not (tmp_path / "cache").exists()
+    assert "캐시 생략" in capsys.readouterr().out
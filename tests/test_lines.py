@@ -0,0 +1,23 @@
+import numpy as np
+import pandas as pd
+
+from common.lines import assign_lines
+
+LINES = ["하이엔드", "퍼포먼스", "메인스트림"]
+
+def test_assign_lines_back_fills_from_header_below():
+    df = pd.DataFrame({
+        "이름": ["A", "B", "플래그쉽 및 하이엔드 라인↑", "C", "D", "퍼포먼스 라인↑", "E"],
+        "값": [1.0, np.nan, np.nan, 2.0, 3.0, np.nan, 4.0],
+    })
+    labels = assign_lines(df, "이름", "값", LINES)
+    assert labels.where(labels.notna(), None).tolist() == ["하이엔드", None, None, "퍼포먼스", "퍼포먼스", None, None]
+
+def test_assign_lines_keyword_priority_and_unknown_header():
+    df = pd.DataFrame({
+        "이름": ["A", "메인스트림 / 하이엔드 라인", "B", "기타 라인"],
+        "값": [1.0, np.nan, 2.0, np.nan],
+    })
+    labels = assign_lines(df, "이름", "값", LINES)
+    assert labels.iloc[0] == "하이엔드"
+    assert labels.iloc[1:].isna().all()
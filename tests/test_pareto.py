@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from common.pareto import dominance_depth, pareto_depth_by_line, pareto_front
+
+def brute_depth(values):
+    """프런티어를 한 층씩 벗겨내는 정의 그대로의 지배 깊이 (NaN 행은 0)"""
+    values = np.asarray(values, dtype=float)
+    depth = np.zeros(len(values), dtype=np.int64)
+    remaining = [i for i in range(len(values)) if not np.isnan(values[i]).any()]
+    layer = 0
+    while remaining:
+        layer += 1
+        front = [
+            i for i in remaining
+            if not any((values[j] >= values[i]).all() and (values[j] > values[i]).any() for j in remaining)
+        ]
+        depth[front] = layer
+        remaining = [i for i in remaining if i not in front]
+    return depth
+
+def random_values(n, d, seed):
+    rng = np.random.default_rng(seed)
+    # 좁은 범위 정수라 한 축 동률, 완전히 같은 점이 자주 나옴
+    values = rng.integers(0, 6, (n, d)).astype(float)
+    values[rng.random(n) < 0.1, rng.integers(0, d)] = np.nan
+    return values
+
+@pytest.mark.parametrize("d", [1, 2, 3])
+@pytest.mark.parametrize("seed", range(5))
+def test_depth_matches_brute_force(d, seed):
+    values = random_values(120, d, seed)
+    np.testing.assert_array_equal(dominance_depth(values), brute_depth(values))
+
+def test_depth_hand_checked():
+    values = [[3, 3], [3, 3], [3, 1], [1, 3], [2, 2], [1, 1], [np.nan, 5]]
+    # 같은 점끼리는 지배하지 않고, 한 축만 같아도 다른 축이 나쁘면 지배당함
+    assert dominance_depth(values).tolist() == [1, 1, 2, 2, 2, 3, 0]
+    assert pareto_front(values).tolist() == [True, True, False, False, False, False, False]
+
+def test_depth_minimize_axis():
+    # 성능 ↑, 가격 ↓
+    values = [[10, 100], [10, 90], [8, 50], [5, 60]]
+    assert dominance_depth(values, maximize=[True, False]).tolist() == [2, 1, 1, 2]
+
+def test_depth_by_line():
+    df = pd.DataFrame({
+        "라인": ["a", "a", "a", "b", "b", None],
+        "점수": [1.0, 2.0, 2.0, 1.0, np.nan, 9.0],
+        "가격": [100, 200, 100, 100, 100, 1],
+    })
+    depth = pareto_depth_by_line(df, ["점수"], ["가격"])
+    assert depth.dtype == "Int64"
+    assert depth.tolist() == [2, 2, 1, 1, pd.NA, pd.NA]
+    assert pareto_depth_by_line(df, [], []).isna().all()
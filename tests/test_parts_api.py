@@ -0,0 +1,92 @@
+import gzip
+import json
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from common.parts_api import STAMP_FORMAT, SnapshotCache
+
+class CountingClient:
+    """호출 횟수를 세고, 호출마다 다른 항목을 돌려주는 클라이언트 (release 전까지 대기 가능)"""
+
+    def __init__(self, fail=False, block=False):
+        self.calls = 0
+        self.fail = fail
+        self.release = threading.Event()
+        if not block:
+            self.release.set()
+
+    def fetch(self, part, region="us"):
+        self.release.wait(5)
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("API 실패")
+        return [{"name": f"{part}-{self.calls}"}]
+
+def write_snapshot(cache_dir, items, age, part="cpu", region="us"):
+    stamp = (datetime.now(timezone.utc) - timedelta(seconds=age)).strftime(STAMP_FORMAT)
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, f"{part}-{region}-{stamp}.json.gz")
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump({"items": items}, f)
+    return path
+
+def test_first_fetch_waits_for_api(tmp_path):
+    client = CountingClient()
+    cache = SnapshotCache(client, cache_dir=str(tmp_path))
+    assert cache.fetch("cpu") == [{"name": "cpu-1"}]
+    assert len(cache.snapshots("cpu", "us")) == 1
+
+def test_fresh_snapshot_skips_api(tmp_path):
+    write_snapshot(str(tmp_path), [{"name": "cached"}], age=10)
+    client = CountingClient()
+    assert SnapshotCache(client, cache_dir=str(tmp_path), ttl=60).fetch("cpu") == [{"name": "cached"}]
+    assert client.calls == 0
+
+def test_stale_snapshot_is_returned_and_refreshed_in_daemon_thread(tmp_path):
+    write_snapshot(str(tmp_path), [{"name": "cached"}], age=120)
+    client = CountingClient(block=True)
+    cache = SnapshotCache(client, cache_dir=str(tmp_path), ttl=60)
+
+    # API 응답을 기다리지 않고 기존 스냅샷을 바로 반환, 갱신 스레드는 종료를 막지 않음
+    assert cache.fetch("cpu") == [{"name": "cached"}]
+    assert cache.fetch("cpu") == [{"name": "cached"}]
+    assert [t.daemon for t in threading.enumerate() if t.name == "refresh-cpu-us"] == [True]
+    assert not cache.wait(timeout=0.01)
+
+    client.release.set()
+    assert cache.wait(timeout=5)
+    assert client.calls == 1
+    assert cache.fetch("cpu") == [{"name": "cpu-1"}]
+
+def test_failed_refresh_keeps_snapshot(tmp_path, capsys):
+    write_snapshot(str(tmp_path), [{"name": "cached"}], age=120)
+    cache = SnapshotCache(CountingClient(fail=True), cache_dir=str(tmp_path), ttl=60)
+    assert cache.fetch("cpu") == [{"name": "cached"}]
+    assert cache.wait(timeout=5)
+    assert "갱신 실패" in capsys.readouterr().out
+    assert cache.fetch("cpu") == [{"name": "cached"}]
+    assert len(cache.snapshots("cpu", "us")) == 1
+
+def test_offline_uses_stale_snapshot_and_never_calls_api(tmp_path):
+    client = CountingClient()
+    cache = SnapshotCache(client, cache_dir=str(tmp_path), ttl=60, offline=True)
+    with pytest.raises(FileNotFoundError):
+        cache.fetch("cpu")
+    write_snapshot(str(tmp_path), [{"name": "old"}], age=10 ** 6)
+    assert cache.fetch("cpu") == [{"name": "old"}]
+    assert client.calls == 0
+
+def test_refresh_keeps_latest_snapshots(tmp_path):
+    for age in range(100, 800, 100):
+        write_snapshot(str(tmp_path), [{"name": age}], age=age)
+    write_snapshot(str(tmp_path), [{"name": "gpu"}], age=500, part="gpu")
+    cache = SnapshotCache(CountingClient(), cache_dir=str(tmp_path), keep=5)
+
+    cache.refresh("cpu", "us")
+    kept = cache.snapshots("cpu", "us")
+    assert len(kept) == 5
+    assert [cache.read(path) for path in kept[:-1]] == [[{"name": age}] for age in (400, 300, 200, 100)]
+    assert len(cache.snapshots("gpu", "us")) == 1
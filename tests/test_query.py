@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from common.query import ScoreIndex, handle_query
+from common.scoring import rank_desc
+
+LINES = ["엔트리", "메인스트림", "하이엔드"]
+
+def random_table(n, seed=0):
+    rng = np.random.default_rng(seed)
+    # 점수/가격 모두 동점이 자주 나오도록 좁은 범위의 정수
+    scores = rng.integers(0, 50, n).astype(float)
+    scores[rng.random(n) < 0.05] = np.nan
+    prices = rng.integers(1, 200, n).astype(float) * 1000
+    prices[rng.random(n) < 0.05] = np.nan
+    return pd.DataFrame({
+        "GPU명": [f"GPU {i}" for i in range(n)],
+        "라인": rng.choice(LINES, n),
+        "GPU_가격": prices,
+        "종합_성능점수": scores,
+        "종합_성능_순위": rank_desc(scores)[:, 0],
+    })
+
+def brute_top(table, k, line=None, min_price=None, max_price=None):
+    rows = table[table["종합_성능점수"].notna()]
+    if line is not None:
+        rows = rows[rows["라인"] == line]
+    if min_price is not None or max_price is not None:
+        rows = rows[rows["GPU_가격"].between(min_price or -np.inf, max_price or np.inf)]
+    rows = rows.assign(position=np.arange(len(table))[rows.index])
+    return rows.sort_values(["종합_성능점수", "position"], ascending=[False, True]).index[:k].tolist()
+
+@pytest.mark.parametrize("n", [0, 1, 7, 64, 1000])
+def test_top_matches_sort_values(n):
+    table = random_table(n, seed=n)
+    index = ScoreIndex(table)
+    rng = np.random.default_rng(n + 1)
+    for _ in range(200):
+        k = int(rng.integers(1, 30))
+        line = rng.choice([None, *index.lines])
+        low, high = sorted(rng.integers(0, 210, 2) * 1000)
+        min_price, max_price = [(None, None), (low, None), (None, high), (low, high)][rng.integers(4)]
+        expected = brute_top(table, k, line, min_price, max_price)
+        assert index.top(k, line=line, min_price=min_price, max_price=max_price).index.tolist() == expected
+
+def test_rank_range_and_find():
+    table = random_table(300)
+    index = ScoreIndex(table)
+    ranks = table["종합_성능_순위"]
+    got = index.rank_range(5, 20)
+    assert sorted(got.index) == sorted(table.index[ranks.between(5, 20)])
+    assert got["종합_성능_순위"].is_monotonic_increasing
+
+    in_line = index.rank_range(1, 50, line="하이엔드")
+    assert (in_line["라인"] == "하이엔드").all() and in_line["종합_성능_순위"].max() <= 50
+    assert index.find("  GPU 7 ").index.tolist() == [7]
+
+def test_handle_query_rejects_unknown_values():
+    indexes = {"gpu": ScoreIndex(random_table(10))}
+    assert len(handle_query(indexes, "/top", {"k": "3"})) == 3
+    for path, params in [("/top", {"part": "ssd"}), ("/top", {"line": "없음"}), ("/top", {"profile": "게임"}), ("/nope", {})]:
+        with pytest.raises(KeyError):
+            handle_query(indexes, path, params)
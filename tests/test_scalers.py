@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from common.scalers import ClippedMinMaxScaler, MinMaxScaler, RankScaler, StandardScaler, make_scaler
+
+NAN = np.nan
+# 열: 일반 / 상수 / 음수 포함
+X = np.array([
+    [1.0, 2.0, -1.0],
+    [3.0, 2.0, 0.0],
+    [NAN, 2.0, 1.0],
+    [5.0, NAN, 3.0],
+])
+
+def random_matrix(seed=0, rows=1000):
+    rng = np.random.default_rng(seed)
+    X = rng.lognormal(size=(rows, 4)) * [1, 10, 100, 1]
+    X[:, 3] = 7.0
+    X[rng.random(X.shape) < 0.1] = NAN
+    return X
+
+def chunks(X, size=137):
+    return [X[i:i + size] for i in range(0, len(X), size)]
+
+# ─── 기준 배열 ─────────────────────────────────────────────────────
+def test_minmax_reference():
+    np.testing.assert_allclose(MinMaxScaler().fit_transform(X), [
+        [0.0, 0.0, 0.0],
+        [0.5, 0.0, 0.25],
+        [NAN, 0.0, 0.5],
+        [1.0, NAN, 1.0],
+    ])
+
+def test_zscore_reference():
+    std0, std2 = np.sqrt(8 / 3), np.sqrt(2.1875)
+    np.testing.assert_allclose(StandardScaler().fit_transform(X), [
+        [-2 / std0, 0.0, -1.75 / std2],
+        [0.0, 0.0, -0.75 / std2],
+        [NAN, 0.0, 0.25 / std2],
+        [2 / std0, NAN, 2.25 / std2],
+    ])
+
+def test_rank_reference():
+    np.testing.assert_allclose(RankScaler().fit_transform(X), [
+        [0.0, 0.5, 0.0],
+        [0.5, 0.5, 1 / 3],
+        [NAN, 0.5, 2 / 3],
+        [1.0, NAN, 1.0],
+    ])
+
+def test_clip_reference():
+    X = np.r_[np.arange(1.0, 100.0), 10_000.0, NAN][:, None]
+    low, high = np.nanpercentile(X, 5), np.nanpercentile(X, 95)
+    out = ClippedMinMaxScaler(lower=5, upper=95).fit_transform(X)[:, 0]
+    np.testing.assert_allclose(out[:-1], (np.clip(X[:-1, 0], low, high) - low) / (high - low))
+    assert out[-2] == 1.0 and np.isnan(out[-1])
+    # 0 ~ 100 백분위수면 최소-최대와 같음
+    np.testing.assert_allclose(ClippedMinMaxScaler(lower=0, upper=100).fit_transform(X), MinMaxScaler().fit_transform(X))
+
+# ─── sklearn과 비교 ───────────────────────────────────────────────
+def test_minmax_matches_sklearn_bit_for_bit():
+    preprocessing = pytest.importorskip("sklearn.preprocessing")
+    X = random_matrix()
+    assert MinMaxScaler().fit_transform(X).tobytes() == preprocessing.MinMaxScaler().fit_transform(X).tobytes()
+
+def test_zscore_matches_sklearn():
+    preprocessing = pytest.importorskip("sklearn.preprocessing")
+    X = random_matrix()
+    np.testing.assert_allclose(StandardScaler().fit_transform(X), preprocessing.StandardScaler().fit_transform(X), atol=1e-12)
+
+# ─── partial_fit = 전체 fit ──────────────────────────────────────
+@pytest.mark.parametrize("name", ["minmax", "clip", "rank", "zscore"])
+def test_partial_fit_matches_fit(name):
+    X = random_matrix(1)
+    streamed = make_scaler(name)
+    for chunk in chunks(X):
+        streamed.partial_fit(chunk)
+    np.testing.assert_allclose(streamed.transform(X), make_scaler(name).fit_transform(X), atol=1e-12)
+
+@pytest.mark.parametrize("name", ["clip", "rank"])
+def test_compressed_samples_keep_their_weight(name):
+    # 값이 청크마다 커지는 경우 (압축된 앞 청크가 나중 청크와 같은 무게로 취급되면 크게 어긋남)
+    X = np.arange(50_000.0)[:, None]
+    streamed = make_scaler(name, max_samples=500)
+    for chunk in chunks(X, 1000):
+        streamed.partial_fit(chunk)
+    assert all(len(s) <= 500 for s in streamed.samples)
+    np.testing.assert_allclose(streamed.transform(X), make_scaler(name).fit_transform(X), atol=0.02)
+
+def test_make_scaler_rejects_unknown_name():
+    with pytest.raises(ValueError):
+        make_scaler("robust")
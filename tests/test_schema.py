@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+
+from common.cpu_priority import CONFIG
+from common.schema import enforce, fill_missing_ranks
+from common.scoring import MISSING_RANK, rank_desc
+
+def test_rank_desc_missing_is_nan():
+    ranks = rank_desc(np.array([0.5, np.nan, 0.9]))
+    np.testing.assert_array_equal(ranks[:, 0], [2, np.nan, 1])
+
+def test_real_rank_999_is_kept():
+    scores = np.linspace(1, 0, 1200)
+    frame = pd.DataFrame({"종합_성능_순위": rank_desc(scores)[:, 0]})
+    ranks = enforce(frame, CONFIG)["종합_성능_순위"]
+    assert ranks.dtype == "Int16"
+    assert ranks.iloc[MISSING_RANK - 1] == MISSING_RANK
+    assert ranks.notna().all()
+
+def test_rank_dtype_widens_past_int16():
+    scores = np.r_[np.linspace(1, 0, 40_000), np.nan]
+    frame = pd.DataFrame({"종합_성능_순위": rank_desc(scores)[:, 0]})
+    ranks = enforce(frame, CONFIG)["종합_성능_순위"]
+    assert ranks.dtype == "Int32"
+    assert ranks.iloc[-2] == 40_000 and pd.isna(ranks.iloc[-1])
+
+def test_fill_missing_ranks_for_db():
+    frame = enforce(pd.DataFrame({"종합_성능_순위": [1.0, np.nan]}), CONFIG)
+    assert fill_missing_ranks(frame, ["종합_성능_순위"])["종합_성능_순위"].tolist() == [1, MISSING_RANK]
+
+def test_enforce_reports_memory_through_logging(caplog, capsys):
+    frame = pd.DataFrame({"종합_성능_순위": [1.0, np.nan]})
+    with caplog.at_level("DEBUG", logger="common.schema"):
+        enforce(frame, CONFIG, label="CPU 점수")
+    assert capsys.readouterr().out == ""
+    assert "CPU 점수 메모리" in caplog.text
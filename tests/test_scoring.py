@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from common.scoring import compute_profile_scores, rank_desc, score_profiles, weight_matrix
+
+NAN = np.nan
+COLUMNS = ["f1", "f2", "f3"]
+# 정규화가 끝난 값 (r0과 r4는 같은 행, r2/r3은 결측 특성이 있음)
+VALUES = np.array([
+    [1.0, 0.5, 0.0],
+    [0.5, 1.0, 1.0],
+    [NAN, 1.0, 0.5],
+    [NAN, NAN, 1.0],
+    [1.0, 0.5, 0.0],
+])
+PROFILES = {"P": {"f1": 0.5, "f2": 0.5}, "Q": {"f1": 0.6, "f2": 0.3, "f3": -0.1}}
+LINES = ["a", "a", "b", "b", None]
+
+def reference_score(row, weights, min_weight=0.5):
+    """리팩터링 전 gpu_level_priority.compute_score (행 단위)"""
+    valid_weights = {k: w for k, w in weights.items() if not pd.isna(row[k])}
+    weight_sum = sum(abs(w) for w in valid_weights.values())
+    if weight_sum < min_weight:
+        return np.nan, weight_sum
+    scale = 1 / weight_sum if weight_sum < 1.0 else 1.0
+    return sum(row[k] * w * scale for k, w in valid_weights.items()), weight_sum
+
+# ─── 점수 ──────────────────────────────────────────────────────────
+def test_profile_scores_hand_checked():
+    scores, weight_sums = compute_profile_scores(VALUES, weight_matrix(PROFILES, COLUMNS))
+    # P: r2는 유효 가중치 0.5 → 2배로 재정규화, r3은 0 → NaN
+    np.testing.assert_array_equal(scores[:, 0], [0.75, 0.75, 1.0, NAN, 0.75])
+    np.testing.assert_allclose(weight_sums[:, 0], [1.0, 1.0, 0.5, 0.0, 1.0])
+    # Q: r2(0.4), r3(0.1)은 min_weight 미만
+    np.testing.assert_allclose(scores[:, 1], [0.75, 0.5, NAN, NAN, 0.75])
+    np.testing.assert_allclose(weight_sums[:, 1], [1.0, 1.0, 0.4, 0.1, 1.0])
+
+def test_profile_scores_without_renormalize():
+    scores, _ = compute_profile_scores(VALUES, weight_matrix(PROFILES, COLUMNS), renormalize=False)
+    np.testing.assert_array_equal(scores[:, 0], [0.75, 0.75, NAN, NAN, 0.75])
+
+def test_profile_scores_match_row_wise_baseline_bit_for_bit():
+    rng = np.random.default_rng(0)
+    columns = [f"f{i}" for i in range(8)]
+    values = rng.random((300, len(columns)))
+    values[rng.random(values.shape) < 0.3] = NAN
+    profiles = {
+        "total": dict(zip(columns, [0.2, 0.2, 0.2, 0.05, 0.05, 0.05, 0.07, -0.075])),
+        "pure": dict(zip(columns[:7], [0.2, 0.2, 0.2, 0.05, 0.05, 0.05, 0.07])),
+    }
+    scores, weight_sums = compute_profile_scores(values, weight_matrix(profiles, columns))
+
+    frame = pd.DataFrame(values, columns=columns)
+    for j, weights in enumerate(profiles.values()):
+        expected = np.array([reference_score(row, weights) for _, row in frame.iterrows()])
+        assert scores[:, j].tobytes() == expected[:, 0].tobytes()
+        assert weight_sums[:, j].tobytes() == expected[:, 1].tobytes()
+
+# ─── 순위 ──────────────────────────────────────────────────────────
+def test_rank_desc_ties_and_nan():
+    scores = np.array([0.75, 0.75, 1.0, NAN, 0.75])
+    np.testing.assert_array_equal(rank_desc(scores)[:, 0], [2, 2, 1, NAN, 2])
+    np.testing.assert_array_equal(rank_desc(scores, na_option="bottom")[:, 0], [2, 2, 1, 5, 2])
+
+def test_rank_desc_groups():
+    scores = np.array([0.75, 0.75, 1.0, NAN, 0.75])
+    codes = np.array([0, 0, 1, 1, -1])
+    expected = [1, 1, 1, NAN, NAN]
+    np.testing.assert_array_equal(rank_desc(scores, groups=codes)[:, 0], expected)
+    # 그룹 순위에는 bottom을 적용하지 않음 (순위 없는 행은 항상 결측)
+    np.testing.assert_array_equal(rank_desc(scores, groups=codes, na_option="bottom")[:, 0], expected)
+
+@pytest.mark.parametrize("na_option", ["keep", "bottom"])
+def test_rank_desc_matches_pandas(na_option):
+    rng = np.random.default_rng(1)
+    scores = rng.integers(0, 20, (500, 3)).astype(float)
+    scores[rng.random(scores.shape) < 0.1] = NAN
+    expected = pd.DataFrame(scores).rank(ascending=False, method="min", na_option=na_option).to_numpy()
+    np.testing.assert_array_equal(rank_desc(scores, na_option=na_option), expected)
+
+def test_rank_desc_groups_match_pandas():
+    rng = np.random.default_rng(2)
+    frame = pd.DataFrame({"score": rng.integers(0, 10, 500).astype(float), "line": rng.integers(0, 6, 500)})
+    frame.loc[rng.random(500) < 0.1, "score"] = NAN
+    expected = frame.groupby("line")["score"].rank(ascending=False, method="min").to_numpy()
+    np.testing.assert_array_equal(rank_desc(frame["score"].to_numpy(), groups=frame["line"].to_numpy())[:, 0], expected)
+
+def test_score_profiles_hand_checked():
+    result = score_profiles(VALUES, weight_matrix(PROFILES, COLUMNS), lines=LINES)
+    np.testing.assert_array_equal(result.ranks, [[2, 1], [2, 3], [1, NAN], [NAN, NAN], [2, 1]])
+    np.testing.assert_array_equal(result.line_ranks, [[1, 1], [1, 2], [1, NAN], [NAN, NAN], [NAN, NAN]])
@@ -0,0 +1,74 @@
+import copy
+
+import numpy as np
+import pytest
+
+from common.scoring_config import compile_config, load_config
+
+RAW = {
+    "header_row": 2,
+    "name_column": "GPU명",
+    "line_value_column": "게임",
+    "lines": ["상위", "하위"],
+    "columns": {"0": "GPU명", "1": "게임_4K", "2": "게임_FHD", "3": "가격"},
+    "tiers": {"선택_게임": {"상위": "게임_4K", "하위": "게임_FHD"}},
+    "features": {"normalize": ["선택_게임", "가격"], "invert": ["가격"]},
+    "profiles": {"종합": {"선택_게임": 0.8, "가격": -0.2}, "순수": {"선택_게임": 0.6}},
+    "min_weight": 0.5,
+}
+
+def raw_with(**changes):
+    raw = copy.deepcopy(RAW)
+    for path, value in changes.items():
+        *parents, key = path.split("__")
+        node = raw
+        for parent in parents:
+            node = node[parent]
+        node[key] = value
+    return raw
+
+def test_compile_valid_config():
+    config = compile_config("gpu", RAW)
+    assert config.columns == {0: "GPU명", 1: "게임_4K", 2: "게임_FHD", 3: "가격"}
+    assert config.score_columns == ["선택_게임_norm", "가격_반전_norm"]
+    np.testing.assert_array_equal(config.weights, [[0.8, -0.2], [0.6, 0.0]])
+    assert config.tiers[0].columns == ["게임_4K", "게임_FHD"] and config.tiers[0].index.tolist() == [0, 1]
+    assert config.na_rank == "keep"
+
+@pytest.mark.parametrize("part", ["cpu", "gpu"])
+def test_shipped_config_compiles(part):
+    assert load_config(part).part == part
+
+@pytest.mark.parametrize("changes, message", [
+    ({"features__normalize": ["선택_게임", "가겪"]}, "features.normalize"),
+    ({"features__invert": ["게임_4K"]}, "features.invert"),
+    ({"profiles__순수": {"선택_겜": 0.6}}, "profiles.순수"),
+    ({"tiers__선택_게임": {"상위": "게임_8K"}}, "tiers.선택_게임"),
+    ({"tiers__선택_게임": {"최상위": "게임_4K"}}, "tiers.선택_게임"),
+])
+def test_unknown_columns_are_rejected(changes, message):
+    with pytest.raises(ValueError, match=message):
+        compile_config("gpu", raw_with(**changes))
+
+@pytest.mark.parametrize("weights", [
+    {"선택_게임": 0.8, "가격": -0.3},   # |합| 1.1
+    {"선택_게임": 0.3, "가격": 0.1},    # min_weight 미만
+    {},
+])
+def test_weight_sums_are_checked(weights):
+    with pytest.raises(ValueError, match="profiles.종합"):
+        compile_config("gpu", raw_with(profiles__종합=weights))
+
+def test_weight_sum_allows_float_noise():
+    weights = {"선택_게임": 0.7, "가격": 0.1 + 0.2}  # 1.0000000000000000x
+    assert compile_config("gpu", raw_with(profiles__종합=weights)).weights.shape == (2, 2)
+
+def test_empty_tier_is_rejected():
+    with pytest.raises(ValueError, match="tiers.선택_게임"):
+        compile_config("gpu", raw_with(tiers__선택_게임={}))
+
+def test_invalid_options_are_rejected():
+    with pytest.raises(ValueError, match="scaler"):
+        compile_config("gpu", raw_with(features__scaler="robust"))
+    with pytest.raises(ValueError, match="na_rank"):
+        compile_config("gpu", raw_with(na_rank="999"))
@@ -0,0 +1,81 @@
+import sqlite3
+
+import numpy as np
+import pytest
+
+from common.db import sync_table
+from common.snapshot import Snapshot, diff_rows, row_hashes
+
+CREATE = "CREATE TABLE IF NOT EXISTS parts (name VARCHAR(255) PRIMARY KEY, score DOUBLE, rank_no INT)"
+ROWS = [("a", 0.3, 1), ("b", 0.2, 2), ("c", 0.1, 3)]
+
+@pytest.fixture
+def snapshot_env(tmp_path, monkeypatch):
+    monkeypatch.setenv("COMHERE_DB_BACKEND", "sqlite")
+    monkeypatch.setenv("COMHERE_DB_SQLITE_PATH", str(tmp_path / "test.db"))
+    return str(tmp_path / "snapshots")
+
+def make_snapshot(snapshot_dir, columns=("name", "score", "rank_no")):
+    return Snapshot("default", "parts", "name", list(columns), snapshot_dir=snapshot_dir)
+
+# ─── diff_rows ─────────────────────────────────────────────────────
+def test_same_rows_have_no_diff():
+    changes = diff_rows(list(ROWS), row_hashes(ROWS))
+    assert changes == ([], [], [])
+
+def test_float_repr_changes_are_updates():
+    # 0.1 + 0.2 != 0.3 (repr 0.30000000000000004), 한 ulp 차이도 변경으로 봄
+    rows = [("a", 0.1 + 0.2, 1), ("b", np.nextafter(0.2, 1), 2), ("c", 0.1, 3)]
+    changes = diff_rows(rows, row_hashes(ROWS))
+    assert [row[0] for row in changes.updated] == ["a", "b"]
+    assert changes.inserted == [] and changes.deleted == []
+
+def test_numpy_and_python_floats_hash_alike():
+    rows = [("a", np.float64(0.3), np.int64(1)), ("b", 0.2, 2), ("c", 0.1, 3)]
+    assert diff_rows(rows, row_hashes(ROWS)).updated == []
+
+def test_inserted_and_deleted_keys():
+    rows = [("a", 0.3, 1), ("d", 0.4, 4)]
+    changes = diff_rows(rows, row_hashes(ROWS))
+    assert changes.inserted == [("d", 0.4, 4)]
+    assert changes.updated == []
+    assert sorted(changes.deleted) == ["b", "c"]
+
+def test_duplicate_keys_use_last_row():
+    hashes = row_hashes([("a", 1.0, 1), ("a", 0.3, 1)])
+    assert list(hashes.index) == ["a"]
+    assert diff_rows([("a", 0.3, 1)], hashes).updated == []
+
+# ─── 스냅샷 저장 / 형제 무효화 ─────────────────────────────────────
+def test_save_and_load_round_trip(snapshot_env):
+    snapshot = make_snapshot(snapshot_env)
+    assert snapshot.diff(ROWS) is None
+    snapshot.save(ROWS)
+    assert snapshot.load().equals(row_hashes(ROWS))
+    assert snapshot.diff(ROWS) == ([], [], [])
+
+def test_invalidate_siblings_by_key(snapshot_env):
+    snapshot, sibling = make_snapshot(snapshot_env), make_snapshot(snapshot_env, ("name", "rank_no"))
+    snapshot.save(ROWS)
+    sibling.save([(name, rank) for name, _, rank in ROWS])
+    assert snapshot.siblings() == [sibling.path]
+
+    snapshot.invalidate_siblings(["b"])
+    assert sorted(sibling.load().index) == ["a", "c"]
+    assert sorted(snapshot.load().index) == ["a", "b", "c"]
+
+def test_full_reload_drops_sibling_snapshots(snapshot_env):
+    connection = sqlite3.connect(":memory:")
+    snapshot, sibling = make_snapshot(snapshot_env), make_snapshot(snapshot_env, ("name", "rank_no"))
+    sibling.save([(name, rank) for name, _, rank in ROWS])
+
+    sync_table(connection, "parts", CREATE, "name", ["name", "score", "rank_no"], ROWS, snapshot, incremental=True)
+    assert sibling.load() is None
+    assert snapshot.load() is not None
+
+    # 증분 반영에서는 추가/삭제된 키만 형제 스냅샷에서 빠짐
+    sibling.save([(name, rank) for name, _, rank in ROWS])
+    rows = [("a", 0.5, 1), ("b", 0.2, 2), ("d", 0.4, 3)]
+    sync_table(connection, "parts", CREATE, "name", ["name", "score", "rank_no"], rows, snapshot, incremental=True)
+    assert sorted(sibling.load().index) == ["a", "b"]
+    connection.close()